@@ -5,9 +5,12 @@
 
 from cartopy import config
 
+import spcartopy.animation
 import spcartopy.colors
 import spcartopy.feature
 import spcartopy.hatch
 import spcartopy.legends
+import spcartopy.stats
+import spcartopy.tiles
 
 __version__ = '1.5.2'
@@ -0,0 +1,72 @@
+# Copyright (c) 2025 Nathan Wendt.
+# Distributed under the terms of the BSD 3-Clause License.
+# SPDX-License-Identifier: BSD-3-Clause
+"""Animated loops of SPC products."""
+
+from matplotlib.animation import FuncAnimation
+
+
+class SPCAnimation(FuncAnimation):
+    """Animate SPC features on a single, reused map.
+
+    The figure, axes and any base map features already added to the axes are
+    created once. Each frame only swaps the SPC artists, which are drawn as one
+    pre-styled collection per feature (see ``path_collection`` on the
+    `spcartopy.feature` classes). With blitting, the base map is rendered a
+    single time and reused as the background of every frame.
+
+    Frames are created lazily from ``frames`` and are not cached, so long loops
+    can be written with `SPCAnimation.save` to streaming writers (e.g.,
+    ``'ffmpeg'`` or ``'imagemagick'``) without holding every frame in memory.
+
+    Parameters
+    ----------
+    ax : `cartopy.mpl.geoaxes.GeoAxes`
+        Axes with the base map already drawn.
+    frames : iterable
+        Each item is a feature, or a sequence of features, to show in a frame.
+        A generator can be used to create features only when they are needed.
+    label : callable, optional
+        Function called with the features of a frame that returns a string shown
+        in the upper left corner of the map, e.g., the outlook valid time.
+    blit : bool
+        Whether to use blitting. Defaults to True.
+    kwargs
+        Additional keyword arguments passed to `matplotlib.animation.FuncAnimation`
+        (e.g., ``interval`` or ``save_count``).
+    """
+
+    def __init__(self, ax, frames, label=None, blit=True, **kwargs):
+        self.ax = ax
+        self.label = label
+        self._spc_artists = []
+        self._label_text = ax.text(0.01, 0.99, '', transform=ax.transAxes, ha='left',
+                                   va='top', zorder=10, animated=blit)
+        kwargs.setdefault('cache_frame_data', False)
+        super().__init__(ax.figure, self._draw_spc_frame, frames=frames,
+                         init_func=self._init_spc_frame, blit=blit, **kwargs)
+
+    def _init_spc_frame(self):
+        """Clear the SPC artists, leaving only the base map."""
+        for artist in self._spc_artists:
+            artist.remove()
+        self._spc_artists = []
+        self._label_text.set_text('')
+
+        return [self._label_text]
+
+    def _draw_spc_frame(self, features):
+        """Replace the SPC artists with those of the next frame."""
+        self._init_spc_frame()
+        if not isinstance(features, (list, tuple)):
+            features = (features,)
+
+        for feature in features:
+            collection = feature.path_collection(self.ax.projection)
+            collection.set_animated(self._blit)
+            self._spc_artists.append(self.ax.add_collection(collection, autolim=False))
+
+        if self.label is not None:
+            self._label_text.set_text(self.label(features))
+
+        return [*self._spc_artists, self._label_text]
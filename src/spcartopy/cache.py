@@ -0,0 +1,117 @@
+# Copyright (c) 2025 Nathan Wendt.
+# Distributed under the terms of the BSD 3-Clause License.
+# SPDX-License-Identifier: BSD-3-Clause
+"""Thread-safe caches of parsed SPC products."""
+
+from concurrent.futures import Future
+import threading
+
+
+class SingleFlightCache:
+    """Thread-safe mapping that computes each missing value exactly once.
+
+    `SingleFlightCache.get_or_create` runs the factory of a missing key in the
+    first thread asking for it. Other threads asking for the same key meanwhile
+    wait for, and share, that result instead of parsing the product again. If
+    the factory raises, the waiting threads receive the same exception and the
+    key is left missing so a later call can try again. A value whose key is
+    invalidated while it is being computed is returned to the threads waiting
+    for it but not cached.
+
+    All state is guarded by a lock rather than relying on the global interpreter
+    lock, so the cache is also safe on free-threaded builds of CPython.
+    """
+
+    def __init__(self):
+        self._values = {}
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def get_or_create(self, key, factory):
+        """Get the value of a key, computing it with ``factory`` if it is missing.
+
+        Parameters
+        ----------
+        key : hashable
+            Key of the value.
+        factory : callable
+            Function without arguments returning the value.
+        """
+        with self._lock:
+            if key in self._values:
+                return self._values[key]
+            future = self._pending.get(key)
+            leader = future is None
+            if leader:
+                future = self._pending[key] = Future()
+
+        if not leader:
+            return future.result()
+
+        try:
+            value = factory()
+        except BaseException as error:
+            with self._lock:
+                if self._pending.get(key) is future:
+                    del self._pending[key]
+            future.set_exception(error)
+            raise
+
+        with self._lock:
+            # Keys invalidated meanwhile are no longer pending with this future.
+            if self._pending.get(key) is future:
+                self._values[key] = value
+                del self._pending[key]
+        future.set_result(value)
+
+        return value
+
+    def __contains__(self, key):
+        """Check if a value is cached for a key."""
+        with self._lock:
+            return key in self._values
+
+    def __getitem__(self, key):
+        """Get the cached value of a key."""
+        with self._lock:
+            return self._values[key]
+
+    def __setitem__(self, key, value):
+        """Cache a value for a key."""
+        with self._lock:
+            self._values[key] = value
+
+    def __len__(self):
+        """Return the number of cached values."""
+        with self._lock:
+            return len(self._values)
+
+    def invalidate(self, match):
+        """Remove the cached values of the keys matching a predicate.
+
+        Values of matching keys that are being computed are not cached once
+        computed.
+
+        Parameters
+        ----------
+        match : callable
+            Function of a key returning True if its value should be removed.
+
+        Returns
+        -------
+        int
+            Number of removed values.
+        """
+        with self._lock:
+            keys = [key for key in self._values if match(key)]
+            for key in keys:
+                del self._values[key]
+            for key in [key for key in self._pending if match(key)]:
+                del self._pending[key]
+
+        return len(keys)
+
+    def clear(self):
+        """Remove all cached values."""
+        with self._lock:
+            self._values.clear()
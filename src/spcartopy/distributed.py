@@ -0,0 +1,108 @@
+# Copyright (c) 2025 Nathan Wendt.
+# Distributed under the terms of the BSD 3-Clause License.
+# SPDX-License-Identifier: BSD-3-Clause
+"""Distribute per-outlook work with `concurrent.futures` or Dask."""
+
+
+def _outlook_task(feature_class, func, args):
+    """Build an outlook in a worker and apply ``func`` to it."""
+    feature = feature_class(**args) if isinstance(args, dict) else feature_class(*args)
+
+    return func(feature)
+
+
+def submit_outlooks(executor, feature_class, outlooks, func):
+    """Submit a task per outlook to an executor.
+
+    Only the outlook arguments are sent; each worker builds its outlook, reading
+    it from its own feature caches or an attached
+    `spcartopy.io.sharedcache.SharedGeometryCache`.
+
+    Parameters
+    ----------
+    executor : `concurrent.futures.Executor` or `dask.distributed.Client`
+        Executor with a ``submit`` method.
+    feature_class : type
+        Outlook feature class, e.g.,
+        `spcartopy.feature.Day1ConvectiveOutlookFeature`.
+    outlooks : iterable of tuple or dict
+        Positional (tuple) or keyword (dict) arguments used to create each
+        outlook with ``feature_class``, e.g., ``(1630, 2020, 4, 12, 'cat')``.
+    func : callable
+        Picklable function of an outlook feature returning the task result,
+        e.g., `spcartopy.stats.category_areas`.
+
+    Returns
+    -------
+    list of futures
+        Future of each outlook, in order.
+    """
+    return [executor.submit(_outlook_task, feature_class, func, args) for args in outlooks]
+
+
+def map_outlooks(executor, feature_class, outlooks, func):
+    """Apply a function to many outlooks with an executor.
+
+    See `submit_outlooks` for the parameters.
+
+    Returns
+    -------
+    list
+        Result of each outlook, in order.
+    """
+    return [future.result()
+            for future in submit_outlooks(executor, feature_class, outlooks, func)]
+
+
+def outlook_graph(feature_class, outlooks, func, name='spc-outlook', aggregate=None):
+    """Build a Dask task graph with a task per outlook.
+
+    The graph is a plain dictionary in the Dask graph specification, so
+    building it does not require Dask. Compute it with, e.g.,
+    ``dask.threaded.get(graph, keys)`` or ``client.get(graph, keys)``.
+
+    Parameters
+    ----------
+    feature_class, outlooks, func
+        See `submit_outlooks`.
+    name : str
+        Name of the tasks. Outlook ``i`` has the key ``(name, i)``.
+    aggregate : callable, optional
+        Function of the list of all outlook results, added as the task ``name``,
+        e.g., to build a climatology.
+
+    Returns
+    -------
+    graph : dict
+        Task graph.
+    keys : list
+        Keys of the outlook tasks, or ``[name]`` if ``aggregate`` is given.
+    """
+    graph = {(name, i): (_outlook_task, feature_class, func, args)
+             for i, args in enumerate(outlooks)}
+    keys = list(graph)
+    if aggregate is not None:
+        graph[name] = (aggregate, keys)
+        keys = [name]
+
+    return graph, keys
+
+
+def delayed_outlooks(feature_class, outlooks, func):
+    """Build a `dask.delayed` object per outlook.
+
+    Requires the dask package. See `submit_outlooks` for the parameters.
+
+    Returns
+    -------
+    list of `dask.delayed.Delayed`
+        Delayed result of each outlook, in order.
+    """
+    try:
+        import dask
+    except ImportError:
+        raise ImportError('Delayed outlooks require the dask package.') from None
+
+    task = dask.delayed(_outlook_task, pure=True)
+
+    return [task(feature_class, func, args) for args in outlooks]
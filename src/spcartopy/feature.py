@@ -8,23 +8,170 @@ import re
 
 import cartopy.crs
 from cartopy.feature import Feature
-from cartopy.io.shapereader import FionaReader
+from cartopy.mpl.path import shapely_to_path
+from matplotlib.collections import PathCollection
 
+from spcartopy.cache import SingleFlightCache
+import spcartopy.io.segments as segments
 import spcartopy.io.shapereader as shapereader
 import spcartopy.io.textreader as textreader
+import spcartopy.stats as stats
 
-_SPC_GEOM_CACHE = {}
-_SPC_RECORD_CACHE = {}
+_SPC_GEOM_CACHE = SingleFlightCache()
+_SPC_RECORD_CACHE = SingleFlightCache()
+_SPC_PATH_CACHE = SingleFlightCache()
+_SPC_SHARED_CACHE = None
 _SPC_SHP_CRS = cartopy.crs.PlateCarree()
 
+# Significant severe areas are drawn separately from hail, wind and tornado outlooks.
+_SIGN_FILTER = shapereader.RecordFilter(exclude={'LABEL': 'SIGN'})
 
-class ConvectiveOutlookFeature(Feature):
+# Outlook attributes set from the records by ``_set_plot_properties``.
+_PLOT_PROPERTIES = ('facecolors', 'edgecolors', 'short_labels', 'long_labels')
+
+
+class _PathCollectionMixin:
+    """Draw all geometries of a feature as a single `PathCollection`."""
+
+    def path_collection(self, projection, **kwargs):
+        """Get all geometries as a single, pre-styled `PathCollection`.
+
+        The projected paths are cached so that only the collection itself is
+        created on repeated calls. Draw the feature as one artist with
+        ``ax.add_collection(feature.path_collection(ax.projection))``.
+
+        Parameters
+        ----------
+        projection : `cartopy.crs.Projection`
+            Projection of the axes the collection will be added to.
+        kwargs
+            Style keyword arguments overriding those of the feature.
+        """
+        def _project():
+            paths = []
+            indices = []
+            for i, geom in enumerate(self.geometries()):
+                projected = projection.project_geometry(geom, self.crs)
+                if not projected.is_empty:
+                    paths.append(shapely_to_path(projected))
+                    indices.append(i)
+            return tuple(paths), tuple(indices)
+
+        paths, indices = _SPC_PATH_CACHE.get_or_create((self._key, projection), _project)
+
+        style = dict(self.kwargs)
+        style.update(kwargs)
+        for prop in ('facecolor', 'edgecolor'):
+            if isinstance(style.get(prop), list):
+                style[prop] = [style[prop][i] for i in indices]
+
+        return PathCollection(paths, **style)
+
+
+class _OutlookStateMixin:
+    """Pickle outlooks lazily, reading their records only when first used."""
+
+    def __getstate__(self):
+        """Pickle only the product key, record filter and style.
+
+        Records are read again, from the worker's feature, shared or segment
+        caches, when the restored outlook is first used.
+        """
+        return {'key': self._product_key, 'record_filter': self.record_filter,
+                'style': self._style}
+
+    def __setstate__(self, state):
+        """Restore an outlook without reading its records."""
+        product, fday, ftime, year, month, day, hazard = state['key']
+        Feature.__init__(self, _SPC_SHP_CRS, **state['style'])
+        self.fday = fday
+        self.ftime = ftime
+        self.year = year
+        self.month = month
+        self.day = day
+        self.hazard = hazard
+        self.product = product
+        self.record_filter = state['record_filter']
+        self.timestamp = datetime(year, month, day)
+        self._style = dict(state['style'])
+
+    def __getattr__(self, name):
+        """Set the plot properties of a restored outlook when first used."""
+        if name not in _PLOT_PROPERTIES or '_style' not in self.__dict__:
+            raise AttributeError(f'{type(self).__name__!r} object has no attribute {name!r}')
+        self._set_plot_properties(self.records())
+
+        return self.__dict__[name]
+
+    @property
+    def kwargs(self):
+        """Plotting keyword arguments, including the colors of the records."""
+        if 'facecolors' not in self.__dict__:
+            self._set_plot_properties(self.records())
+        return dict(self._kwargs)
+
+
+class _OutlookStatsMixin:
+    """Compute statistics of the outlook categories."""
+
+    def category_areas(self, crs=stats.EQUAL_AREA_CRS):
+        """Area of each outlook category in square kilometers.
+
+        See `spcartopy.stats.category_areas`.
+        """
+        return stats.category_areas(self, crs)
+
+    def category_exposure(self, weights, x, y, weights_crs=None):
+        """Sum of a weight raster over each outlook category.
+
+        See `spcartopy.stats.category_exposure`.
+        """
+        return stats.category_exposure(self, weights, x, y, weights_crs)
+
+
+def invalidate_product(key):
+    """Drop a product from the feature caches, e.g., after it was reissued.
+
+    Cached records, geometries, projected paths and equal-area geometries of
+    every feature of the product are removed, as is the product in the segment
+    archive and the attached shared geometry cache in use. Other products stay
+    cached.
+
+    Parameters
+    ----------
+    key : tuple
+        Key identifying the product, i.e., ``(product, fday, ftime, year, month,
+        day, hazard)`` for outlooks or ``('md', year, number)`` for MDs.
+    """
+    prefix = tuple(key[1:]) if key[0] == 'md' else tuple(key)
+
+    def _match(cache_key):
+        return cache_key[:len(prefix)] == prefix
+
+    def _match_feature(cache_key):
+        return _match(cache_key[0])
+
+    _SPC_RECORD_CACHE.invalidate(_match)
+    _SPC_GEOM_CACHE.invalidate(_match)
+    _SPC_PATH_CACHE.invalidate(_match_feature)
+    stats._SPC_EQUAL_AREA_CACHE.invalidate(_match_feature)
+    if segments._SPC_ARCHIVE is not None:
+        segments._SPC_ARCHIVE.discard(key)
+    if _SPC_SHARED_CACHE is not None:
+        _SPC_SHARED_CACHE.invalidate(_match)
+
+
+class ConvectiveOutlookFeature(_OutlookStateMixin, _OutlookStatsMixin, _PathCollectionMixin,
+                               Feature):
     """An interface to SPC Convective Outlook geoJSON files.
 
+    Records can be selected with a `spcartopy.io.shapereader.RecordFilter` passed
+    as ``record_filter``.
+
     See https://www.spc.noaa.gov/products/outlook.
     """
 
-    def __init__(self, fday, ftime, year, month, day, hazard, **kwargs):
+    def __init__(self, fday, ftime, year, month, day, hazard, record_filter=None, **kwargs):
         super().__init__(_SPC_SHP_CRS, **kwargs)
         self.fday = fday
         self.ftime = ftime
@@ -33,9 +180,24 @@ class ConvectiveOutlookFeature(Feature):
         self.day = day
         self.hazard = hazard
         self.product = 'convective_outlook'
+        if record_filter is None and hazard in ['hail', 'wind', 'torn']:
+            record_filter = _SIGN_FILTER
+        self.record_filter = record_filter
         self.timestamp = datetime(self.year, self.month, self.day)
+        self._style = dict(kwargs)
         self._set_plot_properties(self.records())
 
+    @property
+    def _product_key(self):
+        """Key identifying the outlook product in the archive."""
+        return (self.product, self.fday, self.ftime, self.year, self.month, self.day,
+                self.hazard)
+
+    @property
+    def _key(self):
+        """Key identifying this outlook in the feature caches."""
+        return (*self._product_key, self.record_filter)
+
     def _set_plot_properties(self, records):
         """Set basic cartopy plotting keyword arguments for `ConvectiveOutlookFeature`."""
         self.facecolors = []
@@ -57,62 +219,46 @@ class ConvectiveOutlookFeature(Feature):
 
         self._kwargs['edgecolor'] = self._kwargs.get('edgecolor', self.edgecolors)
 
+    def _record_table(self):
+        """Read the (filtered) `SPCRecordTable` of the outlook."""
+        return _SPC_RECORD_CACHE.get_or_create(self._key, self._read_record_table)
+
+    def _path(self):
+        """Return the path of the product file, downloading it if needed."""
+        return shapereader.spc_convective(self.fday, self.ftime, self.year, self.month,
+                                          self.day, self.hazard, self.product)
+
+    def _read_record_table(self):
+        """Read the record table from the shared cache, archive or file."""
+        if _SPC_SHARED_CACHE is not None and self._key in _SPC_SHARED_CACHE:
+            return _SPC_SHARED_CACHE.record_table(self._key)
+
+        table = segments.read_product(self._product_key, self._path)
+        if self.record_filter is not None:
+            table = table.filter(self.record_filter)
+
+        return table
+
     def records(self):
         """Parse records from SPC geoJSONs."""
-        key = (self.product, self.fday, self.ftime, self.year, self.month, self.day,
-               self.hazard)
-        if key not in _SPC_RECORD_CACHE:
-            path = shapereader.spc_convective(fday=self.fday,
-                                    ftime=self.ftime,
-                                    year=self.year,
-                                    month=self.month,
-                                    day=self.day,
-                                    hazard=self.hazard,
-                                    product=self.product)
-            if self.hazard in ['hail', 'wind', 'torn']:
-                records = tuple(
-                    shapereader.SPCReader(path).records(filter_keys={'LABEL': 'SIGN'})
-                )
-            else:
-                records = tuple(shapereader.SPCReader(path).records())
-            _SPC_RECORD_CACHE[key] = records
-        else:
-            records = _SPC_RECORD_CACHE[key]
-
-        return iter(records)
+        return iter(self._record_table())
 
     def geometries(self):
         """Parse geometries from SPC convective geoJSONs."""
-        key = (self.product, self.fday, self.ftime, self.year, self.month, self.day,
-               self.hazard)
-        if key not in _SPC_GEOM_CACHE:
-            path = shapereader.spc_convective(fday=self.fday,
-                                    ftime=self.ftime,
-                                    year=self.year,
-                                    month=self.month,
-                                    day=self.day,
-                                    hazard=self.hazard,
-                                    product=self.product)
-            if self.hazard in ['hail', 'wind', 'torn']:
-                geometries = tuple(shapereader.SPCReader(path).geometries(
-                    filter_keys={'LABEL': 'SIGN'})
-                )
-            else:
-                geometries = tuple(shapereader.SPCReader(path).geometries())
-            _SPC_GEOM_CACHE[key] = geometries
-        else:
-            geometries = _SPC_GEOM_CACHE[key]
+        return self._record_table().geometries()
 
-        return iter(geometries)
 
-
-class FireOutlookFeature(Feature):
+class FireOutlookFeature(_OutlookStateMixin, _OutlookStatsMixin, _PathCollectionMixin,
+                         Feature):
     """An interface to SPC Fire Weather Outlook geoJSON files.
 
+    Records can be selected with a `spcartopy.io.shapereader.RecordFilter` passed
+    as ``record_filter``.
+
     See https://www.spc.noaa.gov/products/fire_wx.
     """
 
-    def __init__(self, fday, ftime, year, month, day, hazard, **kwargs):
+    def __init__(self, fday, ftime, year, month, day, hazard, record_filter=None, **kwargs):
         super().__init__(_SPC_SHP_CRS, **kwargs)
         self.fday = fday
         self.ftime = ftime
@@ -121,9 +267,22 @@ class FireOutlookFeature(Feature):
         self.day = day
         self.hazard = hazard
         self.product = 'fire_outlook'
+        self.record_filter = record_filter
         self.timestamp = datetime(self.year, self.month, self.day)
+        self._style = dict(kwargs)
         self._set_plot_properties(self.records())
 
+    @property
+    def _product_key(self):
+        """Key identifying the outlook product in the archive."""
+        return (self.product, self.fday, self.ftime, self.year, self.month, self.day,
+                self.hazard)
+
+    @property
+    def _key(self):
+        """Key identifying this outlook in the feature caches."""
+        return (*self._product_key, self.record_filter)
+
     def _set_plot_properties(self, records):
         """Set basic cartopy plotting keyword arguments for `FireOutlookFeature`."""
         self.facecolors = []
@@ -145,48 +304,36 @@ class FireOutlookFeature(Feature):
         self._kwargs['facecolor'] = self._kwargs.get('facecolor', self.facecolors)
         self._kwargs['edgecolor'] = self._kwargs.get('edgecolor', self.edgecolors)
 
+    def _record_table(self):
+        """Read the (filtered) `SPCRecordTable` of the outlook."""
+        return _SPC_RECORD_CACHE.get_or_create(self._key, self._read_record_table)
+
+    def _path(self):
+        """Return the path of the product file, downloading it if needed."""
+        return shapereader.spc_fire(self.fday, self.ftime, self.year, self.month, self.day,
+                                    self.hazard, self.product)
+
+    def _read_record_table(self):
+        """Read the record table from the shared cache, archive or file."""
+        if _SPC_SHARED_CACHE is not None and self._key in _SPC_SHARED_CACHE:
+            return _SPC_SHARED_CACHE.record_table(self._key)
+
+        table = segments.read_product(self._product_key, self._path)
+        if self.record_filter is not None:
+            table = table.filter(self.record_filter)
+
+        return table
+
     def records(self):
         """Parse records from SPC fire geoJSONs."""
-        key = (self.product, self.fday, self.ftime, self.year, self.month, self.day,
-               self.hazard)
-        if key not in _SPC_RECORD_CACHE:
-            path = shapereader.spc_fire(fday=self.fday,
-                                    ftime=self.ftime,
-                                    year=self.year,
-                                    month=self.month,
-                                    day=self.day,
-                                    hazard=self.hazard,
-                                    product=self.product)
-
-            records = tuple(shapereader.SPCReader(path).records())
-            _SPC_RECORD_CACHE[key] = records
-        else:
-            records = _SPC_RECORD_CACHE[key]
-
-        return iter(records)
+        return iter(self._record_table())
 
     def geometries(self):
         """Parse geometries from SPC fire geoJSONs."""
-        key = (self.product, self.fday, self.ftime, self.year, self.month, self.day,
-               self.hazard)
-        if key not in _SPC_GEOM_CACHE:
-            path = shapereader.spc_fire(fday=self.fday,
-                                    ftime=self.ftime,
-                                    year=self.year,
-                                    month=self.month,
-                                    day=self.day,
-                                    hazard=self.hazard,
-                                    product=self.product)
-
-            geometries = tuple(shapereader.SPCReader(path).geometries())
-            _SPC_GEOM_CACHE[key] = geometries
-        else:
-            geometries = _SPC_GEOM_CACHE[key]
-
-        return iter(geometries)
+        return self._record_table().geometries()
 
 
-class MDFeature(Feature):
+class MDFeature(_PathCollectionMixin, Feature):
     """MD Feature."""
 
     def __init__(self, year, number, **kwargs):
@@ -194,18 +341,26 @@ class MDFeature(Feature):
         self.year = year
         self.number = number
 
+    @property
+    def _key(self):
+        """Key identifying this MD in the feature caches."""
+        return (self.year, self.number)
+
     def geometries(self):
         """Parse geometries from SPC convective geoJSONs."""
-        key = (self.year, self.number)
-        geometries = []
-        if key not in _SPC_GEOM_CACHE:
-            path = textreader.spc_md(year=self.year, number=self.number)
-            geometries = tuple(FionaReader(path).geometries())
-            _SPC_GEOM_CACHE[key] = geometries
-        else:
-            geometries = _SPC_GEOM_CACHE[key]
+        return iter(_SPC_GEOM_CACHE.get_or_create(self._key, self._read_geometries))
+
+    def _path(self):
+        """Return the path of the MD file, downloading it if needed."""
+        return textreader.spc_md(self.year, self.number)
+
+    def _read_geometries(self):
+        """Read the geometries from the shared cache, archive or file."""
+        key = self._key
+        if _SPC_SHARED_CACHE is not None and key in _SPC_SHARED_CACHE:
+            return tuple(_SPC_SHARED_CACHE.record_table(key).geometries())
 
-        return iter(geometries)
+        return tuple(segments.read_product(('md', *key), self._path).geometries())
 
 
 class Day1ConvectiveOutlookFeature(ConvectiveOutlookFeature):
@@ -5,6 +5,9 @@
 
 import matplotlib.hatch
 from matplotlib.patches import Polygon
+import numpy as np
+
+from spcartopy.cache import SingleFlightCache
 
 
 class SPCHatch(matplotlib.hatch.Shapes):
@@ -12,17 +15,58 @@ class SPCHatch(matplotlib.hatch.Shapes):
 
     Create hatching that appears with SPC probabalistic forecasts denoting significant
     tornadoes, wind, or hail.
+
+    Hatch vertices are generated once per number of rows (i.e., per hatch pattern
+    and density) and cached, so building a hatch path only copies the cached
+    arrays.
     """
 
     filled = True
     size = 1.0
     path = Polygon([[0, 0], [0.4, 0.4]], closed=True, fill=False).get_path()
 
+    _vertex_cache = SingleFlightCache()
+
     def __init__(self, hatch, density):
         self.num_rows = (hatch.count('S')) * density
         self.shape_vertices = self.path.vertices
         self.shape_codes = self.path.codes
         matplotlib.hatch.Shapes.__init__(self, hatch, density)
 
+    @classmethod
+    def _shape_grid(cls, num_rows):
+        """Generate the vertices and codes of all hatch shapes at once."""
+        offset = 1.0 / num_rows
+        shape_vertices = cls.path.vertices * offset * cls.size
+
+        # Even rows have num_rows + 1 shapes and odd rows num_rows, staggered
+        # by half a column.
+        rows = np.arange(num_rows + 1)
+        positions = []
+        for row in rows:
+            if row % 2 == 0:
+                cols = np.linspace(0, 1, num_rows + 1)
+            else:
+                cols = np.linspace(offset / 2, 1 - offset / 2, num_rows)
+            positions.append(np.column_stack([cols, np.full_like(cols, row * offset)]))
+        positions = np.concatenate(positions)
+
+        vertices = (shape_vertices[np.newaxis, :, :]
+                    + positions[:, np.newaxis, :]).reshape(-1, 2)
+        codes = np.tile(cls.path.codes, len(positions))
+        vertices.flags.writeable = False
+        codes.flags.writeable = False
+
+        return vertices, codes
+
+    def set_vertices_and_codes(self, vertices, codes):
+        """Fill hatch vertices and codes from the cache."""
+        cached_vertices, cached_codes = self._vertex_cache.get_or_create(
+            self.num_rows, lambda: self._shape_grid(self.num_rows)
+        )
+
+        vertices[:] = cached_vertices
+        codes[:] = cached_codes
+
 
 matplotlib.hatch._hatch_types.append(SPCHatch)
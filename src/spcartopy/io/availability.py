@@ -0,0 +1,140 @@
+# Copyright (c) 2025 Nathan Wendt.
+# Distributed under the terms of the BSD 3-Clause License.
+# SPDX-License-Identifier: BSD-3-Clause
+"""Negative cache of SPC products that are known to be unavailable."""
+
+from datetime import date, datetime, timezone
+import json
+from pathlib import Path
+import threading
+import time
+from urllib.error import HTTPError
+
+from cartopy import config
+
+# Statuses recorded as a missing product.
+MISSING_STATUSES = frozenset({404, 410})
+
+_SPC_AVAILABILITY = {}
+_SPC_AVAILABILITY_LOCK = threading.Lock()
+
+
+class ProductUnavailableError(HTTPError):
+    """A product is known to be missing, so it was not requested."""
+
+
+def _product_date(format_dict):
+    """Return the issuance date of a product from its downloader ``format_dict``."""
+    if 'day' in format_dict:
+        return date(format_dict['year'], format_dict['month'], format_dict['day'])
+
+    # MDs are only identified by year and number.
+    return date(format_dict['year'], 12, 31)
+
+
+class AvailabilityIndex:
+    """Persisted index of SPC products that do not exist.
+
+    Requests that fail with a status in ``MISSING_STATUSES`` are recorded in an
+    append-only JSON lines file. Products issued on past days are recorded
+    permanently; those issued today (UTC) or later expire after ``ttl`` seconds,
+    since they may still be issued. Downloaders consult the index before any
+    network request, so bulk jobs skip known gaps immediately.
+
+    Parameters
+    ----------
+    path : str or `pathlib.Path`
+        Path of the index file.
+    ttl : float
+        Seconds after which a missing product issued today may be requested again.
+    """
+
+    def __init__(self, path, ttl=900):
+        self.path = Path(path)
+        self.ttl = ttl
+        self._missing = {}
+        self._lock = threading.Lock()
+
+        if self.path.exists():
+            with open(self.path, encoding='utf-8') as fh:
+                for line in fh:
+                    entry = json.loads(line)
+                    self._missing[entry['url']] = entry['expires']
+
+    def __contains__(self, url):
+        """Check if a product URL is known to be missing."""
+        with self._lock:
+            if url not in self._missing:
+                return False
+            expires = self._missing[url]
+            if expires is not None and expires <= time.time():
+                del self._missing[url]
+                return False
+
+        return True
+
+    def __len__(self):
+        """Return the number of products recorded as missing."""
+        return len(self._missing)
+
+    def add(self, url, issued):
+        """Record a product as missing.
+
+        Parameters
+        ----------
+        url : str
+            URL of the product.
+        issued : `datetime.date`
+            Issuance date of the product, which determines whether the entry
+            expires.
+        """
+        today = datetime.now(timezone.utc).date()
+        expires = None if issued < today else time.time() + self.ttl
+
+        with self._lock:
+            self._missing[url] = expires
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as fh:
+                fh.write(json.dumps({'url': url, 'expires': expires}) + '\n')
+
+    def fetch(self, url, format_dict, urlopen):
+        """Request a product unless it is known to be missing.
+
+        Parameters
+        ----------
+        url : str
+            URL of the product.
+        format_dict : dict
+            Downloader ``format_dict`` of the product.
+        urlopen : callable
+            Function used to request ``url``.
+
+        Raises
+        ------
+        `ProductUnavailableError`
+            If the product is known to be missing.
+        """
+        if url in self:
+            raise ProductUnavailableError(url, 404, 'Known to be unavailable', None, None)
+
+        try:
+            return urlopen(url)
+        except HTTPError as error:
+            if error.code in MISSING_STATUSES:
+                self.add(url, _product_date(format_dict))
+            raise
+
+
+def availability_index(format_dict):
+    """Get the availability index in the data directory of a ``format_dict``.
+
+    Indexes are stored in ``{config[data_dir]}/geoJSON/SPC/availability.jsonl``
+    and shared by all downloaders of the process.
+    """
+    data_dir = format_dict.get('config', {}).get('data_dir', config['data_dir'])
+    path = Path(data_dir) / 'geoJSON' / 'SPC' / 'availability.jsonl'
+    with _SPC_AVAILABILITY_LOCK:
+        if path not in _SPC_AVAILABILITY:
+            _SPC_AVAILABILITY[path] = AvailabilityIndex(path)
+
+    return _SPC_AVAILABILITY[path]
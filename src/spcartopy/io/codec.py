@@ -0,0 +1,108 @@
+# Copyright (c) 2025 Nathan Wendt.
+# Distributed under the terms of the BSD 3-Clause License.
+# SPDX-License-Identifier: BSD-3-Clause
+"""Compact, quantized encoding of SPC geometries."""
+
+import numpy as np
+import shapely
+
+# SPC vertices have a precision of 0.01 degrees (see `decode_coords`).
+SPC_SCALE = 100
+
+
+def quantize_coords(coords, scale=SPC_SCALE):
+    """Quantize coordinates to integers and delta encode them.
+
+    Parameters
+    ----------
+    coords : array_like
+        Coordinates with shape ``(n, 2)``.
+    scale : int
+        Number of quantization steps per coordinate unit. The default keeps the
+        0.01 degree precision of SPC products; other coordinates are rounded.
+
+    Returns
+    -------
+    `numpy.ndarray`
+        Differences between consecutive quantized coordinates (the first
+        coordinate is kept as is). The type is ``int16`` if all differences fit,
+        otherwise ``int32``.
+    """
+    quantized = np.rint(np.asarray(coords, dtype=np.float64) * scale).astype(np.int64)
+    deltas = np.diff(quantized, axis=0, prepend=np.zeros((1, quantized.shape[1]),
+                                                         dtype=np.int64))
+    small = deltas.size == 0 or np.abs(deltas).max() <= np.iinfo(np.int16).max
+
+    return deltas.astype(np.int16 if small else np.int32)
+
+
+def dequantize_coords(deltas, scale=SPC_SCALE):
+    """Decode coordinates encoded with `quantize_coords`.
+
+    Returns
+    -------
+    `numpy.ndarray`
+        ``float64`` coordinates with shape ``(n, 2)``.
+    """
+    return np.cumsum(deltas, axis=0, dtype=np.int64) / scale
+
+
+def encode_geometries(geometries, scale=SPC_SCALE):
+    """Encode geometries as (quantized) coordinates and ring and part offsets.
+
+    Quantizing rounds every vertex to the nearest multiple of ``1 / scale``.
+    This is lossless for vertices decoded from SPC products, but moves others,
+    e.g., those of PTS lines closed against their domain or of clipped areas.
+    Geometries that rounding would make invalid are refused.
+
+    Parameters
+    ----------
+    geometries : array_like of shapely geometries
+        Geometries of one type. Polygons and multipolygons may be mixed, in
+        which case all are decoded as multipolygons.
+    scale : int or None
+        See `quantize_coords`. If None, the coordinates are kept as ``float64``.
+
+    Returns
+    -------
+    dict
+        ``type`` (`shapely.GeometryType`), ``coords`` (delta encoded if
+        quantized), the ``offsets`` of `shapely.to_ragged_array` (as ``int32``
+        if quantized), and ``scale``.
+
+    Raises
+    ------
+    ValueError
+        If the geometries cannot be stored as ragged arrays (e.g., of mixed
+        types) or quantizing makes any of them invalid.
+    """
+    geometries = np.asarray(geometries, dtype=object)
+    geom_type, coords, offsets = shapely.to_ragged_array(geometries)
+    if scale is None:
+        return {'type': geom_type, 'coords': coords, 'offsets': offsets, 'scale': None}
+
+    deltas = quantize_coords(coords, scale)
+    offsets = tuple(offset.astype(np.int32) for offset in offsets)
+    rounded = shapely.from_ragged_array(geom_type, dequantize_coords(deltas, scale), offsets)
+    if np.any(shapely.is_valid(geometries) & ~shapely.is_valid(rounded)):
+        raise ValueError('Quantized coordinates would make geometries invalid.')
+
+    return {'type': geom_type, 'coords': deltas, 'offsets': offsets, 'scale': scale}
+
+
+def decode_geometries(encoded):
+    """Decode geometries encoded with `encode_geometries`.
+
+    Arrays that need no conversion are used without copying, so they can be
+    views of memory-mapped files.
+
+    Returns
+    -------
+    `numpy.ndarray` of shapely geometries
+    """
+    coords = encoded['coords']
+    if encoded['scale'] is not None:
+        coords = dequantize_coords(coords, encoded['scale'])
+    offsets = tuple(offset.astype(np.int64, copy=False) for offset in encoded['offsets'])
+
+    return shapely.from_ragged_array(encoded['type'], coords, offsets)
@@ -0,0 +1,96 @@
+# Copyright (c) 2025 Nathan Wendt.
+# Distributed under the terms of the BSD 3-Clause License.
+# SPDX-License-Identifier: BSD-3-Clause
+"""Compression helpers for cached SPC products."""
+
+import gzip
+from pathlib import Path
+
+COMPRESSION_SUFFIXES = {
+    'gzip': '.gz',
+    'zstd': '.zst',
+}
+
+
+def compression_suffix(compression):
+    """Return the file suffix used for a compression method.
+
+    Parameters
+    ----------
+    compression : str or None
+        Compression method. One of ``None``, ``'gzip'`` or ``'zstd'``.
+
+    Returns
+    -------
+    str
+        File suffix (empty for no compression).
+    """
+    if compression is None:
+        return ''
+
+    try:
+        return COMPRESSION_SUFFIXES[compression]
+    except KeyError:
+        raise ValueError(
+            f'Unknown compression {compression!r}. Valid options are None, '
+            + ', '.join(repr(c) for c in COMPRESSION_SUFFIXES)
+        ) from None
+
+
+def infer_compression(path):
+    """Infer the compression method of a file from its suffix.
+
+    Parameters
+    ----------
+    path : str or `pathlib.Path`
+        Path to a file.
+
+    Returns
+    -------
+    str or None
+        Compression method, or None if the file is not compressed.
+    """
+    suffix = Path(path).suffix
+    for compression, comp_suffix in COMPRESSION_SUFFIXES.items():
+        if suffix == comp_suffix:
+            return compression
+
+    return None
+
+
+def open_product(path, mode='rb', compression='infer'):
+    """Open a (possibly compressed) cached product file.
+
+    Data are (de)compressed as they are streamed so that the full,
+    uncompressed product never has to exist on disk.
+
+    Parameters
+    ----------
+    path : str or `pathlib.Path`
+        Path to the product file.
+    mode : str
+        Binary file mode, ``'rb'`` or ``'wb'``.
+    compression : str or None
+        Compression method. The default, ``'infer'``, uses the file suffix.
+
+    Returns
+    -------
+    file object
+    """
+    if compression == 'infer':
+        compression = infer_compression(path)
+    else:
+        compression_suffix(compression)
+
+    if compression is None:
+        return open(path, mode)
+    elif compression == 'gzip':
+        return gzip.open(path, mode)
+    else:
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError(
+                'zstd compression requires the zstandard package.'
+            ) from None
+        return zstandard.open(path, mode)
@@ -3,7 +3,96 @@
 # SPDX-License-Identifier: BSD-3-Clause
 """Decoding tools."""
 
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
 import re
+import warnings
+
+import numpy as np
+import shapely
+import shapely.errors
+import shapely.ops
+
+from spcartopy.colors import Outlooks
+from spcartopy.io.compression import open_product
+
+# WMO abbreviated heading starting each product, e.g., ``ACUS11 KWNS 121830``.
+_WMO_HEADER = re.compile(rb'^[\x01\s]*[A-Z]{4}\d{2} [A-Z]{4} \d{6}')
+
+# Default area used to close open PTS lines (lon/lat bounds around CONUS).
+PTS_DOMAIN = (-130., 20., -60., 55.)
+
+# Hazard of each PTS section and the colors of its labels.
+_PTS_HAZARDS = {
+    'CATEGORICAL': ('cat', Outlooks.categorical),
+    'TORNADO': ('torn', Outlooks.tornado),
+    'HAIL': ('hail', Outlooks.hail),
+    'WIND': ('wind', Outlooks.wind),
+    'ANY SEVERE': ('prob', Outlooks.any_severe),
+}
+
+# DN and LABEL2 of the categorical labels as in the SPC geoJSONs.
+_PTS_CATEGORIES = {
+    'TSTM': (2, 'General Thunderstorms Risk'),
+    'MRGL': (3, 'Marginal Risk'),
+    'SLGT': (4, 'Slight Risk'),
+    'ENH': (5, 'Enhanced Risk'),
+    'MDT': (6, 'Moderate Risk'),
+    'HIGH': (8, 'High Risk'),
+}
+
+_PTS_HAZARD_NAMES = {'torn': 'Tornado', 'hail': 'Hail', 'wind': 'Wind', 'prob': 'Any Severe'}
+
+_PTS_SECTION = re.compile(r'^\s*\.\.\. (?P<name>[A-Z ]+?) \.\.\.\s*$(?P<body>.*?)^\s*&&',
+                          re.MULTILINE | re.DOTALL)
+_PTS_LINE = re.compile(r'(?P<label>\d\.\d\d|[A-Z]{3,4})\s+(?P<coords>(?:\d{8}\s*)+)')
+_PTS_VALID = re.compile(r'VALID TIME (?P<start>\d{6})Z - (?P<end>\d{6})Z')
+_PTS_DAY = re.compile(r'^PTSD(?:Y(?P<day>\d)|48)', re.MULTILINE)
+_WMO_TIME = re.compile(r'^[\x01\s]*[A-Z]{4}\d{2} [A-Z]{4} (?P<time>\d{6})', re.MULTILINE)
+_MONTHS = ('JAN', 'FEB', 'MAR', 'APR', 'MAY', 'JUN', 'JUL', 'AUG', 'SEP', 'OCT', 'NOV',
+           'DEC')
+
+# Local issuance time of a product, e.g., ``0130 PM CDT Sun Apr 12 2020``.
+_ISSUED = re.compile(r'^\s*\d{3,4} [AP]M [A-Z]{3,4} [A-Z]{3} (?P<month>[A-Z]{3}) +'
+                     r'(?P<day>\d{1,2}) (?P<year>\d{4})', re.MULTILINE | re.IGNORECASE)
+
+
+def _time_day(ddhhmm):
+    """Return the day of a ``DDHHMM`` time, checking that it is valid."""
+    day = int(ddhhmm[:2])
+    if not 1 <= day <= 31:
+        raise ValueError(f'Invalid day in time {ddhhmm}.')
+    return day
+
+
+def _issue_time(text):
+    """Decode the issuance time (UTC) of a product.
+
+    The UTC date is taken from the day of the WMO heading, next to the local
+    issuance date.
+
+    Raises
+    ------
+    ValueError
+        If the times are missing or invalid.
+    """
+    issued = _ISSUED.search(text)
+    wmo = _WMO_TIME.search(text)
+    if issued is None or wmo is None:
+        raise ValueError('Product is missing its issuance time.')
+
+    local = datetime(int(issued['year']), _MONTHS.index(issued['month'].upper()) + 1,
+                     int(issued['day']))
+    wmo = wmo['time']
+
+    # The UTC date is the local date or the next day.
+    for date in (local, local + timedelta(days=1), local - timedelta(days=1)):
+        if date.day == _time_day(wmo):
+            break
+    else:
+        raise ValueError(f'WMO time {wmo} does not match the issuance date.')
+
+    return date.replace(hour=int(wmo[2:4]), minute=int(wmo[4:]), tzinfo=timezone.utc)
 
 
 def decode_coords(coord_string):
@@ -30,6 +119,29 @@ def decode_coords(coord_string):
     return (lon, lat)
 
 
+def decode_coords_array(coord_strings):
+    """Decode many coordinates at once.
+
+    Vectorized version of `decode_coords`.
+
+    Parameters
+    ----------
+    coord_strings : sequence of str
+        Longitude and latitude strings from a LAT...LON section.
+
+    Returns
+    -------
+    `numpy.ndarray`
+        Decoded longitude and latitude with shape ``(n, 2)``.
+    """
+    values = np.asarray(coord_strings, dtype=np.int64)
+    lat = values // 10000 / 100
+    lon = values % 10000
+    lon = -np.where(lon < 3000, lon + 10000, lon) / 100
+
+    return np.column_stack((lon, lat))
+
+
 def mcd_to_geojson(mcd_text):
     """Parse MCD and output to geoJSON.
 
@@ -43,7 +155,7 @@ def mcd_to_geojson(mcd_text):
     geoJSON object
     """
     parse_coords = re.compile(r'(?:LAT\.\.\.LON)\s+(?P<coords>(?:\d{8}[\s\n]*)+)')
-    parse_md_number = re.compile(r'Mesoscale Discussion (?P<mdnum>\d{4})')
+    parse_md_number = re.compile(r'Mesoscale Discussion (?P<mdnum>\d{4})', re.IGNORECASE)
 
     try:
         text = mcd_text.decode('utf-8', 'ignore')
@@ -56,6 +168,8 @@ def mcd_to_geojson(mcd_text):
     coords_txt = parse_coords.search(text).groupdict()['coords']
     coords_list = coords_txt.replace('\n', '').split()
     coords_pts = [decode_coords(x) for x in coords_list]
+    if len(coords_pts) < 3:
+        raise ValueError(f'MD {md_number} area has fewer than three vertices.')
 
     md_feature = {
         'type': 'Feature',
@@ -72,3 +186,298 @@ def mcd_to_geojson(mcd_text):
         'type': 'FeatureCollection',
         'features': [md_feature],
     }
+
+
+def iter_products(stream, max_size=1024**2):
+    """Split a concatenated feed of text products into single products.
+
+    The feed is read line by line and split on WMO abbreviated headings, so
+    only one product is held in memory at a time.
+
+    Parameters
+    ----------
+    stream : binary file-like object
+        Feed of concatenated products.
+    max_size : int
+        Maximum size of a product in bytes. Larger products are skipped.
+
+    Yields
+    ------
+    bytes
+        Raw text of each product, starting with its WMO heading.
+    """
+    lines = []
+    size = 0
+    for line in stream:
+        if _WMO_HEADER.match(line):
+            if lines and size <= max_size:
+                yield b''.join(lines)
+            lines = []
+            size = 0
+        elif not lines:
+            continue
+
+        size += len(line)
+        if size <= max_size:
+            lines.append(line)
+
+    if lines and size <= max_size:
+        yield b''.join(lines)
+
+
+def iter_md_features(source, max_size=1024**2):
+    """Decode the MDs of a concatenated feed of text products.
+
+    Products that are not MDs, or MDs without an area, are skipped. MDs that
+    cannot be decoded (e.g., damaged in transmission) are skipped with a warning.
+
+    Parameters
+    ----------
+    source : str, `pathlib.Path` or binary file-like object
+        Path to the feed (compressed with gzip or zstd if it has a ``.gz`` or
+        ``.zst`` suffix) or an open binary stream.
+    max_size : int
+        Maximum size of a product in bytes. Larger products are skipped.
+
+    Yields
+    ------
+    dict
+        geoJSON feature of each MD as from `mcd_to_geojson`. The UTC ``year`` of
+        issuance (None if it cannot be decoded) is added to the properties next
+        to ``number``.
+    """
+    if isinstance(source, (str, Path)):
+        with open_product(source) as fh:
+            yield from iter_md_features(fh, max_size)
+        return
+
+    for product in iter_products(source, max_size):
+        if b'MESOSCALE DISCUSSION' not in product.upper() or b'LAT...LON' not in product:
+            continue
+
+        try:
+            feature = mcd_to_geojson(product)['features'][0]
+        except (AttributeError, TypeError, ValueError):
+            header = product.split(b'\r', 1)[0].decode('utf-8', 'replace')
+            warnings.warn(f'Skipping malformed MD: {header}', stacklevel=2)
+            continue
+        try:
+            year = _issue_time(product.decode('utf-8', 'ignore')).year
+        except ValueError:
+            year = None
+        feature['properties']['year'] = year
+
+        yield feature
+
+
+def _close_line(coords, domain):
+    """Close an open PTS line, keeping the part of the domain right of the line."""
+    start = coords[0] - coords[1]
+    end = coords[-1] - coords[-2]
+    reach = 2 * max(domain.bounds[2] - domain.bounds[0], domain.bounds[3] - domain.bounds[1])
+    line = shapely.linestrings(np.vstack((
+        coords[0] + start / np.hypot(*start) * reach,
+        coords,
+        coords[-1] + end / np.hypot(*end) * reach,
+    )))
+
+    # Probe just to the right of the first segment inside the domain.
+    segments = np.diff(coords, axis=0)
+    middles = coords[:-1] + segments / 2
+    inside = shapely.contains_xy(domain, middles[:, 0], middles[:, 1])
+    if not inside.any():
+        return shapely.Polygon()
+    i = np.argmax(inside)
+    right = np.array([segments[i, 1], -segments[i, 0]]) / np.hypot(*segments[i])
+    probe = shapely.points(middles[i] + right * 1e-6)
+
+    pieces = shapely.get_parts(shapely.ops.split(domain, line))
+    return shapely.union_all(pieces[shapely.contains(pieces, probe)])
+
+
+def _label_geometry(segments, domain):
+    """Build the area of a PTS label from its line segments.
+
+    Following the SPC convention, the area is to the right of each line. Closed
+    lines drawn clockwise enclose an area and counter-clockwise ones a hole.
+    Open lines are closed against ``domain``. Repeated vertices are dropped, and
+    lines with fewer than two distinct vertices are skipped.
+    """
+    areas = []
+    holes = []
+    for coords in segments:
+        if len(coords):
+            coords = coords[np.r_[True, np.any(np.diff(coords, axis=0) != 0, axis=1)]]
+        if len(coords) < 2:
+            continue
+        if len(coords) > 3 and np.allclose(coords[0], coords[-1]):
+            ring = shapely.linearrings(coords)
+            polygon = shapely.make_valid(shapely.polygons(ring))
+            (holes if shapely.is_ccw(ring) else areas).append(polygon)
+        else:
+            areas.append(_close_line(coords, domain))
+
+    if holes and not areas:
+        areas.append(domain)
+    area = shapely.union_all(areas)
+    if holes:
+        area = shapely.difference(area, shapely.union_all(holes))
+
+    return area
+
+
+def _pts_times(text):
+    """Decode the issuance, valid and expiration times (UTC) of a PTS product.
+
+    Raises
+    ------
+    ValueError
+        If the times are missing or invalid.
+    """
+    issue = _issue_time(text)
+    valid = _PTS_VALID.search(text)
+    if valid is None:
+        raise ValueError('PTS product is missing its valid times.')
+
+    def _after(ddhhmm, start):
+        moment = start
+        for _ in range(31):
+            if moment.day == _time_day(ddhhmm):
+                return moment.replace(hour=int(ddhhmm[2:4]), minute=int(ddhhmm[4:]))
+            moment += timedelta(days=1)
+        raise ValueError(f'PTS time {ddhhmm} is not within a month of {start:%Y-%m-%d}.')
+
+    start = _after(valid['start'], issue.replace(hour=0, minute=0))
+    end = _after(valid['end'], start)
+
+    return issue, start, end
+
+
+def pts_to_geojson(pts_text, domain=PTS_DOMAIN, clip=None):
+    """Decode a PTS (points) convective outlook to geoJSON.
+
+    PTS products hold the outlooks issued before the SPC geoJSON archive. Each
+    label is decoded into one multipolygon, with the same properties as the SPC
+    geoJSON files, so the layers can be read with
+    `spcartopy.io.shapereader.SPCReader`. Open lines are closed against
+    ``domain`` (a box around CONUS by default) rather than the national border,
+    so use ``clip`` to trim areas that reach beyond land.
+
+    Parameters
+    ----------
+    pts_text : str or bytes
+        Raw PTS text, e.g., from a ``PTSDY1`` product.
+    domain : tuple of float
+        ``(xmin, ymin, xmax, ymax)`` used to close open lines.
+    clip : shapely geometry, optional
+        Area (in longitude and latitude) to which the outlook areas are clipped.
+
+    Returns
+    -------
+    dict
+        ``day`` of the outlook, ``issue``, ``valid`` and ``expire`` times as UTC
+        `datetime.datetime`, and ``hazards`` mapping each hazard (``'cat'``,
+        ``'torn'``, ``'sigtorn'``, ...) to a geoJSON FeatureCollection.
+
+    Raises
+    ------
+    ValueError
+        If the issuance or valid times of the product are missing or invalid.
+    """
+    try:
+        text = pts_text.decode('utf-8', 'ignore')
+    except AttributeError:
+        text = pts_text
+
+    issue, valid, expire = _pts_times(text)
+    day = _PTS_DAY.search(text)
+    domain = shapely.box(*domain)
+    times = {'VALID': f'{valid:%Y%m%d%H%M}', 'EXPIRE': f'{expire:%Y%m%d%H%M}',
+             'ISSUE': f'{issue:%Y%m%d%H%M}'}
+
+    hazards = {}
+    for section in _PTS_SECTION.finditer(text):
+        if section['name'] not in _PTS_HAZARDS:
+            continue
+        hazard, colors = _PTS_HAZARDS[section['name']]
+
+        segments = {}
+        for line in _PTS_LINE.finditer(section['body']):
+            if line['label'] not in colors:
+                continue
+            tokens = np.array(line['coords'].split())
+            breaks = np.flatnonzero(tokens == '99999999')
+            for part in np.split(tokens, breaks):
+                part = part[part != '99999999']
+                segments.setdefault(line['label'], []).append(decode_coords_array(part))
+
+        features = {hazard: [], f'sig{hazard}': []}
+        for label in sorted(segments, key=list(colors)[::-1].index):
+            geometry = _label_geometry(segments[label], domain)
+            if clip is not None:
+                geometry = shapely.intersection(geometry, clip)
+            if geometry.is_empty:
+                continue
+
+            if hazard == 'cat':
+                dn, label2 = _PTS_CATEGORIES[label]
+            elif label == 'SIGN':
+                dn, label2 = 10, f'10% Significant {_PTS_HAZARD_NAMES[hazard]} Risk'
+            else:
+                dn = round(float(label) * 100)
+                label2 = f'{dn}% {_PTS_HAZARD_NAMES[hazard]} Risk'
+
+            feature = {
+                'type': 'Feature',
+                'properties': {'DN': dn, **times, 'LABEL': label, 'LABEL2': label2,
+                               'stroke': colors[label]['ec'], 'fill': colors[label]['fc']},
+                'geometry': shapely.geometry.mapping(
+                    shapely.MultiPolygon(shapely.get_parts(geometry).tolist())
+                ),
+            }
+            features[hazard].append(feature)
+            if label == 'SIGN':
+                features[f'sig{hazard}'].append(feature)
+
+        for name, layer in features.items():
+            if hazard != 'cat' or name == 'cat':
+                hazards[name] = {'type': 'FeatureCollection', 'features': layer}
+
+    return {'day': int(day['day']) if day and day['day'] else None, 'issue': issue,
+            'valid': valid, 'expire': expire, 'hazards': hazards}
+
+
+def iter_pts_outlooks(source, domain=PTS_DOMAIN, clip=None):
+    """Decode the PTS outlooks of a concatenated feed of text products.
+
+    Outlooks that cannot be decoded are skipped with a warning.
+
+    Parameters
+    ----------
+    source : str, `pathlib.Path` or binary file-like object
+        Path to the feed (compressed with gzip or zstd if it has a ``.gz`` or
+        ``.zst`` suffix) or an open binary stream.
+    domain, clip
+        See `pts_to_geojson`.
+
+    Yields
+    ------
+    dict
+        Decoded outlook as from `pts_to_geojson`.
+    """
+    if isinstance(source, (str, Path)):
+        with open_product(source) as fh:
+            yield from iter_pts_outlooks(fh, domain, clip)
+        return
+
+    for product in iter_products(source):
+        if b'PTSD' not in product or b'VALID TIME' not in product:
+            continue
+
+        try:
+            outlook = pts_to_geojson(product, domain, clip)
+        except (ValueError, shapely.errors.ShapelyError) as e:
+            warnings.warn(f'Skipping malformed PTS outlook: {e}', stacklevel=2)
+            continue
+
+        yield outlook
@@ -0,0 +1,197 @@
+# Copyright (c) 2025 Nathan Wendt.
+# Distributed under the terms of the BSD 3-Clause License.
+# SPDX-License-Identifier: BSD-3-Clause
+"""Export SPC products to a partitioned GeoParquet archive."""
+
+import json
+from pathlib import Path
+import uuid
+
+from cartopy.io.shapereader import FionaRecord
+import shapely
+
+# Attributes of SPC outlook records stored in the archive.
+RECORD_ATTRIBUTES = ('LABEL', 'LABEL2', 'fill', 'stroke')
+
+# Columns identifying a product in the archive. MD numbers restart every year.
+PRODUCT_KEY = ('product', 'fday', 'ftime', 'issue_date', 'hazard', 'number', 'year')
+
+_GEO_METADATA = {
+    'version': '1.0.0',
+    'primary_column': 'geometry',
+    'columns': {
+        'geometry': {
+            'encoding': 'WKB',
+            'geometry_types': ['Polygon', 'MultiPolygon'],
+        },
+    },
+}
+
+
+def _import_pyarrow():
+    """Import pyarrow, raising a helpful error if it is not installed."""
+    try:
+        import pyarrow.dataset
+    except ImportError:
+        raise ImportError('GeoParquet export requires the pyarrow package.') from None
+
+    return pyarrow
+
+
+def _schema(pa):
+    """Return the schema of the archive."""
+    fields = [
+        ('product', pa.string()),
+        ('fday', pa.int8()),
+        ('ftime', pa.int16()),
+        ('issue_date', pa.date32()),
+        ('hazard', pa.string()),
+        ('number', pa.int32()),
+        *((attr, pa.string()) for attr in RECORD_ATTRIBUTES),
+        ('geometry', pa.binary()),
+        ('year', pa.int16()),
+    ]
+
+    return pa.schema(fields, metadata={'geo': json.dumps(_GEO_METADATA)})
+
+
+def _partitioning(pa):
+    """Return the hive partitioning (year and product) of the archive."""
+    return pa.dataset.partitioning(
+        pa.schema([('year', pa.int16()), ('product', pa.string())]), flavor='hive'
+    )
+
+
+def _product_key(feature):
+    """Return the archive key of a feature."""
+    if hasattr(feature, 'number'):
+        return ('md', None, None, None, None, feature.number, feature.year)
+
+    return (feature.product, feature.fday, feature.ftime, feature.timestamp.date(),
+            feature.hazard, None, feature.year)
+
+
+def archived_products(root):
+    """Get the keys of all products already in an archive.
+
+    Parameters
+    ----------
+    root : str or `pathlib.Path`
+        Root directory of the archive.
+
+    Returns
+    -------
+    set of tuple
+        Product keys with the values of the ``PRODUCT_KEY`` columns.
+    """
+    pa = _import_pyarrow()
+    if not Path(root).exists():
+        return set()
+
+    dataset = pa.dataset.dataset(root, schema=_schema(pa), partitioning=_partitioning(pa))
+    table = dataset.to_table(columns=list(PRODUCT_KEY))
+
+    return set(zip(*(table.column(col).to_pylist() for col in PRODUCT_KEY), strict=True))
+
+
+def _record_batches(features, skip, pa):
+    """Convert features to record batches, one per new product."""
+    schema = _schema(pa)
+    for feature in features:
+        key = _product_key(feature)
+        if key in skip:
+            continue
+        skip.add(key)
+
+        if hasattr(feature, 'records'):
+            records = [(rec.geometry, rec.attributes) for rec in feature.records()]
+        else:
+            records = [(geom, {}) for geom in feature.geometries()]
+        if not records:
+            continue
+
+        num = len(records)
+        columns = dict(zip(PRODUCT_KEY, ([value] * num for value in key), strict=True))
+        columns.update({attr: [attrs.get(attr) for _, attrs in records]
+                        for attr in RECORD_ATTRIBUTES})
+        columns['geometry'] = list(shapely.to_wkb([geom for geom, _ in records]))
+
+        yield pa.RecordBatch.from_pydict(columns, schema=schema)
+
+
+def export_geoparquet(features, root):
+    """Append SPC products to a partitioned GeoParquet archive.
+
+    Products are streamed from ``features`` and written as GeoParquet files
+    partitioned by ``year`` and ``product`` (hive style, e.g.,
+    ``root/year=2020/product=convective_outlook``). Geometries are stored as
+    WKB. Products already present in the archive are skipped, so the archive
+    can be updated incrementally with only new days.
+
+    Requires the pyarrow package.
+
+    Parameters
+    ----------
+    features : iterable of `spcartopy.feature` instances
+        Outlook and MD features. A generator can be used to create features only
+        when they are written.
+    root : str or `pathlib.Path`
+        Root directory of the archive.
+
+    Returns
+    -------
+    int
+        Number of rows written.
+    """
+    pa = _import_pyarrow()
+    skip = archived_products(root)
+    num_rows = 0
+
+    def _count(batches):
+        nonlocal num_rows
+        for batch in batches:
+            num_rows += batch.num_rows
+            yield batch
+
+    pa.dataset.write_dataset(
+        _count(_record_batches(features, skip, pa)), root, schema=_schema(pa),
+        format='parquet', partitioning=_partitioning(pa),
+        basename_template=f'part-{uuid.uuid4().hex}-{{i}}.parquet',
+        existing_data_behavior='overwrite_or_ignore',
+    )
+
+    return num_rows
+
+
+def read_geoparquet(root, filters=None):
+    """Read SPC records from a GeoParquet archive.
+
+    Geometries are decoded from WKB in one vectorized call; no geoJSON is
+    parsed.
+
+    Requires the pyarrow package.
+
+    Parameters
+    ----------
+    root : str or `pathlib.Path`
+        Root directory of the archive.
+    filters : `pyarrow.dataset.Expression`, optional
+        Filter applied while reading, e.g.,
+        ``(pc.field('year') == 2020) & (pc.field('hazard') == 'cat')``.
+        Filters on ``year`` and ``product`` only read matching partitions.
+
+    Returns
+    -------
+    list of `cartopy.io.shapereader.FionaRecord`
+        Records with the same attributes as those from
+        `spcartopy.io.shapereader.SPCReader`, plus the product columns.
+    """
+    pa = _import_pyarrow()
+    dataset = pa.dataset.dataset(root, schema=_schema(pa), partitioning=_partitioning(pa))
+    table = dataset.to_table(filter=filters)
+
+    geometries = shapely.from_wkb(table.column('geometry').to_numpy(zero_copy_only=False))
+    attributes = table.drop_columns(['geometry']).to_pylist()
+
+    return [FionaRecord(geom, attrs)
+            for geom, attrs in zip(geometries, attributes, strict=True)]
@@ -0,0 +1,280 @@
+# Copyright (c) 2025 Nathan Wendt.
+# Distributed under the terms of the BSD 3-Clause License.
+# SPDX-License-Identifier: BSD-3-Clause
+"""Pack SPC products into memory-mapped, append-only segment files."""
+
+import contextlib
+import json
+import mmap
+from pathlib import Path
+import threading
+
+import numpy as np
+import shapely
+
+from spcartopy.io.codec import decode_geometries, encode_geometries, SPC_SCALE
+from spcartopy.io.shapereader import read_records, SPCRecordTable
+
+_SPC_ARCHIVE = None
+
+# Arrays in a segment start on multiples of this many bytes.
+_ALIGNMENT = 8
+
+
+class SegmentArchive:
+    """Archive of SPC products packed into large, append-only segment files.
+
+    Each product is stored as the ragged coordinate and offset arrays of its
+    geometries (see `shapely.to_ragged_array`). Products are appended to the
+    current segment until it exceeds ``segment_size`` and the location of every
+    product is appended to ``index.jsonl`` alongside its record attributes.
+
+    Reading a product only memory maps its segment and creates numpy views of
+    the arrays, which are handed to `shapely.from_ragged_array` without copying
+    or opening a file per product.
+
+    With ``quantize``, coordinates are stored delta encoded at the 0.01 degree
+    precision of SPC products (see `spcartopy.io.codec.encode_geometries`),
+    which shrinks the segments several fold. Vertices off that grid (e.g., of
+    decoded PTS outlooks) are rounded. Products appended before keep their
+    encoding.
+
+    Only one process should append to an archive at a time.
+
+    Parameters
+    ----------
+    directory : str or `pathlib.Path`
+        Directory of the segments and index.
+    segment_size : int
+        Size in bytes after which a new segment is started.
+    quantize : bool
+        Whether to store appended coordinates quantized.
+    """
+
+    def __init__(self, directory, segment_size=256 * 1024**2, quantize=False):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.segment_size = segment_size
+        self.quantize = quantize
+        self._index = {}
+        self._mmaps = {}
+        self._lock = threading.Lock()
+
+        index_path = self.directory / 'index.jsonl'
+        if index_path.exists():
+            with open(index_path, encoding='utf-8') as fh:
+                for line in fh:
+                    entry = json.loads(line)
+                    if entry.get('deleted'):
+                        self._index.pop(tuple(entry['key']), None)
+                    else:
+                        self._index[tuple(entry['key'])] = entry
+
+        self._segment = max((entry['segment'] for entry in self._index.values()), default=0)
+
+    def __contains__(self, key):
+        """Check if a product key is in the archive."""
+        return tuple(key) in self._index
+
+    def __len__(self):
+        """Return the number of products in the archive."""
+        return len(self._index)
+
+    def keys(self):
+        """Get the keys of the archived products."""
+        return self._index.keys()
+
+    def _segment_path(self, segment):
+        """Return the path of a segment file."""
+        return self.directory / f'segment-{segment:05d}.bin'
+
+    def append(self, key, table):
+        """Append a product to the archive.
+
+        Parameters
+        ----------
+        key : tuple
+            Key identifying the product, e.g., the values used to download it.
+        table : `spcartopy.io.shapereader.SPCRecordTable`
+            Records of the product.
+
+        Raises
+        ------
+        ValueError
+            If the geometries cannot be encoded (see
+            `spcartopy.io.codec.encode_geometries`). Nothing is appended.
+        """
+        with self._lock:
+            self._append(tuple(key), table)
+
+    def _append(self, key, table):
+        """Append a product while holding the archive lock."""
+        if key in self._index:
+            return
+
+        path = self._segment_path(self._segment)
+        if path.exists() and path.stat().st_size >= self.segment_size:
+            self._segment += 1
+            path = self._segment_path(self._segment)
+
+        entry = {'key': list(key), 'segment': self._segment, 'type': None, 'arrays': [],
+                 'attributes': [rec.attributes for rec in table.records()]}
+        arrays = ()
+        if len(table):
+            encoded = encode_geometries(table.geometry_array,
+                                        SPC_SCALE if self.quantize else None)
+            entry['type'] = int(encoded['type'])
+            entry['scale'] = encoded['scale']
+            arrays = (encoded['coords'], *encoded['offsets'])
+
+        with open(path, 'ab') as fh:
+            for array in arrays:
+                padding = -fh.tell() % _ALIGNMENT
+                fh.write(b'\0' * padding)
+                entry['arrays'].append([fh.tell(), array.dtype.str, list(array.shape)])
+                fh.write(np.ascontiguousarray(array).tobytes())
+
+        with open(self.directory / 'index.jsonl', 'a', encoding='utf-8') as fh:
+            fh.write(json.dumps(entry, default=_json_default) + '\n')
+        self._index[key] = entry
+
+    def discard(self, key):
+        """Remove a product from the archive, e.g., after it was reissued.
+
+        The product data stay in their segment, but the product is no longer
+        served and can be appended again.
+
+        Parameters
+        ----------
+        key : tuple
+            Key identifying the product.
+        """
+        key = tuple(key)
+        with self._lock:
+            if self._index.pop(key, None) is None:
+                return
+            with open(self.directory / 'index.jsonl', 'a', encoding='utf-8') as fh:
+                fh.write(json.dumps({'key': list(key), 'deleted': True},
+                                    default=_json_default) + '\n')
+
+    def _buffer(self, segment, end):
+        """Memory map a segment, remapping it if it has grown past ``end``."""
+        with self._lock:
+            buffer = self._mmaps.get(segment)
+            if buffer is None or len(buffer) < end:
+                if buffer is not None:
+                    # Arrays still viewing the old map keep it open until released.
+                    with contextlib.suppress(BufferError):
+                        buffer.close()
+                with open(self._segment_path(segment), 'rb') as fh:
+                    buffer = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+                self._mmaps[segment] = buffer
+
+        return buffer
+
+    def record_table(self, key):
+        """Read the records of an archived product.
+
+        Parameters
+        ----------
+        key : tuple
+            Key identifying the product.
+
+        Returns
+        -------
+        `spcartopy.io.shapereader.SPCRecordTable`
+        """
+        entry = self._index[tuple(key)]
+        attributes = entry['attributes']
+        if entry['type'] is None:
+            geometries = np.empty(0, dtype=object)
+        else:
+            arrays = []
+            for start, dtype, shape in entry['arrays']:
+                dtype = np.dtype(dtype)
+                count = int(np.prod(shape))
+                buffer = self._buffer(entry['segment'], start + dtype.itemsize * count)
+                arrays.append(np.frombuffer(buffer, dtype=dtype, count=count,
+                                            offset=start).reshape(shape))
+            geometries = decode_geometries({'type': shapely.GeometryType(entry['type']),
+                                            'coords': arrays[0], 'offsets': arrays[1:],
+                                            'scale': entry.get('scale')})
+
+        return SPCRecordTable.from_data([{'geometry': geom, **attrs}
+                                         for geom, attrs in zip(geometries, attributes,
+                                                                strict=True)])
+
+    def close(self):
+        """Release the memory maps of the segments."""
+        for buffer in self._mmaps.values():
+            buffer.close()
+        self._mmaps = {}
+
+
+def _json_default(value):
+    """Convert numpy scalars in record attributes to JSON."""
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+
+def use_archive(directory, segment_size=256 * 1024**2, quantize=False):
+    """Read and store products through a `SegmentArchive`.
+
+    Once enabled, the `spcartopy.feature` classes look products up in the
+    archive before the files of `spcartopy.io.shapereader.spc_convective`,
+    `spcartopy.io.shapereader.spc_fire` and `spcartopy.io.textreader.spc_md`
+    are opened. Products that are not yet archived are read from their files
+    (downloading them if needed) and appended to the archive.
+
+    Parameters
+    ----------
+    directory : str or `pathlib.Path` or None
+        Directory of the archive. None stops using an archive.
+    segment_size : int
+        Size in bytes after which a new segment is started.
+    quantize : bool
+        Whether to store appended coordinates quantized. See `SegmentArchive`.
+
+    Returns
+    -------
+    `SegmentArchive` or None
+    """
+    global _SPC_ARCHIVE
+    if _SPC_ARCHIVE is not None:
+        _SPC_ARCHIVE.close()
+    _SPC_ARCHIVE = (None if directory is None
+                    else SegmentArchive(directory, segment_size, quantize))
+
+    return _SPC_ARCHIVE
+
+
+def read_product(key, path):
+    """Read the records of a product, preferring the archive in use.
+
+    Parameters
+    ----------
+    key : tuple
+        Key identifying the product.
+    path : callable
+        Function returning the path of the product file (e.g., a partial of
+        `spcartopy.io.shapereader.spc_convective`). Only called if the product
+        is not archived. Products that cannot be archived are served from
+        their file instead.
+
+    Returns
+    -------
+    `spcartopy.io.shapereader.SPCRecordTable`
+    """
+    if _SPC_ARCHIVE is None:
+        return read_records(path())
+
+    if key not in _SPC_ARCHIVE:
+        table = read_records(path())
+        try:
+            _SPC_ARCHIVE.append(key, table)
+        except ValueError:
+            # E.g., mixed geometry types; serve the product from its file.
+            return table
+
+    return _SPC_ARCHIVE.record_table(key)
@@ -0,0 +1,259 @@
+# Copyright (c) 2025 Nathan Wendt.
+# Distributed under the terms of the BSD 3-Clause License.
+# SPDX-License-Identifier: BSD-3-Clause
+"""Shared HTTP session used by the SPC downloaders."""
+
+import http.client
+import io
+import random
+import ssl
+import threading
+import time
+from urllib.error import HTTPError, URLError
+from urllib.parse import urljoin, urlsplit
+import warnings
+
+from cartopy.io import DownloadWarning
+
+# Statuses that are retried after backing off.
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+_REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+_MAX_REDIRECTS = 5
+
+# Errors of a kept-alive connection that the server has already closed.
+_STALE_ERRORS = (ConnectionResetError, ConnectionAbortedError, BrokenPipeError)
+
+_DEFAULT_SESSION = None
+_DEFAULT_SESSION_LOCK = threading.Lock()
+
+
+class HTTPSession:
+    """Pooled, retrying HTTP client for SPC products.
+
+    Connections to each host (e.g., www.spc.noaa.gov) are kept alive and reused
+    between requests, so bulk downloads do not open a connection per file.
+    Connection errors and transient responses (see ``RETRY_STATUSES``) are
+    retried with jittered exponential backoff, honoring ``Retry-After``. A
+    kept-alive connection already closed by the server is replaced by a new
+    one without counting as a retry. The session is thread safe.
+
+    Parameters
+    ----------
+    timeout : float
+        Timeout in seconds for connecting and for each read.
+    retries : int
+        Number of retries after the first attempt.
+    backoff : float
+        Base delay in seconds. Retry ``n`` waits a random time of up to
+        ``backoff * 2**n`` seconds.
+    max_backoff : float
+        Maximum delay in seconds between retries.
+    rate : float, optional
+        Maximum number of requests per second. Defaults to no limit.
+    max_connections : int
+        Maximum number of idle connections kept per host.
+    """
+
+    def __init__(self, timeout=30, retries=4, backoff=0.5, max_backoff=30, rate=None,
+                 max_connections=4):
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.rate = rate
+        self.max_connections = max_connections
+        self._pool = {}
+        self._lock = threading.Lock()
+        self._next_request = 0.
+        self._ssl_context = ssl.create_default_context()
+
+    def _connection(self, scheme, netloc, reuse=True):
+        """Get an idle connection to a host or open a new one.
+
+        Returns
+        -------
+        connection : `http.client.HTTPConnection`
+        reused : bool
+            Whether the connection was taken from the pool.
+        """
+        if reuse:
+            with self._lock:
+                idle = self._pool.get((scheme, netloc))
+                if idle:
+                    return idle.pop(), True
+
+        if scheme == 'https':
+            return http.client.HTTPSConnection(netloc, timeout=self.timeout,
+                                               context=self._ssl_context), False
+        return http.client.HTTPConnection(netloc, timeout=self.timeout), False
+
+    def _release(self, scheme, netloc, connection):
+        """Return a connection to the pool for reuse."""
+        with self._lock:
+            idle = self._pool.setdefault((scheme, netloc), [])
+            if len(idle) < self.max_connections:
+                idle.append(connection)
+                return
+        connection.close()
+
+    def _wait_for_rate(self):
+        """Sleep until the next request is allowed by ``rate``."""
+        if not self.rate:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_request)
+            self._next_request = start + 1 / self.rate
+        time.sleep(start - now)
+
+    def _wait_for_retry(self, attempt, retry_after=None):
+        """Sleep before retrying with jittered exponential backoff."""
+        delay = min(self.max_backoff, self.backoff * 2**attempt)
+        delay = random.uniform(0, delay)  # noqa: S311
+        if retry_after is not None and retry_after.isdigit():
+            delay = min(self.max_backoff, max(delay, float(retry_after)))
+        time.sleep(delay)
+
+    def _request(self, url, reuse=True):
+        """Make a single GET request, returning the status, headers and body.
+
+        If a connection from the pool turns out to be closed by the server, the
+        request is made once more on a new connection.
+        """
+        parts = urlsplit(url)
+        if parts.scheme not in ('http', 'https'):
+            raise URLError(f'Unsupported URL scheme: {parts.scheme}')
+        target = parts.path or '/'
+        if parts.query:
+            target += f'?{parts.query}'
+
+        connection, reused = self._connection(parts.scheme, parts.netloc, reuse)
+        try:
+            connection.request('GET', target, headers={'Connection': 'keep-alive'})
+            response = connection.getresponse()
+            body = response.read()
+        except _STALE_ERRORS:
+            connection.close()
+            if reused:
+                return self._request(url, reuse=False)
+            raise
+        except (OSError, http.client.HTTPException):
+            connection.close()
+            raise
+
+        if response.will_close:
+            connection.close()
+        else:
+            self._release(parts.scheme, parts.netloc, connection)
+
+        return response, body
+
+    def get(self, url):
+        """Download a resource.
+
+        Parameters
+        ----------
+        url : str
+            URL of the resource.
+
+        Returns
+        -------
+        `io.BytesIO`
+            Body of the response.
+
+        Raises
+        ------
+        `urllib.error.HTTPError`
+            If the server responds with an error after all retries, or with too
+            many redirects or a redirect without a location.
+        `urllib.error.URLError`
+            If the server cannot be reached after all retries.
+        """
+        attempt = 0
+        redirects = 0
+        while True:
+            self._wait_for_rate()
+            try:
+                response, body = self._request(url)
+            except (OSError, http.client.HTTPException) as error:
+                if attempt >= self.retries:
+                    raise URLError(error) from error
+                self._wait_for_retry(attempt)
+                attempt += 1
+                continue
+
+            if response.status in _REDIRECT_STATUSES:
+                location = response.getheader('Location')
+                if location and redirects < _MAX_REDIRECTS:
+                    url = urljoin(url, location)
+                    redirects += 1
+                    continue
+
+            if response.status in RETRY_STATUSES and attempt < self.retries:
+                self._wait_for_retry(attempt, response.getheader('Retry-After'))
+                attempt += 1
+                continue
+
+            # Redirects without a location or beyond the limit are errors as well.
+            if response.status >= 300:
+                raise HTTPError(url, response.status, response.reason, response.headers,
+                                io.BytesIO(body))
+
+            return io.BytesIO(body)
+
+    def close(self):
+        """Close all idle connections."""
+        with self._lock:
+            pool, self._pool = self._pool, {}
+        for idle in pool.values():
+            for connection in idle:
+                connection.close()
+
+
+class SessionMixin:
+    """Download resources of a `cartopy.io.Downloader` with an `HTTPSession`.
+
+    Downloads use the shared session (see `default_session`) unless the
+    ``session`` attribute is set.
+    """
+
+    session = None
+
+    def _urlopen(self, url):
+        """Download a resource with ``session`` or the shared `HTTPSession`."""
+        warnings.warn(f'Downloading: {url}', DownloadWarning, stacklevel=2)
+        return (self.session or default_session()).get(url)
+
+
+def default_session():
+    """Get the session shared by all SPC downloaders."""
+    global _DEFAULT_SESSION
+    with _DEFAULT_SESSION_LOCK:
+        if _DEFAULT_SESSION is None:
+            _DEFAULT_SESSION = HTTPSession()
+
+    return _DEFAULT_SESSION
+
+
+def configure_session(**kwargs):
+    """Replace the shared session with one using the given settings.
+
+    Parameters
+    ----------
+    kwargs
+        Keyword arguments of `HTTPSession`, e.g., ``timeout``, ``retries`` or
+        ``rate``.
+
+    Returns
+    -------
+    `HTTPSession`
+    """
+    global _DEFAULT_SESSION
+    with _DEFAULT_SESSION_LOCK:
+        if _DEFAULT_SESSION is not None:
+            _DEFAULT_SESSION.close()
+        _DEFAULT_SESSION = HTTPSession(**kwargs)
+
+    return _DEFAULT_SESSION
@@ -3,11 +3,32 @@
 # SPDX-License-Identifier: BSD-3-Clause
 """Custom extensions to download and process SPC geoJSON files."""
 
+import contextlib
+import io
+import json
 from pathlib import Path
+import re
+import shutil
+import sys
+import zipfile
 
 from cartopy import config
 from cartopy.io import Downloader
 from cartopy.io.shapereader import FionaReader, FionaRecord
+import fiona.io
+import fiona.transform
+import numpy as np
+import shapely
+import shapely.geometry as sgeom
+
+from spcartopy.cache import SingleFlightCache
+from spcartopy.io.availability import (_product_date, availability_index,
+                                       ProductUnavailableError)
+from spcartopy.io.compression import compression_suffix, infer_compression, open_product
+from spcartopy.io.session import SessionMixin
+
+# Hazard shapefiles in issuance bundles, e.g., day1otlk_20200412_1630_cat.shp.
+_BUNDLE_LAYER = re.compile(r'_(?P<hazard>[a-z]+)\.shp$')
 
 
 def spc_convective(fday, ftime, year, month, day, hazard, product):
@@ -36,13 +57,95 @@ def spc_fire(fday, ftime, year, month, day, hazard, product):
     return outlook_downloader.path(format_dict)
 
 
+def _geojson_data(collection, bbox=None):
+    """Convert a geoJSON feature collection to `FionaReader` style data."""
+    if bbox is not None:
+        bbox = sgeom.box(*bbox)
+
+    data = []
+    for feature in collection['features']:
+        geometry = sgeom.shape(feature['geometry']) if feature['geometry'] else None
+        if bbox is not None and (geometry is None or not bbox.intersects(geometry)):
+            continue
+        item = {'geometry': geometry}
+        item.update(feature['properties'])
+        data.append(item)
+
+    return data
+
+
+def _bundle_layers(data):
+    """Convert the hazard shapefiles of a zipped issuance bundle to geoJSON."""
+    layers = {}
+    with fiona.io.ZipMemoryFile(data) as bundle, zipfile.ZipFile(io.BytesIO(data)) as zf:
+        for member in zf.namelist():
+            match = _BUNDLE_LAYER.search(member)
+            if match is None:
+                continue
+
+            features = []
+            with bundle.open(member) as src:
+                transform = src.crs and not src.crs.is_geographic
+                for feature in src:
+                    geometry = feature.geometry
+                    if geometry is not None and transform:
+                        geometry = fiona.transform.transform_geom(src.crs, 'EPSG:4326',
+                                                                  geometry)
+                    features.append({
+                        'type': 'Feature',
+                        'properties': dict(feature.properties),
+                        'geometry': None if geometry is None else sgeom.mapping(
+                            sgeom.shape(geometry)
+                        ),
+                    })
+            layers[match.group('hazard')] = {'type': 'FeatureCollection',
+                                             'features': features}
+
+    return layers
+
+
+def _acquire_bundle(downloader, target_path, format_dict):
+    """Download the bundle of an issuance and write the file of every hazard."""
+    url = downloader.bundle_url_template.format(**format_dict)
+    hazard_url = downloader.url(format_dict)
+    availability = availability_index(format_dict)
+    if hazard_url in availability:
+        raise ProductUnavailableError(hazard_url, 404, 'Known to be unavailable', None, None)
+    layers = _bundle_layers(availability.fetch(url, format_dict, downloader._urlopen).read())
+
+    if format_dict['hazard'] not in layers:
+        # Record the missing hazard so the bundle is not downloaded again for it.
+        availability.add(hazard_url, _product_date(format_dict))
+        raise ProductUnavailableError(url, 404, f'No {format_dict["hazard"]} layer in bundle',
+                                      None, None)
+
+    for hazard, collection in layers.items():
+        path = Path(downloader.target_path({**format_dict, 'hazard': hazard}))
+        if path.exists():
+            continue
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open_product(path, 'wb', downloader.compression) as fh:
+            fh.write(json.dumps(collection).encode('utf-8'))
+
+    return target_path
+
+
 class SPCReader(FionaReader):
-    """Read and filter SPC geoJSON files."""
+    """Read and filter SPC geoJSON files.
 
-    def __init__(self, filename, bbox=None):
-        super().__init__(filename, bbox)
+    Files compressed with gzip (``.gz``) or zstd (``.zst``) are decompressed
+    transparently while being read.
+    """
 
-    def geometries(self, filter_keys=None):
+    def __init__(self, filename, bbox=None):
+        if infer_compression(filename) is None:
+            super().__init__(filename, bbox)
+        else:
+            self.crs = None
+            with open_product(filename) as fh:
+                self._data = _geojson_data(json.load(fh), bbox)
+
+    def geometries(self, filter_keys=None, record_filter=None):
         """Get SPC outlook geometries.
 
         Overrides `FionaReader.geometries` so that specified geomtries can be
@@ -52,17 +155,12 @@ class SPCReader(FionaReader):
         ----------
         filter_keys : dict
             A dictionary containing key:value pairs used to filter geometries.
+        record_filter : `RecordFilter`, optional
+            Additional filter applied to the geometries.
         """
-        if filter_keys is None:
-            filter_keys = {}
+        return self.record_table(filter_keys, record_filter).geometries()
 
-        for item in self._data:
-            if any(item[key] == value for key, value in filter_keys.items()):
-                continue
-            else:
-                yield item['geometry']
-
-    def records(self, filter_keys=None):
+    def records(self, filter_keys=None, record_filter=None):
         """Get SPC outlook records.
 
         Overrides `FionaReader.records` so that specified records can be
@@ -72,76 +170,387 @@ class SPCReader(FionaReader):
         ----------
         filter_keys : dict
             A dictionary containing key:value pairs used to filter records.
+        record_filter : `RecordFilter`, optional
+            Additional filter applied to the records.
 
         """
-        if filter_keys is None:
-            filter_keys = {}
+        return self.record_table(filter_keys, record_filter).records()
 
-        for item in self._data:
-            if any(item[key] == value for key, value in filter_keys.items()):
-                continue
+    def record_table(self, filter_keys=None, record_filter=None):
+        """Get SPC outlook records as a compact `SPCRecordTable`.
+
+        Parameters
+        ----------
+        filter_keys : dict
+            A dictionary containing key:value pairs used to filter records.
+        record_filter : `RecordFilter`, optional
+            Additional filter applied to the records.
+        """
+        if getattr(self, '_table', None) is None:
+            self._table = SPCRecordTable.from_data(self._data)
+
+        table = self._table
+        if filter_keys:
+            table = table.filter(RecordFilter(exclude=filter_keys))
+        if record_filter is not None:
+            table = table.filter(record_filter)
+
+        return table
+
+
+class RecordFilter:
+    """Vectorized filter of SPC records.
+
+    All conditions must be met for a record to be kept. Filters are hashable,
+    so the result of applying one to a table can be cached.
+
+    Parameters
+    ----------
+    include : dict, optional
+        Keep only records whose attributes match. Values may be a single value or
+        a list/set/tuple of allowed values, e.g., ``{'LABEL': ['SLGT', 'ENH']}``.
+    exclude : dict, optional
+        Drop records if any attribute matches. Values may be a single value or a
+        list/set/tuple of values, e.g., ``{'LABEL': 'SIGN'}``.
+    min_probability, max_probability : float, optional
+        Keep only records whose probabilistic ``LABEL`` (e.g., ``'0.15'``) is
+        within these bounds. Records with non-numeric labels (e.g., ``'SIGN'``)
+        are dropped when either bound is given.
+    bbox : tuple of float, optional
+        Keep only records whose geometry intersects ``(xmin, ymin, xmax, ymax)``.
+    """
+
+    def __init__(self, include=None, exclude=None, min_probability=None,
+                 max_probability=None, bbox=None):
+        self.include = self._normalize(include)
+        self.exclude = self._normalize(exclude)
+        self.min_probability = min_probability
+        self.max_probability = max_probability
+        self.bbox = None if bbox is None else tuple(bbox)
+
+    @staticmethod
+    def _normalize(conditions):
+        """Convert conditions to a sorted tuple of (name, frozenset of values)."""
+        if not conditions:
+            return ()
+
+        normalized = []
+        for name, values in conditions.items():
+            if not isinstance(values, (list, set, frozenset, tuple)):
+                values = (values,)
+            normalized.append((name, frozenset(values)))
+
+        return tuple(sorted(normalized, key=lambda item: item[0]))
+
+    def _key(self):
+        """Return a tuple identifying this filter."""
+        return (self.include, self.exclude, self.min_probability, self.max_probability,
+                self.bbox)
+
+    def __eq__(self, other):
+        """Compare filters by their conditions."""
+        return isinstance(other, RecordFilter) and self._key() == other._key()
+
+    def __hash__(self):
+        """Hash filters by their conditions."""
+        return hash(self._key())
+
+    def __repr__(self):
+        """Return a representation of the filter conditions."""
+        return (f'RecordFilter(include={dict(self.include)!r}, '
+                f'exclude={dict(self.exclude)!r}, min_probability={self.min_probability!r}, '
+                f'max_probability={self.max_probability!r}, bbox={self.bbox!r})')
+
+    def mask(self, table):
+        """Evaluate the filter on a `SPCRecordTable`.
+
+        Returns
+        -------
+        `numpy.ndarray` of bool
+            True for records that are kept.
+        """
+        keep = np.ones(len(table), dtype=bool)
+        for name, values in self.include:
+            keep &= table.isin(name, values)
+        for name, values in self.exclude:
+            keep &= ~table.isin(name, values)
+
+        if self.min_probability is not None or self.max_probability is not None:
+            probability = table.probability()
+            if self.min_probability is not None:
+                keep &= probability >= self.min_probability
+            if self.max_probability is not None:
+                keep &= probability <= self.max_probability
+
+        if self.bbox is not None:
+            keep &= shapely.intersects(table.geometry_array, shapely.box(*self.bbox))
+
+        return keep
+
+
+_SPC_TABLE_CACHE = SingleFlightCache()
+
+
+def read_records(path, record_filter=None):
+    """Read the records of an SPC geoJSON file into a cached `SPCRecordTable`.
+
+    Each file is parsed only once (until it is modified, which replaces its
+    cached table). Filtered views of the table are cached alongside it, so
+    differently filtered requests for the same file neither re-read the file
+    nor re-evaluate a filter.
+
+    Parameters
+    ----------
+    path : str or `pathlib.Path`
+        Path to the (possibly compressed) geoJSON file.
+    record_filter : `RecordFilter`, optional
+        Filter applied to the records.
+
+    Returns
+    -------
+    `SPCRecordTable`
+    """
+    path = Path(path)
+    key = (str(path.resolve()), path.stat().st_mtime_ns)
+    if key not in _SPC_TABLE_CACHE:
+        # Drop the tables of previous versions of the file.
+        _SPC_TABLE_CACHE.invalidate(lambda cached: cached[0] == key[0] and cached != key)
+    table = _SPC_TABLE_CACHE.get_or_create(key, lambda: SPCReader(path).record_table())
+
+    return table if record_filter is None else table.filter(record_filter)
+
+
+class SPCRecordTable:
+    """Columnar container of SPC records.
+
+    Attributes are stored in typed NumPy columns, with string attributes (e.g.,
+    ``LABEL`` or ``fill``) interned as integer codes into a small array of
+    unique values. Geometries are stored in a shapely geometry array. Iterating
+    over the table yields `cartopy.io.shapereader.FionaRecord` instances, so it
+    can be used wherever SPC records are expected.
+
+    Parameters
+    ----------
+    geometries : `numpy.ndarray` of shapely geometries
+        Record geometries.
+    columns : dict
+        Mapping of attribute name to a `numpy.ndarray` of values or, for
+        interned strings, a tuple of integer codes and unique values.
+    """
+
+    def __init__(self, geometries, columns):
+        self.geometry_array = geometries
+        self.columns = columns
+        self._views = SingleFlightCache()
+
+    @classmethod
+    def from_data(cls, data):
+        """Build a table from `FionaReader` style data.
+
+        Parameters
+        ----------
+        data : list of dict
+            One dictionary per record holding the ``geometry`` and attributes.
+        """
+        geometries = np.empty(len(data), dtype=object)
+        geometries[:] = [item['geometry'] for item in data]
+
+        names = dict.fromkeys(key for item in data for key in item if key != 'geometry')
+        columns = {}
+        for name in names:
+            values = [item.get(name) for item in data]
+            if all(isinstance(value, str) for value in values):
+                categories, codes = np.unique(np.array(values, dtype=object),
+                                              return_inverse=True)
+                categories[:] = [sys.intern(category) for category in categories]
+                columns[name] = (codes.astype(np.min_scalar_type(len(categories))),
+                                 categories)
+            elif all(isinstance(value, int) and not isinstance(value, bool)
+                     for value in values):
+                columns[name] = np.array(values, dtype=np.int64)
+            elif all(isinstance(value, (int, float)) and not isinstance(value, bool)
+                     for value in values):
+                columns[name] = np.array(values, dtype=np.float64)
+            else:
+                columns[name] = np.empty(len(values), dtype=object)
+                columns[name][:] = values
+
+        return cls(geometries, columns)
+
+    def __len__(self):
+        """Return the number of records."""
+        return len(self.geometry_array)
+
+    def __iter__(self):
+        """Iterate over the records."""
+        return self.records()
+
+    def column(self, name):
+        """Get the values of an attribute as a `numpy.ndarray`."""
+        column = self.columns[name]
+        if isinstance(column, tuple):
+            codes, categories = column
+            return categories[codes]
+
+        return column
+
+    def isin(self, name, values):
+        """Get a boolean mask of records whose attribute is one of ``values``.
+
+        String attributes are compared through their integer codes, so the mask
+        is computed without comparing strings record by record.
+        """
+        if name not in self.columns:
+            return np.zeros(len(self), dtype=bool)
+
+        column = self.columns[name]
+        if isinstance(column, tuple):
+            codes, categories = column
+            wanted = [i for i, category in enumerate(categories) if category in values]
+            return np.isin(codes, wanted)
+
+        return np.isin(column, list(values))
+
+    def probability(self):
+        """Get the probability of each record from its ``LABEL``.
+
+        Non-numeric labels (e.g., ``'SIGN'`` or ``'SLGT'``) and missing labels
+        are NaN.
+        """
+        if 'LABEL' not in self.columns:
+            return np.full(len(self), np.nan)
+
+        column = self.columns['LABEL']
+        if isinstance(column, tuple):
+            codes, categories = column
+        else:
+            # Labels are not interned if some are missing.
+            codes, categories = np.arange(len(self)), column
+        values = np.full(len(categories), np.nan)
+        for i, category in enumerate(categories):
+            with contextlib.suppress(TypeError, ValueError):
+                values[i] = float(category)
+
+        return values[codes]
+
+    def filter(self, record_filter):
+        """Get a table of the records kept by a `RecordFilter`.
+
+        Filtered tables are cached, so applying the same filter again is free.
+        """
+        return self._views.get_or_create(record_filter,
+                                         lambda: self.take(record_filter.mask(self)))
+
+    def take(self, selection):
+        """Get a new table with the records selected by a mask or indices."""
+        columns = {}
+        for name, column in self.columns.items():
+            if isinstance(column, tuple):
+                columns[name] = (column[0][selection], column[1])
             else:
-                yield FionaRecord(item['geometry'],
-                                  {key: value for key, value in
-                                  item.items() if key != 'geometry'})
+                columns[name] = column[selection]
+
+        return SPCRecordTable(self.geometry_array[selection], columns)
+
+    def geometries(self):
+        """Get an iterator of the record geometries."""
+        return iter(self.geometry_array)
+
+    def records(self):
+        """Get an iterator of `cartopy.io.shapereader.FionaRecord` instances."""
+        values = {name: self.column(name).tolist() for name in self.columns}
+        for i, geometry in enumerate(self.geometry_array):
+            yield FionaRecord(geometry, {name: column[i] for name, column in values.items()})
 
 
-class ConvectiveOutlookDownloader(Downloader):
+class ConvectiveOutlookDownloader(SessionMixin, Downloader):
     """SPC convectie outlook downloader.
 
     Base class that extends `cartopy.io.Downloader` for SPC convective outlooks.
+    Downloaded files can be stored compressed on disk by setting ``compression``
+    to ``'gzip'`` or ``'zstd'`` (requires the zstandard package).
+
+    If ``bundle_url_template`` is set (see `use_bundles`), the archive bundling
+    every hazard of an issuance is downloaded instead and split into the files
+    of each hazard, so the other hazards are served without further requests.
     """
 
+    _SPC_BUNDLE_TEMPLATE = None
+
     FORMAT_KEYS = ('config', 'hazard', 'ftime', 'year', 'month', 'day', 'product')
 
     def __init__(self,
                  url_template,
                  target_path_template,
                  pre_downloaded_path_template,
+                 compression=None,
                  ):
         super().__init__(url_template, target_path_template, pre_downloaded_path_template)
+        compression_suffix(compression)
+        self.compression = compression
+        self.bundle_url_template = None
 
     def acquire_resource(self, target_path, format_dict):
         """Download resource."""
         target_dir = Path(target_path).parent
         target_dir.mkdir(parents=True, exist_ok=True)
 
+        if self.bundle_url_template is not None:
+            return _acquire_bundle(self, target_path, format_dict)
+
         url = self.url(format_dict)
 
-        geojson_response = self._urlopen(url)
+        availability = availability_index(format_dict)
+        geojson_response = availability.fetch(url, format_dict, self._urlopen)
 
-        with open(target_path, 'wb') as fh:
-            fh.write(geojson_response.read())
+        with open_product(target_path, 'wb', self.compression) as fh:
+            shutil.copyfileobj(geojson_response, fh)
 
         return target_path
 
 
-class FireOutlookDownloader(Downloader):
+class FireOutlookDownloader(SessionMixin, Downloader):
     """SPC fire weather outlook downloader.
 
     Base class that extends `cartopy.io.Downloader` for SPC fire outlooks.
+    Downloaded files can be stored compressed on disk by setting ``compression``
+    to ``'gzip'`` or ``'zstd'`` (requires the zstandard package).
+
+    If ``bundle_url_template`` is set (see `use_bundles`), the archive bundling
+    every hazard of an issuance is downloaded instead and split into the files
+    of each hazard, so the other hazards are served without further requests.
     """
 
+    _SPC_BUNDLE_TEMPLATE = None
+
     FORMAT_KEYS = ('config', 'hazard', 'ftime', 'year', 'month', 'day', 'product')
 
     def __init__(self,
                  url_template,
                  target_path_template,
                  pre_downloaded_path_template,
+                 compression=None,
                  ):
         super().__init__(url_template, target_path_template, pre_downloaded_path_template)
+        compression_suffix(compression)
+        self.compression = compression
+        self.bundle_url_template = None
 
     def acquire_resource(self, target_path, format_dict):
         """Download resource."""
         target_dir = Path(target_path).parent
         target_dir.mkdir(parents=True, exist_ok=True)
 
+        if self.bundle_url_template is not None:
+            return _acquire_bundle(self, target_path, format_dict)
+
         url = self.url(format_dict)
 
-        geojson_response = self._urlopen(url)
+        availability = availability_index(format_dict)
+        geojson_response = availability.fetch(url, format_dict, self._urlopen)
 
-        with open(target_path, 'wb') as fh:
-            fh.write(geojson_response.read())
+        with open_product(target_path, 'wb', self.compression) as fh:
+            shutil.copyfileobj(geojson_response, fh)
 
         return target_path
 
@@ -161,27 +570,36 @@ class Day1OutlookDownloader(ConvectiveOutlookDownloader):
         '/day1otlk_{year:4d}{month:02d}{day:02d}_{ftime:04d}_{hazard:s}.lyr.geojson'
     )
 
+    _SPC_BUNDLE_TEMPLATE = (
+        'https://www.spc.noaa.gov/products/outlook/archive/{year:4d}'
+        '/day1otlk_{year:4d}{month:02d}{day:02d}_{ftime:04d}-shp.zip'
+    )
+
     def __init__(self,
                  url_template=_SPC_URL_TEMPLATE,
                  target_path_template=None,
                  pre_downloaded_path_template='',
+                 compression=None,
                  ):
-        super().__init__(url_template, target_path_template, pre_downloaded_path_template)
+        super().__init__(url_template, target_path_template, pre_downloaded_path_template,
+                         compression)
 
     @staticmethod
-    def default_downloader():
+    def default_downloader(compression=None):
         """Return a generic, standard, Day1OutlookDownloader instance."""
         default_spec = (
             'geoJSON', 'SPC', '{product}', '{year:4d}',
             'day1otlk_{year:4d}{month:02d}{day:02d}_{ftime:04d}_{hazard:s}.geojson'
         )
         co_path_template = str(Path('{config[data_dir]}').joinpath(*default_spec))
+        co_path_template += compression_suffix(compression)
         pre_path_template = str(
             Path('{config[pre_existing_data_dir]}').joinpath(*default_spec)
         )
 
         return Day1OutlookDownloader(target_path_template=co_path_template,
-                                     pre_downloaded_path_template=pre_path_template)
+                                     pre_downloaded_path_template=pre_path_template,
+                                     compression=compression)
 
 
 class Day2OutlookDownloader(ConvectiveOutlookDownloader):
@@ -199,27 +617,36 @@ class Day2OutlookDownloader(ConvectiveOutlookDownloader):
         '/day2otlk_{year:4d}{month:02d}{day:02d}_{ftime:04d}_{hazard:s}.lyr.geojson'
     )
 
+    _SPC_BUNDLE_TEMPLATE = (
+        'https://www.spc.noaa.gov/products/outlook/archive/{year:4d}'
+        '/day2otlk_{year:4d}{month:02d}{day:02d}_{ftime:04d}-shp.zip'
+    )
+
     def __init__(self,
                  url_template=_SPC_URL_TEMPLATE,
                  target_path_template=None,
                  pre_downloaded_path_template='',
+                 compression=None,
                  ):
-        super().__init__(url_template, target_path_template, pre_downloaded_path_template)
+        super().__init__(url_template, target_path_template, pre_downloaded_path_template,
+                         compression)
 
     @staticmethod
-    def default_downloader():
+    def default_downloader(compression=None):
         """Return a generic, standard, Day2OutlookDownloader instance."""
         default_spec = (
             'geoJSON', 'SPC', '{product}', '{year:4d}',
             'day2otlk_{year:4d}{month:02d}{day:02d}_{ftime:04d}_{hazard:s}.geojson'
         )
         co_path_template = str(Path('{config[data_dir]}').joinpath(*default_spec))
+        co_path_template += compression_suffix(compression)
         pre_path_template = str(
             Path('{config[pre_existing_data_dir]}').joinpath(*default_spec)
         )
 
         return Day2OutlookDownloader(target_path_template=co_path_template,
-                                     pre_downloaded_path_template=pre_path_template)
+                                     pre_downloaded_path_template=pre_path_template,
+                                     compression=compression)
 
 
 class Day3OutlookDownloader(ConvectiveOutlookDownloader):
@@ -238,27 +665,36 @@ class Day3OutlookDownloader(ConvectiveOutlookDownloader):
         '/day3otlk_{year:4d}{month:02d}{day:02d}_{ftime:04d}_{hazard:s}.lyr.geojson'
     )
 
+    _SPC_BUNDLE_TEMPLATE = (
+        'https://www.spc.noaa.gov/products/outlook/archive/{year:4d}'
+        '/day3otlk_{year:4d}{month:02d}{day:02d}_{ftime:04d}-shp.zip'
+    )
+
     def __init__(self,
                  url_template=_SPC_URL_TEMPLATE,
                  target_path_template=None,
                  pre_downloaded_path_template='',
+                 compression=None,
                  ):
-        super().__init__(url_template, target_path_template, pre_downloaded_path_template)
+        super().__init__(url_template, target_path_template, pre_downloaded_path_template,
+                         compression)
 
     @staticmethod
-    def default_downloader():
+    def default_downloader(compression=None):
         """Return a generic, standard, Day3OutlookDownloader instance."""
         default_spec = (
             'geoJSON', 'SPC', '{product}', '{year:4d}',
             'day3otlk_{year:4d}{month:02d}{day:02d}_{ftime:04d}_{hazard:s}.geojson'
         )
         co_path_template = str(Path('{config[data_dir]}').joinpath(*default_spec))
+        co_path_template += compression_suffix(compression)
         pre_path_template = str(
             Path('{config[pre_existing_data_dir]}').joinpath(*default_spec)
         )
 
         return Day3OutlookDownloader(target_path_template=co_path_template,
-                                     pre_downloaded_path_template=pre_path_template)
+                                     pre_downloaded_path_template=pre_path_template,
+                                     compression=compression)
 
 
 class Day4OutlookDownloader(ConvectiveOutlookDownloader):
@@ -280,21 +716,25 @@ class Day4OutlookDownloader(ConvectiveOutlookDownloader):
                  url_template=_SPC_URL_TEMPLATE,
                  target_path_template=None,
                  pre_downloaded_path_template='',
+                 compression=None,
                  ):
-        super().__init__(url_template, target_path_template, pre_downloaded_path_template)
+        super().__init__(url_template, target_path_template, pre_downloaded_path_template,
+                         compression)
 
     @staticmethod
-    def default_downloader():
+    def default_downloader(compression=None):
         """Return a generic, standard, Day4OutlookDownloader instance."""
         default_spec = ('geoJSON', 'SPC', '{product}', '{year:4d}',
                         'day4otlk_{year:4d}{month:02d}{day:02d}.geojson')
         co_path_template = str(Path('{config[data_dir]}').joinpath(*default_spec))
+        co_path_template += compression_suffix(compression)
         pre_path_template = str(
             Path('{config[pre_existing_data_dir]}').joinpath(*default_spec)
         )
 
         return Day4OutlookDownloader(target_path_template=co_path_template,
-                                     pre_downloaded_path_template=pre_path_template)
+                                     pre_downloaded_path_template=pre_path_template,
+                                     compression=compression)
 
 
 class Day5OutlookDownloader(ConvectiveOutlookDownloader):
@@ -316,21 +756,25 @@ class Day5OutlookDownloader(ConvectiveOutlookDownloader):
                  url_template=_SPC_URL_TEMPLATE,
                  target_path_template=None,
                  pre_downloaded_path_template='',
+                 compression=None,
                  ):
-        super().__init__(url_template, target_path_template, pre_downloaded_path_template)
+        super().__init__(url_template, target_path_template, pre_downloaded_path_template,
+                         compression)
 
     @staticmethod
-    def default_downloader():
+    def default_downloader(compression=None):
         """Return a generic, standard, Day5OutlookDownloader instance."""
         default_spec = ('geoJSON', 'SPC', '{product}', '{year:4d}',
                         'day5otlk_{year:4d}{month:02d}{day:02d}.geojson')
         co_path_template = str(Path('{config[data_dir]}').joinpath(*default_spec))
+        co_path_template += compression_suffix(compression)
         pre_path_template = str(
             Path('{config[pre_existing_data_dir]}').joinpath(*default_spec)
         )
 
         return Day5OutlookDownloader(target_path_template=co_path_template,
-                                     pre_downloaded_path_template=pre_path_template)
+                                     pre_downloaded_path_template=pre_path_template,
+                                     compression=compression)
 
 
 class Day6OutlookDownloader(ConvectiveOutlookDownloader):
@@ -351,21 +795,25 @@ class Day6OutlookDownloader(ConvectiveOutlookDownloader):
                  url_template=_SPC_URL_TEMPLATE,
                  target_path_template=None,
                  pre_downloaded_path_template='',
+                 compression=None,
                  ):
-        super().__init__(url_template, target_path_template, pre_downloaded_path_template)
+        super().__init__(url_template, target_path_template, pre_downloaded_path_template,
+                         compression)
 
     @staticmethod
-    def default_downloader():
+    def default_downloader(compression=None):
         """Return a generic, standard, Day6OutlookDownloader instance."""
         default_spec = ('geoJSON', 'SPC', '{product}', '{year:4d}',
                         'day6otlk_{year:4d}{month:02d}{day:02d}.geojson')
         co_path_template = str(Path('{config[data_dir]}').joinpath(*default_spec))
+        co_path_template += compression_suffix(compression)
         pre_path_template = str(
             Path('{config[pre_existing_data_dir]}').joinpath(*default_spec)
         )
 
         return Day6OutlookDownloader(target_path_template=co_path_template,
-                                     pre_downloaded_path_template=pre_path_template)
+                                     pre_downloaded_path_template=pre_path_template,
+                                     compression=compression)
 
 
 class Day7OutlookDownloader(ConvectiveOutlookDownloader):
@@ -388,21 +836,25 @@ class Day7OutlookDownloader(ConvectiveOutlookDownloader):
                  url_template=_SPC_URL_TEMPLATE,
                  target_path_template=None,
                  pre_downloaded_path_template='',
+                 compression=None,
                  ):
-        super().__init__(url_template, target_path_template, pre_downloaded_path_template)
+        super().__init__(url_template, target_path_template, pre_downloaded_path_template,
+                         compression)
 
     @staticmethod
-    def default_downloader():
+    def default_downloader(compression=None):
         """Return a generic, standard, Day6OutlookDownloader instance."""
         default_spec = ('geoJSON', 'SPC', '{product}', '{year:4d}',
                         'day7otlk_{year:4d}{month:02d}{day:02d}.geojson')
         co_path_template = str(Path('{config[data_dir]}').joinpath(*default_spec))
+        co_path_template += compression_suffix(compression)
         pre_path_template = str(
             Path('{config[pre_existing_data_dir]}').joinpath(*default_spec)
         )
 
         return Day7OutlookDownloader(target_path_template=co_path_template,
-                                     pre_downloaded_path_template=pre_path_template)
+                                     pre_downloaded_path_template=pre_path_template,
+                                     compression=compression)
 
 
 class Day8OutlookDownloader(ConvectiveOutlookDownloader):
@@ -424,21 +876,25 @@ class Day8OutlookDownloader(ConvectiveOutlookDownloader):
                  url_template=_SPC_URL_TEMPLATE,
                  target_path_template=None,
                  pre_downloaded_path_template='',
+                 compression=None,
                  ):
-        super().__init__(url_template, target_path_template, pre_downloaded_path_template)
+        super().__init__(url_template, target_path_template, pre_downloaded_path_template,
+                         compression)
 
     @staticmethod
-    def default_downloader():
+    def default_downloader(compression=None):
         """Return a generic, standard, Day8OutlookDownloader instance."""
         default_spec = ('geoJSON', 'SPC', '{product}', '{year:4d}',
                         'day8otlk_{year:4d}{month:02d}{day:02d}.geojson')
         co_path_template = str(Path('{config[data_dir]}').joinpath(*default_spec))
+        co_path_template += compression_suffix(compression)
         pre_path_template = str(
             Path('{config[pre_existing_data_dir]}').joinpath(*default_spec)
         )
 
         return Day8OutlookDownloader(target_path_template=co_path_template,
-                                     pre_downloaded_path_template=pre_path_template)
+                                     pre_downloaded_path_template=pre_path_template,
+                                     compression=compression)
 
 
 class Day1FireDownloader(FireOutlookDownloader):
@@ -456,25 +912,34 @@ class Day1FireDownloader(FireOutlookDownloader):
         '/day1fw_{year:4d}{month:02d}{day:02d}_{ftime:04d}_{hazard:s}.lyr.geojson'
     )
 
+    _SPC_BUNDLE_TEMPLATE = (
+        'https://www.spc.noaa.gov/products/fire_wx/{year:4d}'
+        '/day1fw_{year:4d}{month:02d}{day:02d}_{ftime:04d}-shp.zip'
+    )
+
     def __init__(self,
                  url_template=_SPC_URL_TEMPLATE,
                  target_path_template=None,
                  pre_downloaded_path_template='',
+                 compression=None,
                  ):
-        super().__init__(url_template, target_path_template, pre_downloaded_path_template)
+        super().__init__(url_template, target_path_template, pre_downloaded_path_template,
+                         compression)
 
     @staticmethod
-    def default_downloader():
+    def default_downloader(compression=None):
         """Return a generic, standard, Day1FireDownloader instance."""
         default_spec = ('geoJSON', 'SPC', '{product}', '{year:4d}',
                         'day1fw_{year:4d}{month:02d}{day:02d}_{ftime:04d}_{hazard:s}.geojson')
         fo_path_template = str(Path('{config[data_dir]}').joinpath(*default_spec))
+        fo_path_template += compression_suffix(compression)
         pre_path_template = str(
             Path('{config[pre_existing_data_dir]}').joinpath(*default_spec)
         )
 
         return Day1FireDownloader(target_path_template=fo_path_template,
-                                  pre_downloaded_path_template=pre_path_template)
+                                  pre_downloaded_path_template=pre_path_template,
+                                  compression=compression)
 
 
 class Day2FireDownloader(FireOutlookDownloader):
@@ -492,25 +957,34 @@ class Day2FireDownloader(FireOutlookDownloader):
         '/day2fw_{year:4d}{month:02d}{day:02d}_{ftime:04d}_{hazard:s}.lyr.geojson'
     )
 
+    _SPC_BUNDLE_TEMPLATE = (
+        'https://www.spc.noaa.gov/products/fire_wx/{year:4d}'
+        '/day2fw_{year:4d}{month:02d}{day:02d}_{ftime:04d}-shp.zip'
+    )
+
     def __init__(self,
                  url_template=_SPC_URL_TEMPLATE,
                  target_path_template=None,
                  pre_downloaded_path_template='',
+                 compression=None,
                  ):
-        super().__init__(url_template, target_path_template, pre_downloaded_path_template)
+        super().__init__(url_template, target_path_template, pre_downloaded_path_template,
+                         compression)
 
     @staticmethod
-    def default_downloader():
+    def default_downloader(compression=None):
         """Return a generic, standard, Day1FireDownloader instance."""
         default_spec = ('geoJSON', 'SPC', '{product}', '{year:4d}',
                         'day2fw_{year:4d}{month:02d}{day:02d}_{ftime:04d}_{hazard:s}.geojson')
         fo_path_template = str(Path('{config[data_dir]}').joinpath(*default_spec))
+        fo_path_template += compression_suffix(compression)
         pre_path_template = str(
             Path('{config[pre_existing_data_dir]}').joinpath(*default_spec)
         )
 
         return Day2FireDownloader(target_path_template=fo_path_template,
-                                  pre_downloaded_path_template=pre_path_template)
+                                  pre_downloaded_path_template=pre_path_template,
+                                  compression=compression)
 
 
 class Day3FireDownloader(FireOutlookDownloader):
@@ -532,21 +1006,25 @@ class Day3FireDownloader(FireOutlookDownloader):
                  url_template=_SPC_URL_TEMPLATE,
                  target_path_template=None,
                  pre_downloaded_path_template='',
+                 compression=None,
                  ):
-        super().__init__(url_template, target_path_template, pre_downloaded_path_template)
+        super().__init__(url_template, target_path_template, pre_downloaded_path_template,
+                         compression)
 
     @staticmethod
-    def default_downloader():
+    def default_downloader(compression=None):
         """Return a generic, standard, Day1FireDownloader instance."""
         default_spec = ('geoJSON', 'SPC', '{product}', '{year:4d}',
                         'day3fw_{year:4d}{month:02d}{day:02d}_1200_{hazard:s}.geojson')
         fo_path_template = str(Path('{config[data_dir]}').joinpath(*default_spec))
+        fo_path_template += compression_suffix(compression)
         pre_path_template = str(
             Path('{config[pre_existing_data_dir]}').joinpath(*default_spec)
         )
 
         return Day3FireDownloader(target_path_template=fo_path_template,
-                                  pre_downloaded_path_template=pre_path_template)
+                                  pre_downloaded_path_template=pre_path_template,
+                                  compression=compression)
 
 
 class Day4FireDownloader(FireOutlookDownloader):
@@ -567,21 +1045,25 @@ class Day4FireDownloader(FireOutlookDownloader):
                  url_template=_SPC_URL_TEMPLATE,
                  target_path_template=None,
                  pre_downloaded_path_template='',
+                 compression=None,
                  ):
-        super().__init__(url_template, target_path_template, pre_downloaded_path_template)
+        super().__init__(url_template, target_path_template, pre_downloaded_path_template,
+                         compression)
 
     @staticmethod
-    def default_downloader():
+    def default_downloader(compression=None):
         """Return a generic, standard, Day1FireDownloader instance."""
         default_spec = ('geoJSON', 'SPC', '{product}', '{year:4d}',
                         'day4fw_{year:4d}{month:02d}{day:02d}_1200_{hazard:s}.geojson')
         fo_path_template = str(Path('{config[data_dir]}').joinpath(*default_spec))
+        fo_path_template += compression_suffix(compression)
         pre_path_template = str(
             Path('{config[pre_existing_data_dir]}').joinpath(*default_spec)
         )
 
         return Day4FireDownloader(target_path_template=fo_path_template,
-                                  pre_downloaded_path_template=pre_path_template)
+                                  pre_downloaded_path_template=pre_path_template,
+                                  compression=compression)
 
 
 class Day5FireDownloader(FireOutlookDownloader):
@@ -603,21 +1085,25 @@ class Day5FireDownloader(FireOutlookDownloader):
                  url_template=_SPC_URL_TEMPLATE,
                  target_path_template=None,
                  pre_downloaded_path_template='',
+                 compression=None,
                  ):
-        super().__init__(url_template, target_path_template, pre_downloaded_path_template)
+        super().__init__(url_template, target_path_template, pre_downloaded_path_template,
+                         compression)
 
     @staticmethod
-    def default_downloader():
+    def default_downloader(compression=None):
         """Return a generic, standard, Day1FireDownloader instance."""
         default_spec = ('geoJSON', 'SPC', '{product}', '{year:4d}',
                         'day5fw_{year:4d}{month:02d}{day:02d}_1200_{hazard:s}.geojson')
         fo_path_template = str(Path('{config[data_dir]}').joinpath(*default_spec))
+        fo_path_template += compression_suffix(compression)
         pre_path_template = str(
             Path('{config[pre_existing_data_dir]}').joinpath(*default_spec)
         )
 
         return Day5FireDownloader(target_path_template=fo_path_template,
-                                  pre_downloaded_path_template=pre_path_template)
+                                  pre_downloaded_path_template=pre_path_template,
+                                  compression=compression)
 
 
 class Day6FireDownloader(FireOutlookDownloader):
@@ -639,21 +1125,25 @@ class Day6FireDownloader(FireOutlookDownloader):
                  url_template=_SPC_URL_TEMPLATE,
                  target_path_template=None,
                  pre_downloaded_path_template='',
+                 compression=None,
                  ):
-        super().__init__(url_template, target_path_template, pre_downloaded_path_template)
+        super().__init__(url_template, target_path_template, pre_downloaded_path_template,
+                         compression)
 
     @staticmethod
-    def default_downloader():
+    def default_downloader(compression=None):
         """Return a generic, standard, Day1FireDownloader instance."""
         default_spec = ('geoJSON', 'SPC', '{product}', '{year:4d}',
                         'day6fw_{year:4d}{month:02d}{day:02d}_1200_{hazard:s}.geojson')
         fo_path_template = str(Path('{config[data_dir]}').joinpath(*default_spec))
+        fo_path_template += compression_suffix(compression)
         pre_path_template = str(
             Path('{config[pre_existing_data_dir]}').joinpath(*default_spec)
         )
 
         return Day6FireDownloader(target_path_template=fo_path_template,
-                                  pre_downloaded_path_template=pre_path_template)
+                                  pre_downloaded_path_template=pre_path_template,
+                                  compression=compression)
 
 
 class Day7FireDownloader(FireOutlookDownloader):
@@ -675,21 +1165,25 @@ class Day7FireDownloader(FireOutlookDownloader):
                  url_template=_SPC_URL_TEMPLATE,
                  target_path_template=None,
                  pre_downloaded_path_template='',
+                 compression=None,
                  ):
-        super().__init__(url_template, target_path_template, pre_downloaded_path_template)
+        super().__init__(url_template, target_path_template, pre_downloaded_path_template,
+                         compression)
 
     @staticmethod
-    def default_downloader():
+    def default_downloader(compression=None):
         """Return a generic, standard, Day1FireDownloader instance."""
         default_spec = ('geoJSON', 'SPC', '{product}', '{year:4d}',
                         'day7fw_{year:4d}{month:02d}{day:02d}_1200_{hazard:s}.geojson')
         fo_path_template = str(Path('{config[data_dir]}').joinpath(*default_spec))
+        fo_path_template += compression_suffix(compression)
         pre_path_template = str(
             Path('{config[pre_existing_data_dir]}').joinpath(*default_spec)
         )
 
         return Day7FireDownloader(target_path_template=fo_path_template,
-                                  pre_downloaded_path_template=pre_path_template)
+                                  pre_downloaded_path_template=pre_path_template,
+                                  compression=compression)
 
 
 class Day8FireDownloader(FireOutlookDownloader):
@@ -711,21 +1205,25 @@ class Day8FireDownloader(FireOutlookDownloader):
                  url_template=_SPC_URL_TEMPLATE,
                  target_path_template=None,
                  pre_downloaded_path_template='',
+                 compression=None,
                  ):
-        super().__init__(url_template, target_path_template, pre_downloaded_path_template)
+        super().__init__(url_template, target_path_template, pre_downloaded_path_template,
+                         compression)
 
     @staticmethod
-    def default_downloader():
+    def default_downloader(compression=None):
         """Return a generic, standard, Day1FireDownloader instance."""
         default_spec = ('geoJSON', 'SPC', '{product}', '{year:4d}',
                         'day8fw_{year:4d}{month:02d}{day:02d}_1200_{hazard:s}.geojson')
         fo_path_template = str(Path('{config[data_dir]}').joinpath(*default_spec))
+        fo_path_template += compression_suffix(compression)
         pre_path_template = str(
             Path('{config[pre_existing_data_dir]}').joinpath(*default_spec)
         )
 
         return Day8FireDownloader(target_path_template=fo_path_template,
-                                  pre_downloaded_path_template=pre_path_template)
+                                  pre_downloaded_path_template=pre_path_template,
+                                  compression=compression)
 
 
 # Add a generic SPC Convective Outlook geoJSON downloader to the config dictionary's
@@ -765,3 +1263,23 @@ config['downloaders'].setdefault(_day5_fw_key, Day5FireDownloader.default_downlo
 config['downloaders'].setdefault(_day6_fw_key, Day6FireDownloader.default_downloader())
 config['downloaders'].setdefault(_day7_fw_key, Day7FireDownloader.default_downloader())
 config['downloaders'].setdefault(_day8_fw_key, Day8FireDownloader.default_downloader())
+
+
+def use_bundles(enabled=True):
+    """Download outlooks as issuance bundles holding every hazard.
+
+    Sets ``bundle_url_template`` of the registered Day 1-3 convective and Day
+    1-2 fire outlook downloaders, for which SPC publishes zipped shapefiles of
+    all hazards of an issuance. The first request for any hazard of an issuance
+    then downloads the bundle once and stores a geoJSON file per hazard, where
+    `spc_convective` and `spc_fire` find them.
+
+    Parameters
+    ----------
+    enabled : bool
+        Whether to download bundles. False restores per-hazard downloads.
+    """
+    for downloader in config['downloaders'].values():
+        if isinstance(downloader, (ConvectiveOutlookDownloader, FireOutlookDownloader)):
+            downloader.bundle_url_template = (downloader._SPC_BUNDLE_TEMPLATE if enabled
+                                              else None)
@@ -0,0 +1,180 @@
+# Copyright (c) 2025 Nathan Wendt.
+# Distributed under the terms of the BSD 3-Clause License.
+# SPDX-License-Identifier: BSD-3-Clause
+"""Geometry cache shared read-only between worker processes."""
+
+import mmap
+import os
+from pathlib import Path
+import tempfile
+import threading
+
+import numpy as np
+import shapely
+
+from spcartopy.io.shapereader import SPCRecordTable
+
+
+class SharedGeometryCache:
+    """Parsed SPC geometries stored once as WKB in a memory-mapped segment.
+
+    The parent process parses the products once with `SharedGeometryCache.build`.
+    Worker processes receive only the segment path and a small index when the
+    cache is pickled, and memory map the segment read-only. The WKB is held once
+    in the shared page cache, so memory scales with the number of products
+    rather than products times workers. Geometries are decoded in a worker only
+    when its features ask for them.
+
+    Parameters
+    ----------
+    path : str or `pathlib.Path`
+        Path to the WKB segment.
+    index : dict
+        Maps feature keys to ``(offsets, columns)``, where ``offsets`` gives the
+        byte offsets of each geometry in the segment and ``columns`` are the
+        `spcartopy.io.shapereader.SPCRecordTable` attribute columns.
+    """
+
+    def __init__(self, path, index):
+        self.path = Path(path)
+        self.index = index
+        self._mmap = None
+        self._owner = False
+        self._lock = threading.Lock()
+
+    @classmethod
+    def build(cls, features, directory=None):
+        """Parse features once and write their geometries to a new segment.
+
+        Parameters
+        ----------
+        features : iterable of `spcartopy.feature` instances
+            Outlook and MD features to share.
+        directory : str or `pathlib.Path`, optional
+            Directory of the segment. Defaults to the system temporary directory.
+            On Linux, ``'/dev/shm'`` keeps the segment in memory.
+
+        Returns
+        -------
+        `SharedGeometryCache`
+            Cache owning the segment; the segment is removed by `close`.
+        """
+        index = {}
+        fd, path = tempfile.mkstemp(suffix='.wkb', prefix='spcartopy-', dir=directory)
+        with os.fdopen(fd, 'wb') as fh:
+            position = 0
+            for feature in features:
+                key = feature._key
+                if key in index:
+                    continue
+
+                if hasattr(feature, '_record_table'):
+                    table = feature._record_table()
+                else:
+                    table = SPCRecordTable(np.array(list(feature.geometries()), dtype=object),
+                                           {})
+                blobs = shapely.to_wkb(table.geometry_array)
+                sizes = np.fromiter((len(blob) for blob in blobs), dtype=np.int64,
+                                    count=len(blobs))
+                offsets = position + np.concatenate(([0], np.cumsum(sizes)))
+                fh.write(b''.join(blobs))
+                position = int(offsets[-1])
+                index[key] = (offsets, table.columns)
+
+        cache = cls(path, index)
+        cache._owner = True
+
+        return cache
+
+    def __getstate__(self):
+        """Pickle only the segment path and index."""
+        return {'path': self.path, 'index': self.index}
+
+    def __setstate__(self, state):
+        """Restore a cache that attaches to the segment when first used."""
+        self.__init__(state['path'], state['index'])
+
+    def __contains__(self, key):
+        """Check if a feature key is in the cache."""
+        return key in self.index
+
+    def __enter__(self):
+        """Return the cache for use as a context manager."""
+        return self
+
+    def __exit__(self, *exc):
+        """Close the cache when leaving the context."""
+        self.close()
+
+    def _buffer(self):
+        """Memory map the segment read-only."""
+        with self._lock:
+            if self._mmap is None:
+                with open(self.path, 'rb') as fh:
+                    if os.fstat(fh.fileno()).st_size == 0:
+                        self._mmap = b''
+                    else:
+                        self._mmap = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+        return self._mmap
+
+    def record_table(self, key):
+        """Decode the geometries and records of a feature.
+
+        Parameters
+        ----------
+        key : tuple
+            Key of the feature (``feature._key``).
+
+        Returns
+        -------
+        `spcartopy.io.shapereader.SPCRecordTable`
+        """
+        offsets, columns = self.index[key]
+        buffer = self._buffer()
+        blobs = np.array([buffer[start:end] for start, end in zip(offsets[:-1], offsets[1:],
+                                                                  strict=True)],
+                         dtype=object)
+
+        return SPCRecordTable(shapely.from_wkb(blobs), columns)
+
+    def invalidate(self, match):
+        """Stop serving the features whose key matches a predicate.
+
+        Only the index of this process is changed; the segment is left as is.
+
+        Parameters
+        ----------
+        match : callable
+            Function of a feature key returning True if it should be removed.
+
+        Returns
+        -------
+        int
+            Number of removed features.
+        """
+        keys = [key for key in self.index if match(key)]
+        for key in keys:
+            del self.index[key]
+
+        return len(keys)
+
+    def attach(self):
+        """Use the cache for features created in this process.
+
+        Called in worker processes (e.g., from a pool initializer). Features
+        whose key is in the cache read their geometries from the segment instead
+        of downloading and parsing the product.
+        """
+        import spcartopy.feature
+
+        spcartopy.feature._SPC_SHARED_CACHE = self
+
+    def close(self):
+        """Release the memory map and remove the segment if this cache created it."""
+        if isinstance(self._mmap, mmap.mmap):
+            self._mmap.close()
+        self._mmap = None
+        if self._owner:
+            self.path.unlink(missing_ok=True)
+            self._owner = False
@@ -5,11 +5,19 @@
 
 import json
 from pathlib import Path
+import warnings
 
 from cartopy import config
 from cartopy.io import Downloader
 
-from spcartopy.io.decode import mcd_to_geojson
+from spcartopy.io.availability import availability_index
+from spcartopy.io.compression import compression_suffix, open_product
+from spcartopy.io.decode import iter_md_features, iter_pts_outlooks, mcd_to_geojson
+from spcartopy.io.session import SessionMixin
+import spcartopy.io.shapereader  # noqa: F401 (registers the outlook downloaders)
+
+# Nominal issuance times (ftime) of the SPC outlook files of each day.
+_OUTLOOK_FTIMES = {1: (100, 600, 1300, 1630, 2000), 2: (600, 1730), 3: (730, 1930)}
 
 
 def spc_md(year, number):
@@ -22,8 +30,112 @@ def spc_md(year, number):
     return md_downloader.path(format_dict)
 
 
-class MDDownloader(Downloader):
-    """MD Downloader."""
+def cache_mds(source, overwrite=False):
+    """Decode the MDs of a concatenated text feed into the local MD cache.
+
+    Each MD is written where `spc_md` (and so `spcartopy.feature.MDFeature`)
+    looks for it, using the registered MD downloader and its compression, so
+    no MD of the feed needs to be downloaded again. MDs whose year of issuance
+    cannot be decoded are skipped with a warning.
+
+    Parameters
+    ----------
+    source : str, `pathlib.Path` or binary file-like object
+        Feed of concatenated products. See `spcartopy.io.decode.iter_md_features`.
+    overwrite : bool
+        Whether to replace MDs that are already cached.
+
+    Returns
+    -------
+    list of `pathlib.Path`
+        Paths of the written MDs.
+    """
+    md_downloader = Downloader.from_config(('geoJSON', 'MD'))
+    paths = []
+    for feature in iter_md_features(source):
+        year = feature['properties'].pop('year')
+        number = feature['properties']['number']
+        if year is None:
+            warnings.warn(f'Skipping MD {number} without an issuance time.', stacklevel=2)
+            continue
+
+        path = Path(md_downloader.target_path({'config': config, 'year': year,
+                                               'number': number}))
+        if path.exists() and not overwrite:
+            continue
+        path.parent.mkdir(parents=True, exist_ok=True)
+        collection = {'type': 'FeatureCollection', 'features': [feature]}
+        with open_product(path, 'wb', md_downloader.compression) as fh:
+            fh.write(json.dumps(collection).encode('utf-8'))
+        paths.append(path)
+
+    return paths
+
+
+def _nominal_ftime(day, issue):
+    """Return the file ``ftime`` closest to the issuance time of an outlook."""
+    minutes = issue.hour * 60 + issue.minute
+
+    def _distance(ftime):
+        delta = abs(ftime // 100 * 60 + ftime % 100 - minutes)
+        return min(delta, 1440 - delta)
+
+    return min(_OUTLOOK_FTIMES[day], key=_distance)
+
+
+def cache_pts(source, overwrite=False, clip=None):
+    """Decode the PTS outlooks of a text feed into the local outlook cache.
+
+    Outlooks issued before the SPC geoJSON archive are only available as PTS
+    products. Each hazard of each Day 1-3 outlook of the feed is written where
+    `spcartopy.io.shapereader.spc_convective` (and so
+    `spcartopy.feature.ConvectiveOutlookFeature`) looks for it, so those
+    outlooks are served like any other year.
+
+    Parameters
+    ----------
+    source : str, `pathlib.Path` or binary file-like object
+        Feed of concatenated products. See `spcartopy.io.decode.iter_pts_outlooks`.
+    overwrite : bool
+        Whether to replace outlooks that are already cached.
+    clip : shapely geometry, optional
+        Area to which the outlook areas are clipped. See
+        `spcartopy.io.decode.pts_to_geojson`.
+
+    Returns
+    -------
+    list of `pathlib.Path`
+        Paths of the written outlooks.
+    """
+    paths = []
+    for outlook in iter_pts_outlooks(source, clip=clip):
+        day = outlook['day']
+        if day not in _OUTLOOK_FTIMES:
+            continue
+
+        downloader = Downloader.from_config(('geoJSON', f'Day{day}Outlook'))
+        issue = outlook['issue']
+        format_dict = {'config': config, 'ftime': _nominal_ftime(day, issue),
+                       'year': issue.year, 'month': issue.month, 'day': issue.day,
+                       'product': 'convective_outlook'}
+        for hazard, collection in outlook['hazards'].items():
+            path = Path(downloader.target_path({**format_dict, 'hazard': hazard}))
+            if path.exists() and not overwrite:
+                continue
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open_product(path, 'wb', downloader.compression) as fh:
+                fh.write(json.dumps(collection).encode('utf-8'))
+            paths.append(path)
+
+    return paths
+
+
+class MDDownloader(SessionMixin, Downloader):
+    """MD Downloader.
+
+    Decoded MDs can be stored compressed on disk by setting ``compression``
+    to ``'gzip'`` or ``'zstd'`` (requires the zstandard package).
+    """
 
     FORMAT_KEYS = ('config', 'year', 'number')
 
@@ -35,8 +147,11 @@ class MDDownloader(Downloader):
                  url_template=_SPC_URL_TEMPLATE,
                  target_path_template=None,
                  pre_downloaded_path_template='',
+                 compression=None,
                  ):
         super().__init__(url_template, target_path_template, pre_downloaded_path_template)
+        compression_suffix(compression)
+        self.compression = compression
 
     def acquire_resource(self, target_path, format_dict):
         """Download resource."""
@@ -45,25 +160,28 @@ class MDDownloader(Downloader):
 
         url = self.url(format_dict)
 
-        md_txt = self._urlopen(url)
+        availability = availability_index(format_dict)
+        md_txt = availability.fetch(url, format_dict, self._urlopen)
 
-        with open(target_path, 'w') as fh:
-            json.dump(mcd_to_geojson(md_txt.read()), fh)
+        with open_product(target_path, 'wb', self.compression) as fh:
+            fh.write(json.dumps(mcd_to_geojson(md_txt.read())).encode('utf-8'))
 
         return target_path
 
     @staticmethod
-    def default_downloader():
+    def default_downloader(compression=None):
         """Return a generic, standard, MD downloader instance."""
         default_spec = ('geoJSON', 'SPC', 'md', '{year:4d}',
                         'md{number:04d}.geojson')
         md_path_template = str(Path('{config[data_dir]}').joinpath(*default_spec))
+        md_path_template += compression_suffix(compression)
         pre_path_template = str(
             Path('{config[pre_existing_data_dir]}').joinpath(*default_spec)
         )
 
         return MDDownloader(target_path_template=md_path_template,
-                            pre_downloaded_path_template=pre_path_template)
+                            pre_downloaded_path_template=pre_path_template,
+                            compression=compression)
 
 
 _md_key = ('geoJSON', 'MD')
@@ -3,134 +3,111 @@
 # SPDX-License-Identifier: BSD-3-Clause
 """Helper function for generating legends for SPC outlook plots."""
 
+from functools import cache
+
 from matplotlib.patches import Rectangle
 
 from spcartopy.colors import Outlooks
 
+# Hatching used for legend entries of specific categories. Significant
+# severe categories are hatched without fill.
+_LEGEND_HATCHES = {
+    'tornado': {'SIGN': 'SS'},
+    'wind': {'SIGN': 'SS'},
+    'hail': {'SIGN': 'SS'},
+    'any_severe': {'SIGN': 'SS'},
+    'fire_weather_categorical': {'IDRT': 'xx', 'SDRT': 'xx'},
+}
+
+
+@cache
+def _legend_specs(table):
+    """Build and cache the legend entries of an `Outlooks` category table."""
+    hatches = _LEGEND_HATCHES.get(table, {})
+    specs = []
+    for _cat, props in getattr(Outlooks, table).items():
+        kwargs = {'ec': props['ec'], 'fc': props['fc']}
+        if _cat in hatches:
+            kwargs['hatch'] = hatches[_cat]
+            if hatches[_cat] == 'SS':
+                kwargs['fc'] = 'none'
+        specs.append((_cat, props['label'], tuple(kwargs.items())))
+
+    return tuple(specs)
+
+
+def outlook_legend(table, categories=None):
+    """Legend for any `Outlooks` category table.
+
+    Legend entries are built once per table and cached. Each call returns new
+    handles, so they can be modified freely.
+
+    Parameters
+    ----------
+    table : str
+        Name of the `spcartopy.colors.Outlooks` category table, e.g.,
+        ``'categorical'`` or ``'tornado'``.
+    categories : iterable of str, optional
+        Only include these categories, e.g., the ``short_labels`` of a feature,
+        for a compact legend. Defaults to all categories in the table.
+
+    Returns
+    -------
+    handles, labels : tuple of list
+    """
+    if categories is not None:
+        categories = set(categories)
 
-def convective_all_hazards():
-    """Legend for all hazards probabilistic outlook."""
     handles = []
     labels = []
-    for _cat, props in Outlooks.hail.items():
-        if _cat == 'SIGN':
-            handles.append(Rectangle((0, 0), 3, 2, ec=props['ec'],
-                                     fc='none', hatch='SS'))
-        else:
-            handles.append(Rectangle((0, 0), 3, 2, ec=props['ec'],
-                                     fc=props['fc']))
-        labels.append(props['label'])
+    for _cat, label, kwargs in _legend_specs(table):
+        if categories is None or _cat in categories:
+            handles.append(Rectangle((0, 0), 3, 2, **dict(kwargs)))
+            labels.append(label)
 
     return (handles, labels)
 
 
-def convective_categorical():
-    """Legend for categorical convective outlook."""
-    handles = []
-    labels = []
-    for _cat, props in Outlooks.categorical.items():
-        handles.append(Rectangle((0, 0), 3, 2, ec=props['ec'],
-                                 fc=props['fc']))
-        labels.append(props['label'])
+def convective_all_hazards(categories=None):
+    """Legend for all hazards probabilistic outlook."""
+    return outlook_legend('hail', categories)
 
-    return (handles, labels)
 
+def convective_categorical(categories=None):
+    """Legend for categorical convective outlook."""
+    return outlook_legend('categorical', categories)
 
-def convective_extended():
-    """Legend for extended convective outlook."""
-    handles = []
-    labels = []
-    for _cat, props in Outlooks.extended_severe.items():
-        handles.append(Rectangle((0, 0), 3, 2, ec=props['ec'],
-                                 fc=props['fc']))
-        labels.append(props['label'])
 
-    return (handles, labels)
+def convective_extended(categories=None):
+    """Legend for extended convective outlook."""
+    return outlook_legend('extended_severe', categories)
 
 
-def convective_hail():
+def convective_hail(categories=None):
     """Legend for probabilistic hail outlook."""
-    handles = []
-    labels = []
-    for _cat, props in Outlooks.hail.items():
-        if _cat == 'SIGN':
-            handles.append(Rectangle((0, 0), 3, 2, ec=props['ec'],
-                                     fc='none', hatch='SS'))
-        else:
-            handles.append(Rectangle((0, 0), 3, 2, ec=props['ec'],
-                                     fc=props['fc']))
-        labels.append(props['label'])
-
-    return (handles, labels)
+    return outlook_legend('hail', categories)
 
 
-def convective_tornado():
+def convective_tornado(categories=None):
     """Legend for probabilistic tornado outlook."""
-    handles = []
-    labels = []
-    for _cat, props in Outlooks.tornado.items():
-        if _cat == 'SIGN':
-            handles.append(Rectangle((0, 0), 3, 2, ec=props['ec'],
-                                     fc='none', hatch='SS'))
-        else:
-            handles.append(Rectangle((0, 0), 3, 2, ec=props['ec'],
-                                     fc=props['fc']))
-        labels.append(props['label'])
-
-    return (handles, labels)
+    return outlook_legend('tornado', categories)
 
 
-def convective_wind():
+def convective_wind(categories=None):
     """Legend for probabilistic wind outlook."""
-    handles = []
-    labels = []
-    for _cat, props in Outlooks.wind.items():
-        if _cat == 'SIGN':
-            handles.append(Rectangle((0, 0), 3, 2, ec=props['ec'],
-                                     fc='none', hatch='SS'))
-        else:
-            handles.append(Rectangle((0, 0), 3, 2, ec=props['ec'],
-                                     fc=props['fc']))
-        labels.append(props['label'])
+    return outlook_legend('wind', categories)
 
-    return (handles, labels)
 
-
-def fire_categorical():
+def fire_categorical(categories=None):
     """Legend for categorical fire outlook."""
-    handles = []
-    labels = []
-    for _cat, props in Outlooks.fire_weather_categorical.items():
-        if _cat in ['IDRT', 'SDRT']:
-            handles.append(Rectangle((0, 0), 3, 2, ec=props['ec'],
-                                     fc=props['fc'], hatch='xx'))
-        else:
-            handles.append(Rectangle((0, 0), 3, 2, ec=props['ec'],
-                                     fc=props['fc']))
-        labels.append(props['label'])
-
-    return (handles, labels)
+    return outlook_legend('fire_weather_categorical', categories)
 
 
-def extended_fire_categorical():
+def extended_fire_categorical(categories=None):
     """Legend for extended fire outlook."""
-    handles = []
-    labels = []
-    for _cat, props in Outlooks.extended_fire_weather_categorical.items():
-        handles.append(Rectangle((0, 0), 3, 2, ec=props['ec'],
-                                 fc=props['fc']))
-        labels.append(props['label'])
-
-    return (handles, labels)
+    return outlook_legend('extended_fire_weather_categorical', categories)
 
 
-def extended_fire_probability():
+def extended_fire_probability(categories=None):
     """Legend for fire probabilistic outlook."""
-    handles = []
-    labels = []
-    for _cat, props in Outlooks.extended_fire_weather_probability.items():
-        handles.append(Rectangle((0, 0), 3, 2, ec=props['ec'],
-                                 fc=props['fc']))
-        labels.append(props['label'])
-
-    return (handles, labels)
+    return outlook_legend('extended_fire_weather_probability', categories)
@@ -0,0 +1,307 @@
+# Copyright (c) 2025 Nathan Wendt.
+# Distributed under the terms of the BSD 3-Clause License.
+# SPDX-License-Identifier: BSD-3-Clause
+"""Point time-series index of SPC outlooks."""
+
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from functools import partial
+import json
+import warnings
+
+import numpy as np
+import shapely
+
+from spcartopy.colors import Outlooks
+import spcartopy.stats as stats
+
+# Categorical outlook labels from lowest to highest.
+CATEGORICAL_LABELS = tuple(reversed(Outlooks.categorical))
+
+# Default grid extent (lon/lat) covering CONUS.
+CONUS_EXTENT = (-125., -66., 24., 50.)
+
+_POOL_CENTERS = None
+
+
+def _outlook_id(feature_class, args):
+    """Return a string identifying the arguments of an outlook."""
+    return json.dumps([feature_class.__name__, args], sort_keys=True)
+
+
+def _convective_day(feature):
+    """Return the convective day (12Z to 12Z) of an outlook as days since the epoch.
+
+    The day is taken from the ``VALID`` time of the records. Without records, it
+    is derived from the issuance date and outlook day; Day 1 outlooks issued
+    before 0600Z belong to the previous day.
+    """
+    table = feature._record_table()
+    if len(table) and 'VALID' in table.columns:
+        valid = datetime.strptime(str(table.column('VALID')[0]), '%Y%m%d%H%M')
+        day = valid - timedelta(hours=12)
+    else:
+        day = feature.timestamp + timedelta(days=feature.fday - 1)
+        if feature.fday == 1 and feature.ftime < 600:
+            day -= timedelta(days=1)
+
+    return np.datetime64(day.date(), 'D').astype(np.int64)
+
+
+def _outlook_hits(feature, lon, lat, labels):
+    """Return the day, and the cells and level of each cell, covered by an outlook."""
+    levels = np.zeros(lon.shape, dtype=np.uint8)
+    for label, geometry in stats.category_geometries(feature, feature.crs).items():
+        if label not in labels:
+            continue
+        xmin, ymin, xmax, ymax = geometry.bounds
+        candidates = np.flatnonzero((lon >= xmin) & (lon <= xmax)
+                                    & (lat >= ymin) & (lat <= ymax))
+        shapely.prepare(geometry)
+        inside = candidates[shapely.contains_xy(geometry, lon[candidates], lat[candidates])]
+        levels[inside] = np.maximum(levels[inside], labels.index(label) + 1)
+
+    cells = np.flatnonzero(levels)
+
+    return _convective_day(feature), cells.astype(np.int32), levels[cells]
+
+
+def _init_index_worker(lon, lat, shared_cache):
+    """Store the grid cell centers and attach the shared cache once per worker process."""
+    global _POOL_CENTERS
+    _POOL_CENTERS = (lon, lat)
+    if shared_cache is not None:
+        shared_cache.attach()
+
+
+def _index_worker(feature_class, labels, args):
+    """Build an outlook in a worker process and find the cells it covers.
+
+    Returns
+    -------
+    hits : tuple or None
+        Day, cells and levels of the outlook, or None if it failed.
+    error : str or None
+        Why the outlook failed.
+    """
+    try:
+        feature = feature_class(**args) if isinstance(args, dict) else feature_class(*args)
+        return _outlook_hits(feature, *_POOL_CENTERS, labels), None
+    except Exception as error:
+        # An unavailable or broken outlook must not discard the rest of the archive.
+        return None, f'{type(error).__name__}: {error}'
+
+
+class PointIndex:
+    """Index of the outlook categories covering each grid cell over time.
+
+    Outlooks are rasterized once onto a regular longitude/latitude grid (a cell
+    is covered when its center lies within a category). For each cell, the
+    index holds a sorted run-list of ``(date, level)`` hits, where the level is
+    the highest category of ``labels`` covering the cell that day. Point and
+    time-series queries then only slice these arrays, without opening any
+    outlook.
+
+    Parameters
+    ----------
+    extent : tuple of float
+        Grid extent as ``(xmin, xmax, ymin, ymax)`` in degrees.
+    resolution : float
+        Grid spacing in degrees.
+    labels : sequence of str
+        Outlook labels indexed, from lowest to highest, e.g., ``CATEGORICAL_LABELS``
+        or ``('0.02', '0.05', '0.10')`` for tornado outlooks.
+    """
+
+    def __init__(self, extent=CONUS_EXTENT, resolution=0.1, labels=CATEGORICAL_LABELS):
+        self.extent = tuple(extent)
+        self.resolution = resolution
+        self.labels = tuple(labels)
+        xmin, xmax, ymin, ymax = self.extent
+        self.shape = (round((ymax - ymin) / resolution), round((xmax - xmin) / resolution))
+
+        self._outlooks = set()
+        self._cells = np.empty(0, dtype=np.int32)
+        self._days = np.empty(0, dtype=np.int64)
+        self._levels = np.empty(0, dtype=np.uint8)
+        self._offsets = np.zeros(self.shape[0] * self.shape[1] + 1, dtype=np.int64)
+
+    def __len__(self):
+        """Return the number of indexed outlooks."""
+        return len(self._outlooks)
+
+    def _centers(self):
+        """Return the longitude and latitude of the cell centers, flattened."""
+        xmin, _, ymin, _ = self.extent
+        lon = xmin + (np.arange(self.shape[1]) + 0.5) * self.resolution
+        lat = ymin + (np.arange(self.shape[0]) + 0.5) * self.resolution
+        lon, lat = np.meshgrid(lon, lat)
+
+        return lon.ravel(), lat.ravel()
+
+    def cell(self, lon, lat):
+        """Return the flat index of the cell containing a point.
+
+        Raises
+        ------
+        ValueError
+            If the point is outside the grid.
+        """
+        xmin, _, ymin, _ = self.extent
+        row = int(np.floor((lat - ymin) / self.resolution))
+        col = int(np.floor((lon - xmin) / self.resolution))
+        if not (0 <= row < self.shape[0] and 0 <= col < self.shape[1]):
+            raise ValueError(f'Point ({lon}, {lat}) is outside the index extent.')
+
+        return row * self.shape[1] + col
+
+    def _add(self, hits):
+        """Merge ``(day, cells, levels)`` hits into the run-lists."""
+        hits = list(hits)
+        if not hits:
+            return
+
+        cells = np.concatenate([self._cells, *(cells for _, cells, _ in hits)])
+        days = np.concatenate([self._days, *(np.full(len(cells), day)
+                                             for day, cells, _ in hits)])
+        levels = np.concatenate([self._levels, *(levels for _, _, levels in hits)])
+
+        # Sort by cell and day, keeping the highest level of each day.
+        order = np.lexsort((levels, days, cells))
+        cells, days, levels = cells[order], days[order], levels[order]
+        last = np.ones(len(cells), dtype=bool)
+        last[:-1] = (cells[1:] != cells[:-1]) | (days[1:] != days[:-1])
+
+        self._cells, self._days, self._levels = cells[last], days[last], levels[last]
+        self._offsets = np.searchsorted(self._cells, np.arange(len(self._offsets)))
+
+    def update(self, feature_class, outlooks, max_workers=None, shared_cache=None):
+        """Add outlooks to the index in parallel.
+
+        Outlooks that are already indexed are skipped, so the index can be kept
+        current by passing the whole archive or only the newest outlooks.
+        Outlooks that fail (e.g., are unavailable) are skipped with a warning
+        and tried again by the next update. Each outlook is indexed under its
+        convective day (12Z to 12Z), taken from its ``VALID`` time.
+
+        Parameters
+        ----------
+        feature_class : type
+            Outlook feature class, e.g.,
+            `spcartopy.feature.Day1ConvectiveOutlookFeature`.
+        outlooks : iterable of tuple or dict
+            Positional (tuple) or keyword (dict) arguments used to create each
+            outlook with ``feature_class``, e.g., ``(1630, 2020, 4, 12, 'cat')``.
+        max_workers : int, optional
+            Number of worker processes. Defaults to the number of processors.
+        shared_cache : `spcartopy.io.sharedcache.SharedGeometryCache`, optional
+            Cache of already parsed outlooks attached by each worker.
+
+        Returns
+        -------
+        int
+            Number of outlooks added, not counting those skipped.
+        """
+        new = {}
+        for args in outlooks:
+            outlook_id = _outlook_id(feature_class, args)
+            if outlook_id not in self._outlooks:
+                new[outlook_id] = args
+        if not new:
+            return 0
+
+        worker = partial(_index_worker, feature_class, self.labels)
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_index_worker,
+                                 initargs=(*self._centers(), shared_cache)) as executor:
+            results = list(executor.map(worker, new.values(), chunksize=16))
+
+        skipped = {outlook_id: error
+                   for outlook_id, (_, error) in zip(new, results, strict=True)
+                   if error is not None}
+        if skipped:
+            warnings.warn(f'Skipped {len(skipped)} outlooks that could not be indexed: '
+                          f'{skipped}', stacklevel=2)
+        self._add(hits for hits, error in results if error is None)
+        self._outlooks.update(outlook_id for outlook_id in new if outlook_id not in skipped)
+
+        return len(new) - len(skipped)
+
+    @classmethod
+    def build(cls, feature_class, outlooks, extent=CONUS_EXTENT, resolution=0.1,
+              labels=CATEGORICAL_LABELS, max_workers=None, shared_cache=None):
+        """Build an index of many outlooks in parallel.
+
+        See `PointIndex` and `PointIndex.update` for the parameters.
+
+        Returns
+        -------
+        `PointIndex`
+        """
+        index = cls(extent, resolution, labels)
+        index.update(feature_class, outlooks, max_workers, shared_cache)
+
+        return index
+
+    def query(self, lon, lat, min_label=None, start=None, end=None):
+        """Get the days a point was covered by an outlook category.
+
+        Parameters
+        ----------
+        lon, lat : float
+            Longitude and latitude of the point.
+        min_label : str, optional
+            Lowest label returned, e.g., ``'SLGT'`` for slight risk or higher.
+            Defaults to all labels.
+        start, end : str or `datetime.date`, optional
+            First and last day (inclusive) returned.
+
+        Returns
+        -------
+        dates : `numpy.ndarray` of ``datetime64[D]``
+            Days on which the point was covered.
+        labels : `numpy.ndarray` of str
+            Highest label covering the point on each day.
+        """
+        cell = self.cell(lon, lat)
+        hits = slice(self._offsets[cell], self._offsets[cell + 1])
+        days = self._days[hits]
+        levels = self._levels[hits]
+
+        keep = np.ones(len(days), dtype=bool)
+        if min_label is not None:
+            keep &= levels >= self.labels.index(min_label) + 1
+        if start is not None:
+            keep &= days >= np.datetime64(start, 'D').astype(np.int64)
+        if end is not None:
+            keep &= days <= np.datetime64(end, 'D').astype(np.int64)
+
+        return (days[keep].astype('datetime64[D]'),
+                np.array(self.labels, dtype=str)[levels[keep] - 1])
+
+    def save(self, path):
+        """Save the index to a compressed NumPy ``.npz`` file."""
+        np.savez_compressed(
+            path, extent=np.array(self.extent), resolution=self.resolution,
+            labels=np.array(self.labels, dtype=str),
+            outlooks=np.array(sorted(self._outlooks), dtype=str),
+            cells=self._cells, days=self._days, levels=self._levels,
+        )
+
+    @classmethod
+    def load(cls, path):
+        """Load an index saved with `PointIndex.save`.
+
+        Returns
+        -------
+        `PointIndex`
+        """
+        with np.load(path) as data:
+            index = cls(data['extent'].tolist(), float(data['resolution']),
+                        data['labels'].tolist())
+            index._outlooks = set(data['outlooks'].tolist())
+            index._cells = data['cells']
+            index._days = data['days']
+            index._levels = data['levels']
+        index._offsets = np.searchsorted(index._cells, np.arange(len(index._offsets)))
+
+        return index
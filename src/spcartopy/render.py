@@ -0,0 +1,250 @@
+# Copyright (c) 2025 Nathan Wendt.
+# Distributed under the terms of the BSD 3-Clause License.
+# SPDX-License-Identifier: BSD-3-Clause
+"""Render maps of SPC features with a content-addressed image cache."""
+
+import hashlib
+import io
+import json
+import os
+from pathlib import Path
+import tempfile
+import threading
+import time
+
+import cartopy.crs
+from matplotlib.figure import Figure
+
+from spcartopy.cache import SingleFlightCache
+from spcartopy.io.compression import open_product
+import spcartopy.legends as legends
+
+# Version of the render key; bump when rendering changes the output images.
+_RENDER_KEY_VERSION = 1
+
+_SPC_DIGEST_CACHE = SingleFlightCache()
+
+
+def _product_digest(feature):
+    """Return the SHA-256 digest of the (decompressed) product file of a feature."""
+    path = Path(feature._path())
+    stat = path.stat()
+
+    def _digest():
+        digest = hashlib.sha256()
+        with open_product(path) as fh:
+            for chunk in iter(lambda: fh.read(1024**2), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    # Rewrites within one mtime tick still change the size, inode or ctime.
+    key = (path.resolve(), stat.st_mtime_ns, stat.st_ctime_ns, stat.st_size, stat.st_ino)
+
+    return _SPC_DIGEST_CACHE.get_or_create(key, _digest)
+
+
+def _base_feature_id(feature):
+    """Describe a base map feature (e.g., `cartopy.feature.STATES`) for render keys."""
+    return [type(feature).__name__, getattr(feature, 'category', None),
+            getattr(feature, 'name', None), str(getattr(feature, 'scale', None)),
+            feature.kwargs]
+
+
+def render_key(features, projection, extent=None, legend=None, base_features=(),
+               figsize=(8, 6), dpi=100, fmt='png'):
+    """Compute the key of a rendered map in an `ImageCache`.
+
+    The key is a hash of the product content of every feature (so reissued
+    products get a new key), the feature keys and style, and the map options.
+    Matplotlib is not used.
+
+    Parameters
+    ----------
+    See `render_map`.
+
+    Returns
+    -------
+    str
+        Hexadecimal SHA-256 digest.
+    """
+    parts = [
+        _RENDER_KEY_VERSION,
+        [[type(feature).__name__, _product_digest(feature), repr(feature._key),
+          feature.kwargs] for feature in features],
+        projection.proj4_init,
+        None if extent is None else [float(value) for value in extent],
+        legend,
+        [_base_feature_id(feature) for feature in base_features],
+        list(figsize), dpi, fmt,
+    ]
+    data = json.dumps(parts, sort_keys=True, default=repr).encode('utf-8')
+
+    return hashlib.sha256(data).hexdigest()
+
+
+def _touch(path):
+    """Mark a cached image as used now, at full (not file system) time resolution."""
+    now = time.time_ns()
+    os.utime(path, ns=(now, now))
+
+
+class ImageCache:
+    """Directory of rendered images addressed by their render key.
+
+    Images are stored in ``directory/{key[:2]}/{key}.{fmt}``. Reading an image
+    marks it as recently used, and the least recently used images are removed
+    once the images take more than ``max_bytes``. Images are written atomically,
+    so caches can be shared between processes.
+
+    Parameters
+    ----------
+    directory : str or `pathlib.Path`
+        Cache directory.
+    max_bytes : int
+        Maximum total size of the cached images in bytes.
+    """
+
+    def __init__(self, directory, max_bytes=512 * 1024**2):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._size = sum(path.stat().st_size for path in self._images())
+
+    def _images(self):
+        """Iterate over the cached image files."""
+        return (path for path in self.directory.glob('*/*') if not path.name.startswith('.'))
+
+    def _path(self, key, fmt):
+        """Return the path of an image."""
+        return self.directory / key[:2] / f'{key}.{fmt}'
+
+    def __contains__(self, key):
+        """Check if a PNG image is cached for a key."""
+        return self._path(key, 'png').exists()
+
+    def __len__(self):
+        """Return the number of cached images."""
+        return sum(1 for _ in self._images())
+
+    def get(self, key, fmt='png'):
+        """Get a cached image.
+
+        Returns
+        -------
+        bytes or None
+            Encoded image, or None if it is not cached.
+        """
+        path = self._path(key, fmt)
+        try:
+            data = path.read_bytes()
+            _touch(path)
+        except FileNotFoundError:
+            return None
+
+        return data
+
+    def put(self, key, data, fmt='png'):
+        """Cache an image, evicting the least recently used images if needed."""
+        path = self._path(key, fmt)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix='.')
+        with os.fdopen(fd, 'wb') as fh:
+            fh.write(data)
+        previous = path.stat().st_size if path.exists() else 0
+        os.replace(tmp, path)
+        _touch(path)
+
+        with self._lock:
+            self._size += len(data) - previous
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _evict(self):
+        """Remove the least recently used images until within ``max_bytes``."""
+        images = []
+        for path in self._images():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            images.append((stat.st_mtime_ns, stat.st_size, path))
+
+        self._size = sum(size for _, size, _ in images)
+        for _, size, path in sorted(images):
+            if self._size <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            self._size -= size
+
+    def clear(self):
+        """Remove all cached images."""
+        with self._lock:
+            for path in self._images():
+                path.unlink(missing_ok=True)
+            self._size = 0
+
+
+def render_map(features, projection, extent=None, legend=None, base_features=(),
+               figsize=(8, 6), dpi=100, fmt='png', cache=None):
+    """Render SPC features on a map.
+
+    With a ``cache``, maps already rendered from the same product content and
+    options are read from disk without using matplotlib.
+
+    Parameters
+    ----------
+    features : iterable of `spcartopy.feature` instances
+        Outlook and MD features to draw, in order.
+    projection : `cartopy.crs.Projection`
+        Map projection.
+    extent : tuple of float, optional
+        Map extent as ``(xmin, xmax, ymin, ymax)`` in longitude and latitude.
+        Defaults to the extent of the features.
+    legend : str, optional
+        Name of the `spcartopy.legends` function drawing the legend, e.g.,
+        ``'convective_categorical'``.
+    base_features : iterable of `cartopy.feature.Feature`, optional
+        Base map features drawn beneath the SPC features.
+    figsize : tuple of float
+        Figure size in inches.
+    dpi : float
+        Resolution in dots per inch.
+    fmt : str
+        Image format passed to `matplotlib.figure.Figure.savefig`.
+    cache : `ImageCache`, optional
+        Cache of rendered images.
+
+    Returns
+    -------
+    bytes
+        Encoded image.
+    """
+    features = list(features)
+    base_features = list(base_features)
+    if cache is not None:
+        key = render_key(features, projection, extent, legend, base_features, figsize, dpi,
+                         fmt)
+        data = cache.get(key, fmt)
+        if data is not None:
+            return data
+
+    figure = Figure(figsize=figsize, dpi=dpi)
+    ax = figure.add_subplot(projection=projection)
+    if extent is not None:
+        ax.set_extent(extent, crs=cartopy.crs.PlateCarree())
+    for feature in base_features:
+        ax.add_feature(feature)
+    for feature in features:
+        ax.add_feature(feature)
+    if legend is not None:
+        ax.legend(*getattr(legends, legend)(), loc='lower right')
+
+    buffer = io.BytesIO()
+    figure.savefig(buffer, format=fmt, dpi=dpi)
+    data = buffer.getvalue()
+
+    if cache is not None:
+        cache.put(key, data, fmt)
+
+    return data
@@ -0,0 +1,318 @@
+# Copyright (c) 2025 Nathan Wendt.
+# Distributed under the terms of the BSD 3-Clause License.
+# SPDX-License-Identifier: BSD-3-Clause
+"""Equal-area statistics for SPC outlooks."""
+
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import cartopy.crs
+import numpy as np
+import shapely
+
+from spcartopy.cache import SingleFlightCache
+
+EQUAL_AREA_CRS = cartopy.crs.AlbersEqualArea(
+    central_longitude=-96, central_latitude=37.5, standard_parallels=(29.5, 45.5)
+)
+
+_SPC_EQUAL_AREA_CACHE = SingleFlightCache()
+
+_M2_PER_KM2 = 1e6
+
+_POOL_WEIGHTS = None
+
+
+def to_equal_area(geometries, src_crs, crs=EQUAL_AREA_CRS):
+    """Project geometries into an equal-area CRS.
+
+    All coordinates are transformed in a single vectorized call.
+
+    Parameters
+    ----------
+    geometries : array_like of shapely geometries
+        Geometries to project.
+    src_crs : `cartopy.crs.CRS`
+        CRS of the input geometries.
+    crs : `cartopy.crs.CRS`
+        Target equal-area CRS. Defaults to a CONUS Albers equal-area projection.
+
+    Returns
+    -------
+    `numpy.ndarray` of shapely geometries
+    """
+    def _transform(coords):
+        return crs.transform_points(src_crs, coords[:, 0], coords[:, 1])[:, :2]
+
+    return shapely.transform(np.asarray(geometries, dtype=object), _transform)
+
+
+def category_geometries(feature, crs=EQUAL_AREA_CRS):
+    """Get the geometry of each outlook category in a (typically equal-area) CRS.
+
+    Records sharing a ``LABEL`` are merged so that each category is represented
+    by a single geometry. Results are cached per outlook and CRS.
+
+    Parameters
+    ----------
+    feature : `spcartopy.feature.ConvectiveOutlookFeature` or
+              `spcartopy.feature.FireOutlookFeature`
+        Outlook to process.
+    crs : `cartopy.crs.CRS`
+        Target CRS. Defaults to a CONUS Albers equal-area projection.
+
+    Returns
+    -------
+    dict
+        Mapping of category label to shapely geometry.
+    """
+    def _merge():
+        records = list(feature.records())
+        labels = np.array([rec.attributes['LABEL'] for rec in records], dtype=object)
+        projected = to_equal_area([rec.geometry for rec in records], feature.crs, crs)
+
+        geometries = {}
+        for label in dict.fromkeys(labels):
+            merged = shapely.union_all(projected[labels == label])
+            geometries[label] = shapely.make_valid(merged)
+        return geometries
+
+    return _SPC_EQUAL_AREA_CACHE.get_or_create((feature._key, crs), _merge)
+
+
+def _outlook_label(feature):
+    """Return a short description of an outlook for tabular output."""
+    return {'fday': feature.fday, 'ftime': feature.ftime,
+            'date': feature.timestamp.date(), 'hazard': feature.hazard}
+
+
+def compare_sequence(features, crs=EQUAL_AREA_CRS):
+    """Compare each outlook in a sequence with the one before it.
+
+    All pairs are differenced in a single set of vectorized shapely operations,
+    so whole seasons of outlooks can be processed in one call.
+
+    Parameters
+    ----------
+    features : sequence of `spcartopy.feature.ConvectiveOutlookFeature` or
+               `spcartopy.feature.FireOutlookFeature`
+        Outlooks ordered by issuance, e.g., the 0600, 1300, 1630 and 2000 UTC
+        Day 1 outlooks of a day.
+    crs : `cartopy.crs.CRS`
+        Equal-area CRS used for the comparison. Defaults to a CONUS Albers
+        equal-area projection.
+
+    Returns
+    -------
+    list of dict
+        One row per pair of outlooks and category. Rows contain the
+        identification of both outlooks (``from_*`` and ``to_*`` keys), the
+        ``category``, areas in square kilometers (``area_before``,
+        ``area_after``, ``area_added``, ``area_removed``, ``area_change``) and the
+        ``added``, ``removed`` and ``symmetric_difference`` geometries in ``crs``.
+        The rows can be passed directly to `pandas.DataFrame`.
+    """
+    features = list(features)
+    pairs = []
+    before = []
+    after = []
+    for first, second in zip(features[:-1], features[1:], strict=True):
+        first_geoms = category_geometries(first, crs)
+        second_geoms = category_geometries(second, crs)
+        for label in dict.fromkeys([*first_geoms, *second_geoms]):
+            pairs.append((first, second, label))
+            before.append(first_geoms.get(label, shapely.Polygon()))
+            after.append(second_geoms.get(label, shapely.Polygon()))
+
+    before = np.array(before, dtype=object)
+    after = np.array(after, dtype=object)
+    added = shapely.difference(after, before)
+    removed = shapely.difference(before, after)
+    sym_diff = shapely.symmetric_difference(before, after)
+    area_before = shapely.area(before) / _M2_PER_KM2
+    area_after = shapely.area(after) / _M2_PER_KM2
+    area_added = shapely.area(added) / _M2_PER_KM2
+    area_removed = shapely.area(removed) / _M2_PER_KM2
+
+    rows = []
+    for i, (first, second, label) in enumerate(pairs):
+        row = {f'from_{key}': value for key, value in _outlook_label(first).items()}
+        row.update({f'to_{key}': value for key, value in _outlook_label(second).items()})
+        row.update({
+            'category': label,
+            'area_before': area_before[i],
+            'area_after': area_after[i],
+            'area_added': area_added[i],
+            'area_removed': area_removed[i],
+            'area_change': area_after[i] - area_before[i],
+            'added': added[i],
+            'removed': removed[i],
+            'symmetric_difference': sym_diff[i],
+        })
+        rows.append(row)
+
+    return rows
+
+
+def compare_outlooks(first, second, crs=EQUAL_AREA_CRS):
+    """Compare two outlooks category by category.
+
+    Parameters
+    ----------
+    first, second : `spcartopy.feature.ConvectiveOutlookFeature` or
+                    `spcartopy.feature.FireOutlookFeature`
+        Earlier and later outlook.
+    crs : `cartopy.crs.CRS`
+        Equal-area CRS used for the comparison. Defaults to a CONUS Albers
+        equal-area projection.
+
+    Returns
+    -------
+    list of dict
+        One row per category. See `compare_sequence` for the row contents.
+    """
+    return compare_sequence([first, second], crs)
+
+
+def category_areas(feature, crs=EQUAL_AREA_CRS):
+    """Compute the area covered by each outlook category.
+
+    Parameters
+    ----------
+    feature : `spcartopy.feature.ConvectiveOutlookFeature` or
+              `spcartopy.feature.FireOutlookFeature`
+        Outlook to process.
+    crs : `cartopy.crs.CRS`
+        Equal-area CRS used to compute areas. Defaults to a CONUS Albers
+        equal-area projection.
+
+    Returns
+    -------
+    dict
+        Mapping of category label to area in square kilometers.
+    """
+    geometries = category_geometries(feature, crs)
+    areas = shapely.area(np.array(list(geometries.values()), dtype=object)) / _M2_PER_KM2
+
+    return dict(zip(geometries, areas.tolist(), strict=True))
+
+
+def category_exposure(feature, weights, x, y, weights_crs=None):
+    """Sum a weight raster over each outlook category.
+
+    Grid cells are counted toward a category when their center lies within the
+    category geometry. Typical weights are population counts or grid cell
+    areas.
+
+    Parameters
+    ----------
+    feature : `spcartopy.feature.ConvectiveOutlookFeature` or
+              `spcartopy.feature.FireOutlookFeature`
+        Outlook to process.
+    weights : array_like
+        2D weight raster.
+    x, y : array_like
+        Coordinates of the raster cell centers. Either 1D coordinate vectors
+        along the columns and rows of ``weights`` or 2D arrays of the same shape.
+    weights_crs : `cartopy.crs.CRS`, optional
+        CRS of the raster coordinates. Defaults to the outlook CRS (longitude
+        and latitude).
+
+    Returns
+    -------
+    dict
+        Mapping of category label to the sum of weights within the category.
+    """
+    weights = np.asarray(weights)
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if x.ndim == 1 and y.ndim == 1:
+        x, y = np.meshgrid(x, y)
+    if x.shape != weights.shape or y.shape != weights.shape:
+        raise ValueError('Raster coordinates must match the shape of weights.')
+    weights_crs = feature.crs if weights_crs is None else weights_crs
+
+    exposure = {}
+    for label, geometry in category_geometries(feature, weights_crs).items():
+        xmin, ymin, xmax, ymax = geometry.bounds
+        candidates = (x >= xmin) & (x <= xmax) & (y >= ymin) & (y <= ymax)
+        inside = np.zeros_like(candidates)
+        shapely.prepare(geometry)
+        inside[candidates] = shapely.contains_xy(geometry, x[candidates], y[candidates])
+        exposure[label] = weights[inside].sum()
+
+    return exposure
+
+
+def _outlook_stats(feature, crs=EQUAL_AREA_CRS, weights=None):
+    """Return table rows of category areas (and exposure) for an outlook."""
+    areas = category_areas(feature, crs)
+    if weights is not None:
+        exposure = category_exposure(feature, *weights)
+
+    rows = []
+    for label, area in areas.items():
+        row = _outlook_label(feature)
+        row.update({'category': label, 'area': area})
+        if weights is not None:
+            row['exposure'] = exposure[label]
+        rows.append(row)
+
+    return rows
+
+
+def _init_stats_worker(weights, shared_cache):
+    """Store the weight raster once per worker process."""
+    global _POOL_WEIGHTS
+    _POOL_WEIGHTS = weights
+    if shared_cache is not None:
+        shared_cache.attach()
+
+
+def _stats_worker(feature_class, crs, args):
+    """Build an outlook in a worker process and compute its statistics."""
+    feature = feature_class(**args) if isinstance(args, dict) else feature_class(*args)
+
+    return _outlook_stats(feature, crs, _POOL_WEIGHTS)
+
+
+def outlook_stats(feature_class, outlooks, crs=EQUAL_AREA_CRS, weights=None,
+                  max_workers=None, shared_cache=None):
+    """Compute category areas (and exposure) for many outlooks in parallel.
+
+    Each outlook is loaded and processed in a pool of worker processes, which
+    makes it practical to run over long date ranges.
+
+    Parameters
+    ----------
+    feature_class : type
+        Outlook feature class, e.g.,
+        `spcartopy.feature.Day1ConvectiveOutlookFeature`.
+    outlooks : iterable of tuple or dict
+        Positional (tuple) or keyword (dict) arguments used to create each
+        outlook with ``feature_class``, e.g., ``(1630, 2020, 4, 12, 'cat')``.
+    crs : `cartopy.crs.CRS`
+        Equal-area CRS used to compute areas. Defaults to a CONUS Albers
+        equal-area projection.
+    weights : tuple, optional
+        Weight raster used to compute exposure given as ``(weights, x, y)`` or
+        ``(weights, x, y, weights_crs)``. See `category_exposure`. The raster is
+        sent to each worker process only once.
+    max_workers : int, optional
+        Number of worker processes. Defaults to the number of processors.
+    shared_cache : `spcartopy.io.sharedcache.SharedGeometryCache`, optional
+        Cache of already parsed outlooks attached by each worker. Outlooks in the
+        cache are neither downloaded nor parsed by the workers.
+
+    Returns
+    -------
+    list of dict
+        One row per outlook and category with the outlook identification,
+        ``category``, ``area`` in square kilometers and, if ``weights`` is
+        given, ``exposure``.
+    """
+    worker = partial(_stats_worker, feature_class, crs)
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_stats_worker,
+                             initargs=(weights, shared_cache)) as executor:
+        results = executor.map(worker, outlooks)
+        return [row for rows in results for row in rows]
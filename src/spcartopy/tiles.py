@@ -0,0 +1,395 @@
+# Copyright (c) 2025 Nathan Wendt.
+# Distributed under the terms of the BSD 3-Clause License.
+# SPDX-License-Identifier: BSD-3-Clause
+"""Web map tiles of SPC products."""
+
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+import io
+import math
+from pathlib import Path
+
+import cartopy.crs
+from matplotlib.figure import Figure
+import numpy as np
+import shapely
+
+from spcartopy.feature import MDFeature
+
+WEB_MERCATOR = cartopy.crs.Mercator.GOOGLE
+
+# Attributes of SPC outlook records kept in vector tiles.
+TILE_ATTRIBUTES = ('LABEL', 'LABEL2', 'fill', 'stroke')
+
+_WEB_MERCATOR_HALF_WIDTH = 20037508.342789244
+
+_POOL_LAYERS = None
+_POOL_RENDERER = None
+
+
+def tile_bounds(z, x, y):
+    """Get the Web Mercator bounds of an XYZ tile.
+
+    Parameters
+    ----------
+    z, x, y : int
+        Zoom level, column and row of the tile.
+
+    Returns
+    -------
+    tuple of float
+        ``(xmin, ymin, xmax, ymax)`` in meters.
+    """
+    size = 2 * _WEB_MERCATOR_HALF_WIDTH / 2**z
+    xmin = -_WEB_MERCATOR_HALF_WIDTH + x * size
+    ymax = _WEB_MERCATOR_HALF_WIDTH - y * size
+
+    return (xmin, ymax - size, xmin + size, ymax)
+
+
+def tiles_for_bounds(bounds, zoom):
+    """Get the XYZ tiles at a zoom level covering Web Mercator bounds.
+
+    Parameters
+    ----------
+    bounds : tuple of float
+        ``(xmin, ymin, xmax, ymax)`` in meters.
+    zoom : int
+        Zoom level.
+
+    Returns
+    -------
+    list of tuple
+        ``(z, x, y)`` of each tile.
+    """
+    num_tiles = 2**zoom
+    size = 2 * _WEB_MERCATOR_HALF_WIDTH / num_tiles
+    xmin, ymin, xmax, ymax = bounds
+
+    def _tile_range(low, high):
+        # An upper edge falling exactly on a tile boundary does not include the
+        # next tile.
+        first = math.floor(low / size)
+        last = max(math.ceil(high / size) - 1, first)
+        return range(max(first, 0), min(last, num_tiles - 1) + 1)
+
+    cols = _tile_range(xmin + _WEB_MERCATOR_HALF_WIDTH, xmax + _WEB_MERCATOR_HALF_WIDTH)
+    rows = _tile_range(_WEB_MERCATOR_HALF_WIDTH - ymax, _WEB_MERCATOR_HALF_WIDTH - ymin)
+
+    return [(zoom, x, y) for x in cols for y in rows]
+
+
+def _to_web_mercator(geometries, src_crs):
+    """Project geometries to Web Mercator in a single vectorized call."""
+    def _transform(coords):
+        return WEB_MERCATOR.transform_points(src_crs, coords[:, 0], coords[:, 1])[:, :2]
+
+    return shapely.transform(np.asarray(geometries, dtype=object), _transform)
+
+
+def _layer_name(feature):
+    """Return the tile layer name of a feature."""
+    if isinstance(feature, MDFeature):
+        return 'md'
+
+    name = f'{feature.product}_day{feature.fday}'
+    if feature.hazard is not None:
+        name += f'_{feature.hazard}'
+
+    return name
+
+
+def tile_layers(features):
+    """Collect the geometries and attributes of features into tile layers.
+
+    Outlooks are placed in layers named after the product, day and hazard
+    (e.g., ``convective_outlook_day1_cat``) and keep the SPC ``LABEL``,
+    ``LABEL2``, ``fill`` and ``stroke`` attributes. MDs share the ``md`` layer
+    and carry their ``year`` and ``number``.
+
+    Parameters
+    ----------
+    features : iterable of `spcartopy.feature` instances
+        Outlook and MD features.
+
+    Returns
+    -------
+    dict
+        Mapping of layer name to a tuple of an array of Web Mercator geometries
+        and a list of attribute dictionaries.
+    """
+    layers = {}
+    for feature in features:
+        if isinstance(feature, MDFeature):
+            props = {'year': feature.year, 'number': feature.number}
+            items = [(geom, dict(props)) for geom in feature.geometries()]
+        else:
+            items = [(rec.geometry, {key: rec.attributes[key] for key in TILE_ATTRIBUTES
+                                     if key in rec.attributes})
+                     for rec in feature.records()]
+
+        geometries, attributes = layers.setdefault(_layer_name(feature), ([], []))
+        geometries.extend(_to_web_mercator([geom for geom, _ in items], feature.crs))
+        attributes.extend(attrs for _, attrs in items)
+
+    return {name: (np.array(geometries, dtype=object), attributes)
+            for name, (geometries, attributes) in layers.items()}
+
+
+def mvt_tile(layers, z, x, y, extent=4096, buffer=64):
+    """Encode a Mapbox Vector Tile.
+
+    Geometries are clipped to the tile (plus a buffer) and simplified to the
+    resolution of the tile. Requires the mapbox-vector-tile package.
+
+    Parameters
+    ----------
+    layers : dict
+        Tile layers as returned by `tile_layers`.
+    z, x, y : int
+        Zoom level, column and row of the tile.
+    extent : int
+        Number of integer coordinates along each side of the tile.
+    buffer : int
+        Width of the buffer around the tile in tile coordinates.
+
+    Returns
+    -------
+    bytes or None
+        Encoded tile, or None if no geometry intersects the tile.
+    """
+    try:
+        import mapbox_vector_tile
+    except ImportError:
+        raise ImportError(
+            'Vector tile export requires the mapbox-vector-tile package.'
+        ) from None
+
+    bounds = tile_bounds(z, x, y)
+    tile_unit = (bounds[2] - bounds[0]) / extent
+    pad = buffer * tile_unit
+    clip_bounds = (bounds[0] - pad, bounds[1] - pad, bounds[2] + pad, bounds[3] + pad)
+    clip_box = shapely.box(*clip_bounds)
+
+    def _quantize(coords):
+        return np.round((coords - bounds[:2]) / tile_unit)
+
+    mvt_layers = []
+    for name, (geometries, attributes) in layers.items():
+        hits = np.flatnonzero(shapely.intersects(geometries, clip_box))
+        if not hits.size:
+            continue
+        clipped = shapely.clip_by_rect(geometries[hits], *clip_bounds)
+        simplified = shapely.simplify(clipped, tile_unit, preserve_topology=True)
+        quantized = shapely.transform(simplified, _quantize)
+        mvt_features = [{'geometry': geom, 'properties': attributes[i]}
+                        for i, geom in zip(hits, quantized, strict=True)
+                        if not geom.is_empty]
+        if mvt_features:
+            mvt_layers.append({'name': name, 'features': mvt_features})
+
+    if not mvt_layers:
+        return None
+
+    return mapbox_vector_tile.encode(mvt_layers, default_options={'extents': extent})
+
+
+def _init_tile_worker(layers):
+    """Store the tile layers once per worker process."""
+    global _POOL_LAYERS
+    _POOL_LAYERS = layers
+
+
+def _mvt_worker(directory, extent, buffer, tile):
+    """Encode a vector tile in a worker process and write it to disk."""
+    z, x, y = tile
+    data = mvt_tile(_POOL_LAYERS, z, x, y, extent=extent, buffer=buffer)
+    if data is None:
+        return None
+
+    path = Path(directory) / f'{z:d}' / f'{x:d}' / f'{y:d}.mvt'
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+
+    return path
+
+
+def mvt_pyramid(features, zooms, directory, extent=4096, buffer=64, max_workers=None):
+    """Write a pyramid of Mapbox Vector Tiles for SPC features.
+
+    Tiles are written to ``directory/{z}/{x}/{y}.mvt``. Only tiles that contain
+    geometry are written. Tiles are encoded in parallel in a pool of worker
+    processes.
+
+    Parameters
+    ----------
+    features : iterable of `spcartopy.feature` instances
+        Outlook and MD features.
+    zooms : iterable of int
+        Zoom levels to generate.
+    directory : str or `pathlib.Path`
+        Root directory of the tile pyramid.
+    extent : int
+        Number of integer coordinates along each side of a tile.
+    buffer : int
+        Width of the buffer around each tile in tile coordinates.
+    max_workers : int, optional
+        Number of worker processes. Defaults to the number of processors.
+
+    Returns
+    -------
+    list of `pathlib.Path`
+        Paths of the written tiles.
+    """
+    layers = tile_layers(features)
+    if not layers:
+        return []
+    bounds = shapely.total_bounds(np.concatenate([geoms for geoms, _ in layers.values()]))
+    tiles = [tile for zoom in zooms for tile in tiles_for_bounds(bounds, zoom)]
+
+    worker = partial(_mvt_worker, directory, extent, buffer)
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_tile_worker,
+                             initargs=(layers,)) as executor:
+        return [path for path in executor.map(worker, tiles, chunksize=16)
+                if path is not None]
+
+
+class TileRenderer:
+    """Render raster map tiles of SPC features.
+
+    A single figure with the base map and all SPC features is created when the
+    renderer is built and then reused for every tile. SPC features are drawn
+    as pre-styled collections whose Web Mercator paths are cached, so
+    rendering a tile only changes the map extent and rasterizes. Tiles that
+    do not intersect any SPC geometry are skipped using an envelope check.
+
+    Parameters
+    ----------
+    features : iterable of `spcartopy.feature` instances
+        Outlook and MD features to draw.
+    base_features : iterable of `cartopy.feature.Feature`, optional
+        Base map features (e.g., state borders) drawn beneath the SPC features.
+    tile_size : int
+        Width and height of the tiles in pixels.
+    """
+
+    def __init__(self, features, base_features=(), tile_size=256):
+        self.tile_size = tile_size
+        self.figure = Figure(figsize=(1, 1), dpi=tile_size)
+        self.ax = self.figure.add_axes((0, 0, 1, 1), projection=WEB_MERCATOR)
+        self.ax.set_axis_off()
+        self.ax.patch.set_visible(False)
+        self.figure.patch.set_visible(False)
+
+        for feature in base_features:
+            self.ax.add_feature(feature)
+
+        extents = []
+        for feature in features:
+            collection = feature.path_collection(WEB_MERCATOR)
+            self.ax.add_collection(collection, autolim=False)
+            extents.extend(path.get_extents().extents for path in collection.get_paths())
+        self._envelopes = np.array(extents).reshape(-1, 4)
+
+    def intersects(self, z, x, y):
+        """Check whether any SPC geometry envelope intersects a tile."""
+        xmin, ymin, xmax, ymax = tile_bounds(z, x, y)
+        env = self._envelopes
+
+        return bool(np.any((env[:, 0] <= xmax) & (env[:, 2] >= xmin)
+                           & (env[:, 1] <= ymax) & (env[:, 3] >= ymin)))
+
+    def render(self, z, x, y, fmt='png'):
+        """Render a tile.
+
+        Parameters
+        ----------
+        z, x, y : int
+            Zoom level, column and row of the tile.
+        fmt : str
+            Image format passed to `matplotlib.figure.Figure.savefig`.
+
+        Returns
+        -------
+        bytes or None
+            Encoded image, or None if no SPC geometry intersects the tile.
+        """
+        if not self.intersects(z, x, y):
+            return None
+
+        xmin, ymin, xmax, ymax = tile_bounds(z, x, y)
+        self.ax.set_xlim(xmin, xmax)
+        self.ax.set_ylim(ymin, ymax)
+
+        buffer = io.BytesIO()
+        self.figure.savefig(buffer, format=fmt, dpi=self.tile_size, transparent=True)
+
+        return buffer.getvalue()
+
+
+def _init_raster_worker(features, base_features, tile_size, shared_cache):
+    """Build the tile renderer once per worker process."""
+    global _POOL_RENDERER
+    if shared_cache is not None:
+        shared_cache.attach()
+    _POOL_RENDERER = TileRenderer(features, base_features, tile_size)
+
+
+def _raster_worker(directory, tile):
+    """Render a raster tile in a worker process and write it to disk."""
+    z, x, y = tile
+    data = _POOL_RENDERER.render(z, x, y)
+    if data is None:
+        return None
+
+    path = Path(directory) / f'{z:d}' / f'{x:d}' / f'{y:d}.png'
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+
+    return path
+
+
+def raster_pyramid(features, zooms, directory, base_features=(), tile_size=256,
+                   max_workers=None, shared_cache=None):
+    """Write a pyramid of PNG raster tiles for SPC features.
+
+    Tiles are written to ``directory/{z}/{x}/{y}.png``. Each worker process
+    builds one `TileRenderer` and reuses it for all of its tiles. Only tiles
+    that intersect SPC geometries are rendered.
+
+    Parameters
+    ----------
+    features : iterable of `spcartopy.feature` instances
+        Outlook and MD features.
+    zooms : iterable of int
+        Zoom levels to generate.
+    directory : str or `pathlib.Path`
+        Root directory of the tile pyramid.
+    base_features : iterable of `cartopy.feature.Feature`, optional
+        Base map features drawn beneath the SPC features.
+    tile_size : int
+        Width and height of the tiles in pixels.
+    max_workers : int, optional
+        Number of worker processes. Defaults to the number of processors.
+    shared_cache : `spcartopy.io.sharedcache.SharedGeometryCache`, optional
+        Cache of the feature geometries attached by each worker, so workers do
+        not parse the products themselves.
+
+    Returns
+    -------
+    list of `pathlib.Path`
+        Paths of the written tiles.
+    """
+    features = list(features)
+    layers = tile_layers(features)
+    if not layers:
+        return []
+    bounds = shapely.total_bounds(np.concatenate([geoms for geoms, _ in layers.values()]))
+    tiles = [tile for zoom in zooms for tile in tiles_for_bounds(bounds, zoom)]
+
+    worker = partial(_raster_worker, directory)
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_raster_worker,
+                             initargs=(features, tuple(base_features), tile_size,
+                                       shared_cache)) as executor:
+        return [path for path in executor.map(worker, tiles, chunksize=16)
+                if path is not None]
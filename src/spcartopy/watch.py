@@ -0,0 +1,348 @@
+# Copyright (c) 2025 Nathan Wendt.
+# Distributed under the terms of the BSD 3-Clause License.
+# SPDX-License-Identifier: BSD-3-Clause
+"""Watch SPC for new and updated products."""
+
+import asyncio
+import contextlib
+from datetime import datetime, timedelta, timezone
+import hashlib
+import inspect
+import json
+from pathlib import Path
+from urllib.error import HTTPError, URLError
+import warnings
+
+from cartopy import config
+from cartopy.io import Downloader
+import shapely.geometry as sgeom
+
+import spcartopy.feature
+from spcartopy.io.compression import open_product
+from spcartopy.io.decode import mcd_to_geojson
+from spcartopy.io.session import default_session
+from spcartopy.io.textreader import _OUTLOOK_FTIMES
+
+
+def _now():
+    """Return the current UTC time."""
+    return datetime.now(timezone.utc)
+
+
+def _read_features(path):
+    """Read the features of a cached geoJSON product, if any."""
+    if not path.exists():
+        return []
+    with open_product(path) as fh:
+        return json.load(fh)['features']
+
+
+def outlook_diff(old, new):
+    """Compare the features of two issuances of an outlook by label.
+
+    Parameters
+    ----------
+    old, new : list of dict
+        geoJSON features of the outlooks.
+
+    Returns
+    -------
+    dict
+        Lists of the labels ``'added'``, ``'removed'`` and ``'changed'`` (same
+        label, different geometry) in ``new``.
+    """
+    def _by_label(features):
+        return {feature['properties']['LABEL']: sgeom.shape(feature['geometry'])
+                for feature in features}
+
+    old = _by_label(old)
+    new = _by_label(new)
+
+    return {
+        'added': [label for label in new if label not in old],
+        'removed': [label for label in old if label not in new],
+        'changed': [label for label in new
+                    if label in old and not old[label].equals(new[label])],
+    }
+
+
+class OutlookTarget:
+    """Latest issuance of an outlook to watch.
+
+    Parameters
+    ----------
+    fday : int
+        Outlook day.
+    hazard : str
+        Outlook hazard, e.g., ``'cat'`` or ``'torn'``.
+    product : str
+        ``'convective_outlook'`` or ``'fire_outlook'``.
+    ftimes : sequence of int, optional
+        Nominal issuance times (``ftime``) of the outlook files. Defaults to the
+        Day 1-3 convective outlook schedule; required for other outlooks.
+    lead : float
+        Seconds before a nominal time from which the issuance is looked for.
+    """
+
+    def __init__(self, fday, hazard, product='convective_outlook', ftimes=None, lead=1800):
+        if ftimes is None:
+            if product != 'convective_outlook' or fday not in _OUTLOOK_FTIMES:
+                raise ValueError(f'No default issuance times for Day {fday} {product}; '
+                                 'pass ftimes.')
+            ftimes = _OUTLOOK_FTIMES[fday]
+        self.fday = fday
+        self.hazard = hazard
+        self.product = product
+        self.ftimes = tuple(sorted(ftimes))
+        self.lead = timedelta(seconds=lead)
+
+    def _issuances(self, now):
+        """Return the nominal issuance times around ``now``, in order."""
+        issuances = []
+        for offset in (-1, 0, 1):
+            day = (now + timedelta(days=offset)).replace(hour=0, minute=0, second=0,
+                                                         microsecond=0)
+            issuances.extend(day.replace(hour=ftime // 100, minute=ftime % 100)
+                             for ftime in self.ftimes)
+
+        return issuances
+
+    def due(self, now):
+        """Return the latest issuance due at ``now`` and when the next one is due."""
+        issuances = self._issuances(now)
+        latest = max(issuance for issuance in issuances if issuance - self.lead <= now)
+        upcoming = min(issuance for issuance in issuances if issuance - self.lead > now)
+
+        return latest, upcoming - self.lead
+
+    def check(self, session, now, digests):
+        """Download the latest issuance and cache it if it is new or changed.
+
+        Returns
+        -------
+        event : dict or None
+            Change event, if any.
+        next_check : `datetime.datetime` or None
+            When the next issuance is due.
+        """
+        issuance, upcoming = self.due(now)
+        kind = 'Outlook' if self.product == 'convective_outlook' else 'Fire'
+        downloader = Downloader.from_config(('geoJSON', f'Day{self.fday}{kind}'))
+        format_dict = {'config': config, 'ftime': issuance.hour * 100 + issuance.minute,
+                       'year': issuance.year, 'month': issuance.month, 'day': issuance.day,
+                       'hazard': self.hazard, 'product': self.product}
+        url = downloader.url(format_dict)
+        body = session.get(url).read()
+
+        path = Path(downloader.target_path(format_dict))
+        digest = hashlib.sha256(body).hexdigest()
+        if url not in digests and path.exists():
+            with open_product(path) as fh:
+                digests[url] = hashlib.sha256(fh.read()).hexdigest()
+        if digests.get(url) == digest:
+            return None, upcoming
+
+        # Parse the product before caching it, so a bad body is not kept.
+        new = json.loads(body)['features']
+        old = _read_features(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open_product(path, 'wb', downloader.compression) as fh:
+            fh.write(body)
+        digests[url] = digest
+
+        key = (self.product, self.fday, format_dict['ftime'], issuance.year, issuance.month,
+               issuance.day, self.hazard)
+        spcartopy.feature.invalidate_product(key)
+
+        event = {'product': self.product, 'key': key, 'kind': 'changed' if old else 'new',
+                 'path': path, 'diff': outlook_diff(old, new)}
+        return event, upcoming
+
+
+class MDTarget:
+    """Upcoming mesoscale discussions to watch.
+
+    Parameters
+    ----------
+    number : int
+        Number of the next MD expected.
+    year : int, optional
+        Year of the MD. Defaults to the current year. Numbering restarts at 1 in
+        the new year.
+    """
+
+    product = 'md'
+
+    def __init__(self, number, year=None):
+        self.number = number
+        self.year = _now().year if year is None else year
+
+    def check(self, session, now, digests):
+        """Download the next MD and cache it once it is issued.
+
+        Returns
+        -------
+        event : dict or None
+            Event of the new MD, if issued.
+        next_check : None
+            MDs are not scheduled, so they are checked at every poll.
+
+        Raises
+        ------
+        ValueError
+            If the MD cannot be decoded. The MD is skipped, so the next check
+            looks for the following MD.
+        """
+        if now.year > self.year:
+            self.year = now.year
+            self.number = 1
+
+        downloader = Downloader.from_config(('geoJSON', 'MD'))
+        format_dict = {'config': config, 'year': self.year, 'number': self.number}
+        body = session.get(downloader.url(format_dict)).read()
+
+        try:
+            collection = mcd_to_geojson(body)
+        except (AttributeError, TypeError, ValueError) as error:
+            self.number += 1
+            raise ValueError(f'Skipping malformed MD {self.number - 1}: {error}') from error
+        path = Path(downloader.target_path(format_dict))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open_product(path, 'wb', downloader.compression) as fh:
+            fh.write(json.dumps(collection).encode('utf-8'))
+
+        key = ('md', self.year, self.number)
+        spcartopy.feature.invalidate_product(key)
+        self.number += 1
+
+        return {'product': self.product, 'key': key, 'kind': 'new', 'path': path,
+                'diff': None}, None
+
+
+class Watcher:
+    """Poll SPC for new and updated products and publish change events.
+
+    Each target is polled with the URLs of the registered downloaders. Outlooks
+    are polled from shortly before each nominal issuance time until the
+    issuance is found, then only rechecked for updates every ``recheck``
+    seconds until the next issuance is due. Products are compared by the hash
+    of their content, so unchanged products are neither written nor reparsed.
+    New and changed products are written to the local cache, where the
+    features find them, and only their entries of the feature caches are
+    invalidated.
+
+    Events are dictionaries with the ``product``, the product ``key``, the
+    ``kind`` of change (``'new'`` or ``'changed'``), the ``path`` of the cached
+    product and, for outlooks, the ``diff`` of labels (see `outlook_diff`).
+    Products that cannot be read or cached are reported with a warning and
+    polled again after ``interval`` seconds.
+
+    Parameters
+    ----------
+    targets : iterable of `OutlookTarget` or `MDTarget`
+        Products to watch.
+    interval : float
+        Seconds between polls of products that are due but not yet found.
+    recheck : float
+        Seconds between polls of products already found, for updates.
+    session : `spcartopy.io.session.HTTPSession`, optional
+        Session used for requests. Defaults to the shared session.
+    clock : callable, optional
+        Function returning the current UTC time as an aware
+        `datetime.datetime`.
+    """
+
+    def __init__(self, targets, interval=30, recheck=300, session=None, clock=_now):
+        self.targets = list(targets)
+        self.interval = interval
+        self.recheck = recheck
+        self.session = session
+        self.clock = clock
+        self._digests = {}
+        self._next_poll = {id(target): None for target in self.targets}
+        self._subscribers = []
+        self._queues = []
+
+    def subscribe(self, callback):
+        """Call a function (or coroutine function) with each event.
+
+        Returns
+        -------
+        callable
+            ``callback``, so this can be used as a decorator.
+        """
+        self._subscribers.append(callback)
+
+        return callback
+
+    def queue(self, maxsize=0):
+        """Get a new `asyncio.Queue` receiving each event."""
+        queue = asyncio.Queue(maxsize)
+        self._queues.append(queue)
+
+        return queue
+
+    async def _publish(self, event):
+        """Send an event to all subscribers and queues."""
+        for callback in self._subscribers:
+            result = callback(event)
+            if inspect.isawaitable(result):
+                await result
+        for queue in self._queues:
+            await queue.put(event)
+
+    def _check(self, target, now):
+        """Check a target, returning its event and the time of its next poll."""
+        try:
+            event, upcoming = target.check(self.session or default_session(), now,
+                                           self._digests)
+        except (HTTPError, URLError):
+            return None, now + timedelta(seconds=self.interval)
+        except (AttributeError, KeyError, OSError, TypeError, ValueError) as error:
+            # A bad product or local error must not end the watch.
+            warnings.warn(f'Checking {target.product} failed: {error}', stacklevel=2)
+            return None, now + timedelta(seconds=self.interval)
+
+        if upcoming is None:
+            # Look for the next MD right away.
+            return event, now
+
+        return event, min(now + timedelta(seconds=self.recheck), upcoming)
+
+    async def poll(self):
+        """Check all targets that are due once.
+
+        Returns
+        -------
+        list of dict
+            Published events.
+        """
+        now = self.clock()
+        due = [target for target in self.targets
+               if self._next_poll[id(target)] is None or self._next_poll[id(target)] <= now]
+        results = await asyncio.gather(*(asyncio.to_thread(self._check, target, now)
+                                         for target in due))
+
+        events = []
+        for target, (event, next_poll) in zip(due, results, strict=True):
+            self._next_poll[id(target)] = next_poll
+            if event is not None:
+                events.append(event)
+                await self._publish(event)
+
+        return events
+
+    async def run(self, stop=None):
+        """Poll the targets until ``stop`` is set.
+
+        Parameters
+        ----------
+        stop : `asyncio.Event`, optional
+            Event ending the watch. Defaults to watching until cancelled.
+        """
+        stop = asyncio.Event() if stop is None else stop
+        while not stop.is_set():
+            await self.poll()
+            wait = min(self._next_poll.values()) - self.clock()
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(stop.wait(), timeout=max(wait.total_seconds(), 0))
@@ -0,0 +1,127 @@
+# Copyright (c) 2025 Nathan Wendt.
+# Distributed under the terms of the BSD 3-Clause License.
+# SPDX-License-Identifier: BSD-3-Clause
+"""Shared fixtures for SPCartopy tests."""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+
+from cartopy import config
+from cartopy.io import Downloader
+import pytest
+
+from spcartopy.cache import SingleFlightCache
+import spcartopy.feature
+import spcartopy.stats
+
+
+def _square(lon, lat, size):
+    """Return a closed square polygon ring."""
+    return [[lon, lat], [lon + size, lat], [lon + size, lat + size],
+            [lon, lat + size], [lon, lat]]
+
+
+@pytest.fixture
+def categorical_geojson():
+    """Return a small categorical convective outlook feature collection."""
+    categories = [
+        ('TSTM', 'General Thunderstorms Risk', '#55BB55', '#C1E9C1', -105, 30, 12),
+        ('MRGL', 'Marginal Risk', '#005500', '#66A366', -102, 32, 8),
+        ('SLGT', 'Slight Risk', '#DDAA00', '#FFE066', -100, 34, 4),
+        ('ENH', 'Enhanced Risk', '#FF6600', '#FFA366', -99, 35, 2),
+    ]
+    features = []
+    for dn, (label, label2, stroke, fill, lon, lat, size) in enumerate(categories, 2):
+        features.append({
+            'type': 'Feature',
+            'properties': {
+                'DN': dn,
+                'VALID': '202004121630',
+                'EXPIRE': '202004131200',
+                'ISSUE': '202004121607',
+                'LABEL': label,
+                'LABEL2': label2,
+                'stroke': stroke,
+                'fill': fill,
+            },
+            'geometry': {
+                'type': 'MultiPolygon',
+                'coordinates': [[_square(lon, lat, size)]],
+            },
+        })
+
+    return {'type': 'FeatureCollection', 'features': features}
+
+
+@pytest.fixture
+def outlook_archive(tmp_path, monkeypatch):
+    """Return a function that places outlooks in an isolated local archive."""
+    monkeypatch.setitem(config, 'pre_existing_data_dir', str(tmp_path / 'pre'))
+    monkeypatch.setitem(config, 'data_dir', str(tmp_path / 'data'))
+    monkeypatch.setattr(spcartopy.feature, '_SPC_GEOM_CACHE', SingleFlightCache())
+    monkeypatch.setattr(spcartopy.feature, '_SPC_RECORD_CACHE', SingleFlightCache())
+    monkeypatch.setattr(spcartopy.feature, '_SPC_PATH_CACHE', SingleFlightCache())
+    monkeypatch.setattr(spcartopy.stats, '_SPC_EQUAL_AREA_CACHE', SingleFlightCache())
+    monkeypatch.setattr(spcartopy.io.shapereader, '_SPC_TABLE_CACHE', SingleFlightCache())
+
+    def _write(collection, fday, ftime, year, month, day, hazard,
+               product='convective_outlook'):
+        kind = 'Outlook' if product == 'convective_outlook' else 'Fire'
+        downloader = Downloader.from_config(('geoJSON', f'Day{fday:1d}{kind}'))
+        path = downloader.pre_downloaded_path({
+            'config': config, 'ftime': ftime, 'year': year, 'month': month, 'day': day,
+            'hazard': hazard, 'product': product,
+        })
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(collection))
+        return path
+
+    return _write
+
+
+@pytest.fixture
+def http_server():
+    """Serve queued responses from a local keep-alive HTTP server.
+
+    Returns the server, whose ``responses`` maps request paths to lists of
+    ``(status, body)`` or ``(status, body, headers)`` served in order (the last
+    one is repeated), ``requests``
+    lists the requested paths and ``connections`` the client ports used. If
+    ``drop_connections`` is set, connections are closed after each response
+    without telling the client.
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self):  # noqa: N802
+            server.requests.append(self.path)
+            server.connections.add(self.client_address[1])
+            queue = server.responses.get(self.path, [(404, b'')])
+            status, body, *headers = queue.pop(0) if len(queue) > 1 else queue[0]
+            self.send_response(status)
+            for name, value in (headers[0] if headers else {}).items():
+                self.send_header(name, value)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            self.close_connection = server.drop_connections
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.daemon_threads = True
+    server.responses = {}
+    server.requests = []
+    server.connections = set()
+    server.drop_connections = False
+    server.url = f'http://127.0.0.1:{server.server_address[1]}'
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,109 @@
+# Copyright (c) 2025 Nathan Wendt.
+# Distributed under the terms of the BSD 3-Clause License.
+# SPDX-License-Identifier: BSD-3-Clause
+"""Test thread-safe caching of parsed products."""
+
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+
+import pytest
+
+from spcartopy.cache import SingleFlightCache
+from spcartopy.feature import Day1ConvectiveOutlookFeature
+import spcartopy.io.shapereader as shapereader
+
+
+def test_single_flight():
+    """Test that concurrent requests for a key share a single computation."""
+    cache = SingleFlightCache()
+    calls = []
+    start = threading.Barrier(8)
+
+    def factory():
+        calls.append(threading.get_ident())
+        time.sleep(0.05)
+        return object()
+
+    def get(_):
+        start.wait()
+        return cache.get_or_create('key', factory)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        values = list(executor.map(get, range(8)))
+
+    assert len(calls) == 1
+    assert all(value is values[0] for value in values)
+    assert 'key' in cache
+
+
+def test_single_flight_error():
+    """Test that errors are raised and the key can be computed again."""
+    cache = SingleFlightCache()
+
+    def fail():
+        raise ValueError('parse error')
+
+    with pytest.raises(ValueError, match='parse error'):
+        cache.get_or_create('key', fail)
+
+    assert 'key' not in cache
+    assert cache.get_or_create('key', lambda: 1) == 1
+
+
+def test_threaded_feature_parsing(monkeypatch, outlook_archive, categorical_geojson):
+    """Test that an outlook requested from many threads is parsed only once."""
+    outlook_archive(categorical_geojson, 1, 1630, 2020, 4, 12, 'cat')
+    reader = shapereader.SPCReader
+    paths = []
+
+    def counting_reader(path, *args, **kwargs):
+        paths.append(path)
+        time.sleep(0.05)
+        return reader(path, *args, **kwargs)
+
+    monkeypatch.setattr(shapereader, 'SPCReader', counting_reader)
+
+    def labels(_):
+        feature = Day1ConvectiveOutlookFeature(1630, 2020, 4, 12, 'cat')
+        return [rec.attributes['LABEL'] for rec in feature.records()]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(labels, range(8)))
+
+    assert len(paths) == 1
+    assert results == [['TSTM', 'MRGL', 'SLGT', 'ENH']] * 8
+
+
+def test_invalidate():
+    """Test removing the values of matching keys only."""
+    cache = SingleFlightCache()
+    for key in [('a', 1), ('a', 2), ('b', 1)]:
+        cache[key] = key
+
+    assert cache.invalidate(lambda key: key[0] == 'a') == 2
+    assert len(cache) == 1
+    assert ('b', 1) in cache
+
+
+def test_invalidate_pending():
+    """Test that a value invalidated while being computed is not cached."""
+    cache = SingleFlightCache()
+    started = threading.Event()
+    release = threading.Event()
+
+    def stale():
+        started.set()
+        release.wait()
+        return 'stale'
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(cache.get_or_create, 'key', stale)
+        started.wait()
+        cache.invalidate(lambda key: key == 'key')
+        assert cache.get_or_create('key', lambda: 'fresh') == 'fresh'
+        release.set()
+
+        assert future.result() == 'stale'
+
+    assert cache['key'] == 'fresh'
@@ -0,0 +1,32 @@
+# Copyright (c) 2025 Nathan Wendt.
+# Distributed under the terms of the BSD 3-Clause License.
+# SPDX-License-Identifier: BSD-3-Clause
+"""Test distributing per-outlook work."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from spcartopy.distributed import map_outlooks, outlook_graph
+from spcartopy.feature import Day1ConvectiveOutlookFeature
+
+
+def _labels(feature):
+    return feature.short_labels
+
+
+def test_map_outlooks(outlook_archive, categorical_geojson):
+    """Test applying a function to outlooks built in the workers."""
+    for day in (12, 13):
+        outlook_archive(categorical_geojson, 1, 1630, 2020, 4, day, 'cat')
+    outlooks = [(1630, 2020, 4, 12, 'cat'), {'ftime': 1630, 'year': 2020, 'month': 4,
+                                            'day': 13, 'hazard': 'cat'}]
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = map_outlooks(executor, Day1ConvectiveOutlookFeature, outlooks, _labels)
+    assert results == [['TSTM', 'MRGL', 'SLGT', 'ENH']] * 2
+
+    graph, keys = outlook_graph(Day1ConvectiveOutlookFeature, outlooks, _labels,
+                                aggregate=len)
+    assert keys == ['spc-outlook']
+    assert graph['spc-outlook'] == (len, [('spc-outlook', 0), ('spc-outlook', 1)])
+    func, *args = graph[('spc-outlook', 1)]
+    assert func(*args) == ['TSTM', 'MRGL', 'SLGT', 'ENH']
@@ -0,0 +1,78 @@
+# Copyright (c) 2025 Nathan Wendt.
+# Distributed under the terms of the BSD 3-Clause License.
+# SPDX-License-Identifier: BSD-3-Clause
+"""Test SPC feature helpers."""
+
+import pickle
+
+import cartopy.crs as ccrs
+import matplotlib.colors as mcolors
+import matplotlib.pyplot as plt
+import numpy as np
+
+from spcartopy.animation import SPCAnimation
+from spcartopy.cache import SingleFlightCache
+import spcartopy.feature
+from spcartopy.feature import Day1ConvectiveOutlookFeature
+
+PROJ = ccrs.LambertConformal(
+    central_longitude=-95, central_latitude=0, standard_parallels=(33, 45)
+)
+
+
+def test_path_collection(outlook_archive, categorical_geojson):
+    """Test drawing an outlook as a single pre-styled collection."""
+    outlook_archive(categorical_geojson, 1, 1630, 2020, 4, 12, 'cat')
+    cof = Day1ConvectiveOutlookFeature(1630, 2020, 4, 12, 'cat', zorder=3)
+
+    collection = cof.path_collection(PROJ, linewidth=2)
+    again = cof.path_collection(PROJ)
+
+    assert len(collection.get_paths()) == 4
+    assert all(a is b for a, b in zip(collection.get_paths(), again.get_paths(),
+                                      strict=True))
+    np.testing.assert_allclose(collection.get_facecolor(),
+                               mcolors.to_rgba_array(cof.facecolors))
+    assert collection.get_zorder() == 3
+    assert collection.get_linewidth()[0] == 2
+
+    fig, ax = plt.subplots(subplot_kw={'projection': PROJ})
+    ax.add_collection(collection)
+    ax.set_extent((-122, -72, 22, 50))
+    fig.canvas.draw()
+    plt.close(fig)
+
+
+def test_animation(tmp_path, outlook_archive, categorical_geojson):
+    """Test looping over outlooks on a single figure."""
+    for ftime in (1300, 1630):
+        outlook_archive(categorical_geojson, 1, ftime, 2020, 4, 12, 'cat')
+
+    def frames():
+        for ftime in (1300, 1630):
+            yield Day1ConvectiveOutlookFeature(ftime, 2020, 4, 12, 'cat')
+
+    fig, ax = plt.subplots(subplot_kw={'projection': PROJ})
+    ax.set_extent((-122, -72, 22, 50))
+    anim = SPCAnimation(ax, frames(), label=lambda f: f'{f[0].ftime:04d}Z', save_count=2)
+
+    anim.save(tmp_path / 'loop.gif', writer='pillow', fps=2, dpi=50)
+
+    assert (tmp_path / 'loop.gif').stat().st_size > 0
+    assert len(ax.collections) == 1
+    assert anim._label_text.get_text() == '1630Z'
+    plt.close(fig)
+
+
+def test_pickle_feature(monkeypatch, outlook_archive, categorical_geojson):
+    """Test that outlooks pickle to their key and style and restore lazily."""
+    outlook_archive(categorical_geojson, 1, 1630, 2020, 4, 12, 'cat')
+    cof = Day1ConvectiveOutlookFeature(1630, 2020, 4, 12, 'cat', zorder=3)
+
+    restored = pickle.loads(pickle.dumps(cof))  # noqa: S301
+    assert 'facecolors' not in restored.__dict__
+
+    monkeypatch.setattr(spcartopy.feature, '_SPC_RECORD_CACHE', SingleFlightCache())
+    assert restored._key == cof._key
+    assert restored.kwargs == cof.kwargs
+    assert restored.short_labels == ['TSTM', 'MRGL', 'SLGT', 'ENH']
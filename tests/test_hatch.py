@@ -0,0 +1,26 @@
+# Copyright (c) 2025 Nathan Wendt.
+# Distributed under the terms of the BSD 3-Clause License.
+# SPDX-License-Identifier: BSD-3-Clause
+"""Test SPC hatching."""
+
+import matplotlib.hatch
+import numpy as np
+import pytest
+
+from spcartopy.hatch import SPCHatch
+
+
+@pytest.mark.parametrize('hatch, density', [('SS', 6), ('S', 4), ('SSS', 2)])
+def test_cached_hatch_vertices(hatch, density):
+    """Test that cached hatch vertices match the matplotlib implementation."""
+    spc_hatch = SPCHatch(hatch, density)
+    expected_vertices = np.empty((spc_hatch.num_vertices, 2))
+    expected_codes = np.empty(spc_hatch.num_vertices, dtype=np.uint8)
+    matplotlib.hatch.Shapes.set_vertices_and_codes(spc_hatch, expected_vertices,
+                                                   expected_codes)
+
+    path = matplotlib.hatch.get_path(hatch, density)
+
+    np.testing.assert_array_equal(path.vertices, expected_vertices)
+    np.testing.assert_array_equal(path.codes, expected_codes)
+    assert spc_hatch.num_rows in SPCHatch._vertex_cache
@@ -0,0 +1,587 @@
+# Copyright (c) 2025 Nathan Wendt.
+# Distributed under the terms of the BSD 3-Clause License.
+# SPDX-License-Identifier: BSD-3-Clause
+"""Test reading and caching SPC products."""
+
+from datetime import date, datetime, timezone
+import io
+import json
+import os
+from pathlib import Path
+import pickle
+import shutil
+from urllib.error import HTTPError
+import zipfile
+
+from cartopy import config
+from cartopy.io import Downloader, DownloadWarning
+import fiona
+import numpy as np
+import pytest
+import shapely
+
+from spcartopy.cache import SingleFlightCache
+import spcartopy.feature
+from spcartopy.feature import Day1ConvectiveOutlookFeature, MDFeature
+from spcartopy.io.availability import AvailabilityIndex, ProductUnavailableError
+from spcartopy.io.codec import decode_geometries, encode_geometries
+from spcartopy.io.compression import open_product
+from spcartopy.io.decode import decode_coords, decode_coords_array, pts_to_geojson
+from spcartopy.io.parquet import archived_products, export_geoparquet, read_geoparquet
+import spcartopy.io.segments as segments
+from spcartopy.io.session import HTTPSession
+from spcartopy.io.shapereader import (Day1OutlookDownloader, read_records, RecordFilter,
+                                      SPCReader)
+from spcartopy.io.sharedcache import SharedGeometryCache
+from spcartopy.io.textreader import cache_pts
+
+PTS_TEXT = """\x01\r\r
+WUUS01 KWNS 121239\r\r
+PTSDY1\r\r
+\r\r
+   DAY 1 CONVECTIVE OUTLOOK AREAL OUTLINE\r\r
+   NWS STORM PREDICTION CENTER NORMAN OK\r\r
+   0739 AM CDT MON APR 12 2004\r\r
+\r\r
+   VALID TIME 121300Z - 131200Z\r\r
+\r\r
+   PROBABILISTIC OUTLOOK POINTS DAY 1\r\r
+\r\r
+   ... TORNADO ...\r\r
+\r\r
+   SIGN   31009400 33009400 33009100 31009100 31009400\r\r
+   0.05   30009500 34009500 34009000 30009000 30009500\r\r
+\r\r
+   &&\r\r
+\r\r
+   ... CATEGORICAL ...\r\r
+\r\r
+   SLGT   30009800 40009800 40008800 30008800 30009800 99999999\r\r
+          33009500 33009100 37009100 37009500 33009500\r\r
+   TSTM   25000000 45000000\r\r
+\r\r
+   &&\r\r
+\x03"""
+
+
+@pytest.mark.parametrize('suffix', ['', '.gz', '.zst'])
+def test_read_compressed(tmp_path, categorical_geojson, suffix):
+    """Test that compressed geoJSONs are read transparently."""
+    if suffix == '.zst':
+        pytest.importorskip('zstandard')
+    path = tmp_path / f'outlook.geojson{suffix}'
+    with open_product(path, 'wb') as fh:
+        fh.write(json.dumps(categorical_geojson).encode('utf-8'))
+
+    records = list(SPCReader(path).records(filter_keys={'LABEL': 'TSTM'}))
+
+    assert [rec.attributes['LABEL'] for rec in records] == ['MRGL', 'SLGT', 'ENH']
+    assert records[-1].geometry.area == pytest.approx(4)
+
+
+def test_download_compressed(tmp_path, monkeypatch, categorical_geojson):
+    """Test that downloaders store compressed files."""
+    content = json.dumps(categorical_geojson).encode('utf-8')
+    downloader = Day1OutlookDownloader.default_downloader(compression='gzip')
+    monkeypatch.setattr(downloader, '_urlopen', lambda url: io.BytesIO(content))
+
+    format_dict = {'config': {'data_dir': tmp_path, 'pre_existing_data_dir': ''},
+                   'ftime': 1630, 'year': 2020, 'month': 4, 'day': 12, 'hazard': 'cat',
+                   'product': 'convective_outlook'}
+    path = downloader.path(format_dict)
+
+    assert path.name.endswith('.geojson.gz')
+    with open(path, 'rb') as fh:
+        assert fh.read(2) == b'\x1f\x8b'
+    assert len(SPCReader(path)) == 4
+
+
+def test_invalid_compression():
+    """Test that unknown compression methods are rejected."""
+    with pytest.raises(ValueError, match='Unknown compression'):
+        Day1OutlookDownloader.default_downloader(compression='rar')
+
+
+def test_geoparquet_archive(tmp_path, outlook_archive, categorical_geojson):
+    """Test incrementally exporting outlooks to GeoParquet and reading them back."""
+    pytest.importorskip('pyarrow')
+    import pyarrow.compute as pc
+
+    for day in (12, 13):
+        outlook_archive(categorical_geojson, 1, 1630, 2020, 4, day, 'cat')
+    root = tmp_path / 'archive'
+
+    first = export_geoparquet([Day1ConvectiveOutlookFeature(1630, 2020, 4, 12, 'cat')], root)
+    second = export_geoparquet([Day1ConvectiveOutlookFeature(1630, 2020, 4, day, 'cat')
+                                for day in (12, 13)], root)
+
+    assert (first, second) == (4, 4)
+    assert (root / 'year=2020' / 'product=convective_outlook').is_dir()
+
+    records = read_geoparquet(root, filters=pc.field('issue_date') == date(2020, 4, 13))
+    expected = list(Day1ConvectiveOutlookFeature(1630, 2020, 4, 13, 'cat').records())
+    assert [rec.attributes['LABEL'] for rec in records] == ['TSTM', 'MRGL', 'SLGT', 'ENH']
+    assert records[0].attributes['fill'] == expected[0].attributes['fill']
+    assert records[-1].geometry.equals(expected[-1].geometry)
+
+
+def test_record_table(tmp_path, categorical_geojson):
+    """Test the columnar record container."""
+    path = tmp_path / 'outlook.geojson'
+    path.write_text(json.dumps(categorical_geojson))
+    reader = SPCReader(path)
+
+    table = reader.record_table(filter_keys={'LABEL': 'TSTM'})
+    records = list(table)
+
+    assert len(table) == 3
+    assert table.columns['DN'].dtype == np.int64
+    assert table.columns['LABEL'][0].dtype == np.uint8
+    assert [rec.attributes for rec in records] == [
+        rec.attributes for rec in reader.records(filter_keys={'LABEL': 'TSTM'})
+    ]
+    assert table.isin('LABEL', ['SLGT', 'ENH']).tolist() == [False, True, True]
+    assert list(table.take(table.column('DN') > 4).geometries())[0].area == 4
+
+
+def test_record_filter(tmp_path, categorical_geojson):
+    """Test include, exclude, probability and bbox record filters."""
+    labels = ['0.05', '0.15', '0.30', 'SIGN']
+    for feature, label in zip(categorical_geojson['features'], labels, strict=True):
+        feature['properties']['LABEL'] = label
+    path = tmp_path / 'outlook.geojson'
+    path.write_text(json.dumps(categorical_geojson))
+    reader = SPCReader(path)
+
+    def labels(record_filter):
+        return [rec.attributes['LABEL'] for rec in reader.records(record_filter=record_filter)]
+
+    assert labels(RecordFilter(include={'LABEL': ['0.15', 'SIGN']})) == ['0.15', 'SIGN']
+    assert labels(RecordFilter(exclude={'LABEL': 'SIGN'})) == ['0.05', '0.15', '0.30']
+    assert labels(RecordFilter(min_probability=0.15)) == ['0.15', '0.30']
+    assert labels(RecordFilter(max_probability=0.1)) == ['0.05']
+    assert labels(RecordFilter(bbox=(-100.5, 34.5, -100, 35))) == ['0.05', '0.15', '0.30']
+    assert RecordFilter(include={'LABEL': 'SIGN'}) == RecordFilter(include={'LABEL': {'SIGN'}})
+
+
+def test_record_probability_missing_labels(tmp_path, categorical_geojson):
+    """Test probabilities of records when some labels are missing."""
+    labels = ['0.05', None, '0.30', 'SIGN']
+    for feature, label in zip(categorical_geojson['features'], labels, strict=True):
+        feature['properties']['LABEL'] = label
+    path = tmp_path / 'outlook.geojson'
+    path.write_text(json.dumps(categorical_geojson))
+    table = SPCReader(path).record_table()
+
+    assert table.columns['LABEL'].dtype == object
+    np.testing.assert_array_equal(table.probability(), [0.05, np.nan, 0.3, np.nan])
+    assert len(table.filter(RecordFilter(min_probability=0.1))) == 1
+
+
+def test_read_records_cached(tmp_path, monkeypatch, categorical_geojson):
+    """Test that files are parsed once for differently filtered views."""
+    import spcartopy.io.shapereader as shapereader
+
+    monkeypatch.setattr(shapereader, '_SPC_TABLE_CACHE', SingleFlightCache())
+    readers = []
+    monkeypatch.setattr(shapereader, 'SPCReader',
+                        lambda path: readers.append(path) or SPCReader(path))
+    path = tmp_path / 'outlook.geojson'
+    path.write_text(json.dumps(categorical_geojson))
+    record_filter = RecordFilter(exclude={'LABEL': 'TSTM'})
+
+    first = read_records(path, record_filter)
+
+    assert read_records(path, RecordFilter(exclude={'LABEL': 'TSTM'})) is first
+    assert len(first) == 3
+    assert len(read_records(path)) == 4
+    assert len(readers) == 1
+
+    os.utime(path, ns=(0, 0))
+    assert len(read_records(path)) == 4
+    assert len(readers) == 2
+    assert len(shapereader._SPC_TABLE_CACHE) == 1
+
+
+def test_shared_geometry_cache(tmp_path, monkeypatch, outlook_archive, categorical_geojson):
+    """Test that features read geometries from a shared segment in place of files."""
+    outlook_archive(categorical_geojson, 1, 1630, 2020, 4, 12, 'cat')
+    feature = Day1ConvectiveOutlookFeature(1630, 2020, 4, 12, 'cat')
+    expected = list(feature.records())
+
+    cache = SharedGeometryCache.build([feature], directory=tmp_path)
+    worker_cache = pickle.loads(pickle.dumps(cache))  # noqa: S301
+    shutil.rmtree(tmp_path / 'pre')
+    monkeypatch.setattr(spcartopy.feature, '_SPC_RECORD_CACHE', SingleFlightCache())
+    monkeypatch.setattr(spcartopy.feature, '_SPC_SHARED_CACHE', None)
+    worker_cache.attach()
+
+    records = list(Day1ConvectiveOutlookFeature(1630, 2020, 4, 12, 'cat').records())
+
+    assert [rec.attributes for rec in records] == [rec.attributes for rec in expected]
+    assert all(rec.geometry.equals(exp.geometry)
+               for rec, exp in zip(records, expected, strict=True))
+
+    worker_cache.close()
+    assert worker_cache.path.exists()
+    cache.close()
+    assert not cache.path.exists()
+
+
+def test_shared_geometry_cache_invalidate(tmp_path, monkeypatch, outlook_archive,
+                                          categorical_geojson):
+    """Test that reissued products are read from their file, not the shared cache."""
+    outlook_archive(categorical_geojson, 1, 1630, 2020, 4, 12, 'cat')
+    monkeypatch.setattr(spcartopy.feature, '_SPC_RECORD_CACHE', SingleFlightCache())
+    monkeypatch.setattr(spcartopy.feature, '_SPC_SHARED_CACHE', None)
+    with SharedGeometryCache.build([Day1ConvectiveOutlookFeature(1630, 2020, 4, 12, 'cat')],
+                                   directory=tmp_path) as cache:
+        cache.attach()
+        categorical_geojson['features'] = categorical_geojson['features'][:2]
+        outlook_archive(categorical_geojson, 1, 1630, 2020, 4, 12, 'cat')
+
+        spcartopy.feature.invalidate_product(('convective_outlook', 1, 1630, 2020, 4, 12,
+                                              'cat'))
+
+        assert len(list(Day1ConvectiveOutlookFeature(1630, 2020, 4, 12,
+                                                     'cat').records())) == 2
+        assert len(cache.index) == 0
+
+
+def test_segment_archive(tmp_path, monkeypatch, outlook_archive, categorical_geojson):
+    """Test packing outlooks into segments and reading them back without the files."""
+    for day in (12, 13):
+        outlook_archive(categorical_geojson, 1, 1630, 2020, 4, day, 'cat')
+    monkeypatch.setattr(segments, '_SPC_ARCHIVE', None)
+    archive = segments.use_archive(tmp_path / 'segments', segment_size=1)
+    expected = [list(Day1ConvectiveOutlookFeature(1630, 2020, 4, day, 'cat').records())
+                for day in (12, 13)]
+    shutil.rmtree(tmp_path / 'pre')
+    monkeypatch.setattr(spcartopy.feature, '_SPC_RECORD_CACHE', SingleFlightCache())
+
+    assert len(archive) == 2
+    assert len(list((tmp_path / 'segments').glob('segment-*.bin'))) == 2
+
+    archive = segments.use_archive(tmp_path / 'segments')
+    for day, records in zip((12, 13), expected, strict=True):
+        feature = Day1ConvectiveOutlookFeature(1630, 2020, 4, day, 'cat')
+        assert [rec.attributes for rec in feature.records()] == [
+            rec.attributes for rec in records
+        ]
+        assert all(geom.equals(rec.geometry)
+                   for geom, rec in zip(feature.geometries(), records, strict=True))
+
+    archive.discard(('convective_outlook', 1, 1630, 2020, 4, 12, 'cat'))
+    assert len(segments.use_archive(tmp_path / 'segments')) == 1
+    segments.use_archive(None)
+
+
+def test_segment_archive_fallback(tmp_path, monkeypatch, outlook_archive,
+                                  categorical_geojson):
+    """Test that products that cannot be archived are read from their files."""
+    categorical_geojson['features'][0]['geometry'] = {
+        'type': 'LineString', 'coordinates': [[-105, 30], [-93, 42]]
+    }
+    outlook_archive(categorical_geojson, 1, 1630, 2020, 4, 12, 'cat')
+    monkeypatch.setattr(segments, '_SPC_ARCHIVE', None)
+    archive = segments.use_archive(tmp_path / 'segments')
+
+    assert len(list(Day1ConvectiveOutlookFeature(1630, 2020, 4, 12, 'cat').records())) == 4
+    assert len(archive) == 0
+    segments.use_archive(None)
+
+
+def test_segment_archive_remap(tmp_path, categorical_geojson):
+    """Test that the map of a grown segment is replaced and closed."""
+    path = tmp_path / 'outlook.geojson'
+    path.write_text(json.dumps(categorical_geojson))
+    archive = segments.SegmentArchive(tmp_path / 'segments')
+    archive.append(('a',), read_records(path))
+    archive.record_table(('a',))
+    old = archive._mmaps[0]
+
+    archive.append(('b',), read_records(path))
+    assert len(archive.record_table(('b',))) == 4
+    assert old.closed
+    archive.close()
+
+
+def test_http_session(http_server):
+    """Test that the session retries transient errors over one kept-alive connection."""
+    http_server.responses['/outlook'] = [(503, b''), (500, b''), (200, b'{}')]
+    http_server.responses['/missing'] = [(404, b'')]
+    session = HTTPSession(backoff=0, rate=1000)
+
+    assert session.get(f'{http_server.url}/outlook').read() == b'{}'
+    assert session.get(f'{http_server.url}/outlook').read() == b'{}'
+    with pytest.raises(HTTPError):
+        session.get(f'{http_server.url}/missing')
+    session.close()
+
+    assert http_server.requests == ['/outlook'] * 4 + ['/missing']
+    assert len(http_server.connections) == 1
+
+
+def test_http_session_redirects(http_server):
+    """Test that redirects are followed and bad redirects raise HTTPError."""
+    http_server.responses['/old'] = [(301, b'moved', {'Location': '/outlook'})]
+    http_server.responses['/outlook'] = [(200, b'{}')]
+    http_server.responses['/loop'] = [(302, b'', {'Location': '/loop'})]
+    http_server.responses['/nowhere'] = [(302, b'')]
+    session = HTTPSession(retries=0)
+
+    assert session.get(f'{http_server.url}/old').read() == b'{}'
+    with pytest.raises(HTTPError):
+        session.get(f'{http_server.url}/loop')
+    with pytest.raises(HTTPError):
+        session.get(f'{http_server.url}/nowhere')
+    session.close()
+
+    assert http_server.requests.count('/loop') == 6
+    assert http_server.requests.count('/nowhere') == 1
+
+
+def test_http_session_stale_connection(http_server):
+    """Test that a kept-alive connection closed by the server is replaced, not retried."""
+    http_server.responses['/outlook'] = [(200, b'{}')]
+    http_server.drop_connections = True
+    session = HTTPSession(retries=0)
+
+    assert session.get(f'{http_server.url}/outlook').read() == b'{}'
+    assert session.get(f'{http_server.url}/outlook').read() == b'{}'
+    session.close()
+
+    assert http_server.requests == ['/outlook'] * 2
+    assert len(http_server.connections) == 2
+
+
+def test_download_with_session(tmp_path, http_server, categorical_geojson):
+    """Test that downloaders fetch products through a session."""
+    http_server.responses['/day1.geojson'] = [(502, b''),
+                                              (200, json.dumps(categorical_geojson).encode())]
+    downloader = Day1OutlookDownloader(url_template=f'{http_server.url}/day1.geojson',
+                                       target_path_template=str(tmp_path / 'day1.geojson'))
+    downloader.session = HTTPSession(backoff=0)
+
+    with pytest.warns(DownloadWarning):
+        path = downloader.path({'config': {}, 'ftime': 1630, 'year': 2020, 'month': 4,
+                                'day': 12, 'hazard': 'cat', 'product': 'convective_outlook'})
+    downloader.session.close()
+
+    assert len(SPCReader(path)) == 4
+    assert http_server.requests == ['/day1.geojson'] * 2
+
+
+def test_availability_index(tmp_path, monkeypatch, http_server):
+    """Test that missing products are only requested again once their entry expires."""
+    monkeypatch.setattr('spcartopy.io.availability._SPC_AVAILABILITY', {})
+    downloader = Day1OutlookDownloader(
+        url_template=http_server.url + '/day1_{year:4d}{month:02d}{day:02d}_{ftime:04d}',
+        target_path_template=str(tmp_path / 'day1_{year:4d}{month:02d}{day:02d}.geojson')
+    )
+    downloader.session = HTTPSession(backoff=0)
+    today = datetime.now(timezone.utc).date()
+
+    def download(day):
+        return downloader.path({'config': {'data_dir': tmp_path}, 'ftime': 2000,
+                                'year': day.year, 'month': day.month, 'day': day.day,
+                                'hazard': 'cat', 'product': 'convective_outlook'})
+
+    with pytest.warns(DownloadWarning), pytest.raises(HTTPError):
+        download(date(2020, 4, 12))
+    with pytest.raises(ProductUnavailableError):
+        download(date(2020, 4, 12))
+    assert len(http_server.requests) == 1
+
+    monkeypatch.setattr('spcartopy.io.availability._SPC_AVAILABILITY', {})
+    with pytest.raises(ProductUnavailableError):
+        download(date(2020, 4, 12))
+
+    index = AvailabilityIndex(tmp_path / 'geoJSON' / 'SPC' / 'availability.jsonl', ttl=0)
+    index.add('https://example.com/today', today)
+    assert 'https://example.com/today' not in index
+    downloader.session.close()
+
+
+def test_issuance_bundle(tmp_path, monkeypatch, http_server, categorical_geojson):
+    """Test that one bundle download serves every hazard of an issuance."""
+    monkeypatch.setattr('spcartopy.io.availability._SPC_AVAILABILITY', {})
+    schema = {'geometry': 'MultiPolygon',
+              'properties': {'DN': 'int', 'LABEL': 'str', 'LABEL2': 'str', 'stroke': 'str',
+                             'fill': 'str'}}
+    bundle = tmp_path / 'bundle.zip'
+    with zipfile.ZipFile(bundle, 'w') as zf:
+        for hazard in ('cat', 'torn'):
+            name = f'day1otlk_20200412_1630_{hazard}.shp'
+            with fiona.open(tmp_path / name, 'w', driver='ESRI Shapefile', schema=schema,
+                            crs='EPSG:4326') as dst:
+                for feature in categorical_geojson['features']:
+                    properties = {key: feature['properties'][key]
+                                  for key in schema['properties']}
+                    dst.write({'geometry': feature['geometry'], 'properties': properties})
+            for path in tmp_path.glob(f'day1otlk_20200412_1630_{hazard}.*'):
+                zf.write(path, path.name)
+    http_server.responses['/bundle.zip'] = [(200, bundle.read_bytes())]
+
+    downloader = Day1OutlookDownloader(
+        target_path_template=str(tmp_path / 'day1_{hazard}.geojson')
+    )
+    downloader.bundle_url_template = f'{http_server.url}/bundle.zip'
+    downloader.session = HTTPSession(backoff=0)
+    format_dict = {'config': {'data_dir': tmp_path}, 'ftime': 1630, 'year': 2020, 'month': 4,
+                   'day': 12, 'product': 'convective_outlook'}
+
+    with pytest.warns(DownloadWarning):
+        cat = downloader.path({**format_dict, 'hazard': 'cat'})
+    torn = downloader.path({**format_dict, 'hazard': 'torn'})
+    with pytest.warns(DownloadWarning), pytest.raises(ProductUnavailableError):
+        downloader.path({**format_dict, 'hazard': 'hail'})
+    with pytest.raises(ProductUnavailableError):
+        downloader.path({**format_dict, 'hazard': 'hail'})
+    downloader.session.close()
+
+    assert http_server.requests == ['/bundle.zip'] * 2
+    assert [rec.attributes['LABEL'] for rec in SPCReader(torn).records()] == [
+        'TSTM', 'MRGL', 'SLGT', 'ENH'
+    ]
+    assert list(SPCReader(cat).geometries())[-1].area == pytest.approx(4)
+
+
+def test_decode_coords_array():
+    """Test that vectorized coordinate decoding matches decode_coords."""
+    coords = ['32009020', '45000000', '25001250', '35009999']
+
+    np.testing.assert_allclose(decode_coords_array(coords),
+                               [decode_coords(coord) for coord in coords])
+
+
+def test_pts_to_geojson():
+    """Test decoding a PTS outlook into SPC geoJSON layers."""
+    outlook = pts_to_geojson(PTS_TEXT)
+
+    assert outlook['day'] == 1
+    assert outlook['issue'] == datetime(2004, 4, 12, 12, 39, tzinfo=timezone.utc)
+    assert outlook['expire'] == datetime(2004, 4, 13, 12, tzinfo=timezone.utc)
+    assert sorted(outlook['hazards']) == ['cat', 'sigtorn', 'torn']
+
+    tstm, slgt = outlook['hazards']['cat']['features']
+    assert tstm['properties'] == {
+        'DN': 2, 'VALID': '200404121300', 'EXPIRE': '200404131200', 'ISSUE': '200404121239',
+        'LABEL': 'TSTM', 'LABEL2': 'General Thunderstorms Risk', 'stroke': '#55BB55',
+        'fill': '#C1E9C1',
+    }
+    # An open line encloses the area to its right, here everything east of it.
+    assert shapely.geometry.shape(tstm['geometry']).bounds == (-100., 20., -60., 55.)
+    # A counter-clockwise ring is a hole.
+    assert shapely.geometry.shape(slgt['geometry']).area == 100 - 16
+
+    torn = outlook['hazards']['torn']['features']
+    assert [feature['properties']['LABEL'] for feature in torn] == ['0.05', 'SIGN']
+    assert outlook['hazards']['sigtorn']['features'] == torn[1:]
+
+
+def test_cache_pts(outlook_archive):
+    """Test that decoded PTS outlooks are read by the outlook features."""
+    paths = cache_pts(io.BytesIO(PTS_TEXT.encode('utf-8')))
+
+    assert len(paths) == 3
+    assert cache_pts(io.BytesIO(PTS_TEXT.encode('utf-8'))) == []
+    labels = [record.attributes['LABEL']
+              for record in Day1ConvectiveOutlookFeature(1300, 2004, 4, 12, 'cat').records()]
+    assert labels == ['TSTM', 'SLGT']
+    sign, = Day1ConvectiveOutlookFeature(1300, 2004, 4, 12, 'sigtorn').geometries()
+    assert sign.bounds == (-94., 31., -91., 33.)
+
+
+def test_pts_repeated_vertices():
+    """Test that repeated vertices of PTS lines are ignored."""
+    text = PTS_TEXT.replace('TSTM   25000000 45000000', 'TSTM   25000000 25000000 45000000')
+    text = text.replace('SIGN   31009400 33009400', 'SIGN   31009400 31009400 33009400')
+    outlook = pts_to_geojson(text)
+
+    tstm, _ = outlook['hazards']['cat']['features']
+    assert shapely.geometry.shape(tstm['geometry']).bounds == (-100., 20., -60., 55.)
+    sign, = outlook['hazards']['sigtorn']['features']
+    assert shapely.geometry.shape(sign['geometry']).bounds == (-94., 31., -91., 33.)
+
+
+@pytest.mark.parametrize('old, new', [
+    ('0739 AM CDT MON APR 12 2004', 'APR 12 2004'),
+    ('WUUS01 KWNS 121239', 'WUUS01 KWNS 001239'),
+    ('121300Z - 131200Z', '321300Z - 131200Z'),
+    ('121300Z - 131200Z', '121300Z'),
+])
+def test_pts_to_geojson_malformed(old, new):
+    """Test that PTS outlooks with damaged times raise ValueError."""
+    with pytest.raises(ValueError):
+        pts_to_geojson(PTS_TEXT.replace(old, new))
+
+
+def test_cache_pts_malformed(outlook_archive):
+    """Test that a malformed PTS outlook does not end caching a feed."""
+    text = PTS_TEXT.replace('131200Z', '001200Z') + PTS_TEXT
+    with pytest.warns(UserWarning, match='Skipping malformed PTS outlook'):
+        paths = cache_pts(io.BytesIO(text.encode('utf-8')))
+
+    assert len(paths) == 3
+
+
+def test_coordinate_codec():
+    """Test that SPC geometries round trip through the quantized codec."""
+    geometries = np.array([
+        shapely.Polygon([(-97.83, 35.21), (-96.5, 35.21), (-96.5, 36.07), (-97.83, 35.21)]),
+        shapely.MultiPolygon([shapely.box(-120.01, 30., -80.99, 45.55),
+                              shapely.box(-79.5, 40.25, -75., 42.)]),
+    ])
+
+    encoded = encode_geometries(geometries)
+    decoded = decode_geometries(encoded)
+
+    assert encoded['coords'].dtype == np.int16
+    assert encoded['coords'].nbytes * 4 == shapely.get_coordinates(geometries).nbytes
+    # Polygons are decoded as multipolygons when mixed with them.
+    assert all(shapely.equals(decoded, geometries))
+    np.testing.assert_allclose(shapely.get_coordinates(decoded),
+                               shapely.get_coordinates(geometries), rtol=0, atol=1e-9)
+    assert all(shapely.equals_exact(decode_geometries(encode_geometries(geometries, None)),
+                                    decoded, tolerance=0))
+
+    # Rounding this sliver collapses it.
+    sliver = shapely.Polygon([(0, 0), (1, 0), (1, 0.004), (0, 0.003)])
+    with pytest.raises(ValueError, match='invalid'):
+        encode_geometries([sliver])
+
+
+def test_quantized_segment_archive(tmp_path, monkeypatch, outlook_archive,
+                                   categorical_geojson):
+    """Test reading outlooks from an archive with quantized coordinates."""
+    outlook_archive(categorical_geojson, 1, 1630, 2020, 4, 12, 'cat')
+    monkeypatch.setattr(segments, '_SPC_ARCHIVE', None)
+    segments.use_archive(tmp_path / 'segments', quantize=True)
+    expected = list(Day1ConvectiveOutlookFeature(1630, 2020, 4, 12, 'cat').geometries())
+    monkeypatch.setattr(spcartopy.feature, '_SPC_RECORD_CACHE', SingleFlightCache())
+
+    archive = segments.use_archive(tmp_path / 'segments')
+    table = archive.record_table(('convective_outlook', 1, 1630, 2020, 4, 12, 'cat'))
+    assert all(shapely.equals_exact(table.geometry_array, expected, tolerance=1e-9))
+    segments.use_archive(None)
+
+
+def test_geoparquet_md_years(tmp_path, outlook_archive):
+    """Test that MDs with the same number in different years are both exported."""
+    pytest.importorskip('pyarrow')
+    downloader = Downloader.from_config(('geoJSON', 'MD'))
+    collection = {'type': 'FeatureCollection', 'features': [{
+        'type': 'Feature', 'properties': {'number': 1},
+        'geometry': {'type': 'Polygon',
+                     'coordinates': [[[-98, 35], [-97, 35], [-97, 36], [-98, 35]]]},
+    }]}
+    for year in (2020, 2021):
+        path = Path(downloader.target_path({'config': config, 'year': year, 'number': 1}))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(collection))
+    root = tmp_path / 'archive'
+
+    assert export_geoparquet([MDFeature(2020, 1)], root) == 1
+    assert export_geoparquet([MDFeature(2020, 1), MDFeature(2021, 1)], root) == 1
+    assert sorted(key[-1] for key in archived_products(root)) == [2020, 2021]
@@ -0,0 +1,36 @@
+# Copyright (c) 2025 Nathan Wendt.
+# Distributed under the terms of the BSD 3-Clause License.
+# SPDX-License-Identifier: BSD-3-Clause
+"""Test legend helpers."""
+
+import spcartopy.legends as spclegends
+
+
+def test_legend_handles_are_copies():
+    """Test that cached legend entries produce independent handles."""
+    handles, labels = spclegends.convective_tornado()
+    handles[0].set_hatch('//')
+
+    new_handles, new_labels = spclegends.convective_tornado()
+
+    assert labels == new_labels
+    assert labels[0] == '10% Sig.'
+    assert new_handles[0].get_hatch() == 'SS'
+    assert new_handles[0].get_facecolor()[3] == 0
+
+
+def test_compact_legend():
+    """Test limiting a legend to the categories present in an outlook."""
+    handles, labels = spclegends.convective_categorical(categories=['SLGT', 'TSTM', 'MRGL'])
+
+    assert labels == ['Slight', 'Marginal', 'Thunder']
+    assert len(handles) == 3
+
+
+def test_fire_legend_hatches():
+    """Test hatching of dry thunderstorm fire legend entries."""
+    handles, labels = spclegends.fire_categorical()
+
+    hatches = dict(zip(labels, [h.get_hatch() for h in handles], strict=True))
+    assert hatches['Isolated Dry Thunderstorm'] == 'xx'
+    assert hatches['Critical'] is None
@@ -3,17 +3,47 @@
 # SPDX-License-Identifier: BSD-3-Clause
 """Test downloading and plotting MDs."""
 
+import gzip
+import io
+
 import cartopy.crs as ccrs
 import cartopy.feature as cfeature
 import matplotlib.pyplot as plt
 import pytest
 
 from spcartopy.feature import MDFeature
+from spcartopy.io.decode import iter_md_features, iter_products
+from spcartopy.io.textreader import cache_mds
 
 PROJ = ccrs.LambertConformal(
     central_longitude=-95, central_latitude=0, standard_parallels=(33, 45)
 )
 
+MD_TEMPLATE = """\x01\r\r
+{seq:03d} \r\r
+ACUS11 KWNS 1218{minute:02d}\r\r
+SWOMCD\r\r
+SPC MCD 1218{minute:02d}\r\r
+\r\r
+Mesoscale Discussion {number:04d}\r\r
+NWS Storm Prediction Center Norman OK\r\r
+0130 PM CDT Sun Apr 12 2020\r\r
+\r\r
+Areas affected...Central Mississippi\r\r
+\r\r
+LAT...LON   32009020 33008920 33509000 32009020\r\r
+\r\r
+\x03"""
+
+OUTLOOK_TEXT = """\x01\r\r
+002 \r\r
+ACUS01 KWNS 121630\r\r
+SWODY1\r\r
+SPC AC 121630\r\r
+\r\r
+Day 1 Convective Outlook\r\r
+\x03"""
+
 
 @pytest.mark.filterwarnings('ignore:Downloading')
 @pytest.mark.mpl_image_compare(remove_text=True, tolerance=0.)
@@ -66,3 +96,78 @@ def test_md():
         ax.add_feature(md)
 
     return fig
+
+
+@pytest.fixture
+def md_feed(tmp_path):
+    """Write a gzipped feed of two MDs around a convective outlook."""
+    text = (MD_TEMPLATE.format(seq=1, minute=0, number=501) + OUTLOOK_TEXT
+            + MD_TEMPLATE.format(seq=3, minute=30, number=502))
+    path = tmp_path / 'feed.txt.gz'
+    path.write_bytes(gzip.compress(text.encode('utf-8')))
+
+    return path
+
+
+def test_iter_md_features(md_feed):
+    """Test streaming MDs out of a concatenated text feed."""
+    with gzip.open(md_feed) as fh:
+        products = list(iter_products(fh))
+    features = list(iter_md_features(md_feed))
+
+    assert [product.split(b'\r')[0] for product in products] == [
+        b'ACUS11 KWNS 121800', b'ACUS01 KWNS 121630', b'ACUS11 KWNS 121830'
+    ]
+    assert [feature['properties'] for feature in features] == [
+        {'number': 501, 'year': 2020}, {'number': 502, 'year': 2020}
+    ]
+    assert features[0]['geometry']['coordinates'][0][0] == (-90.2, 32.0)
+
+
+def test_iter_md_features_malformed(tmp_path):
+    """Test that malformed MDs are skipped without ending the feed."""
+    text = (MD_TEMPLATE.format(seq=1, minute=0, number=501).replace('0501', 'XXXX')
+            + MD_TEMPLATE.format(seq=2, minute=15, number=502).replace('33008920', '3300')
+            + MD_TEMPLATE.format(seq=3, minute=30, number=503))
+    path = tmp_path / 'feed.txt'
+    path.write_bytes(text.encode('utf-8'))
+
+    with pytest.warns(UserWarning, match='Skipping malformed MD') as record:
+        features = list(iter_md_features(path))
+
+    assert len(record) == 2
+    assert [feature['properties']['number'] for feature in features] == [503]
+
+
+def test_iter_md_features_upper_case():
+    """Test decoding all-caps MDs and taking their year from the UTC time."""
+    text = (MD_TEMPLATE.format(seq=1, minute=0, number=501).upper()
+            + MD_TEMPLATE.format(seq=2, minute=15, number=502)
+            .replace('ACUS11 KWNS 121815', 'ACUS11 KWNS 010015')
+            .replace('0130 PM CDT Sun Apr 12 2020', '0615 PM CST THU DEC 31 2020'))
+
+    features = list(iter_md_features(io.BytesIO(text.encode('utf-8'))))
+
+    assert [feature['properties'] for feature in features] == [
+        {'number': 501, 'year': 2020}, {'number': 502, 'year': 2021}
+    ]
+
+
+def test_cache_mds_without_issuance(tmp_path, outlook_archive):
+    """Test that MDs without an issuance time are skipped with a warning."""
+    text = MD_TEMPLATE.format(seq=1, minute=0, number=501).replace('0130 PM CDT', '')
+    path = tmp_path / 'feed.txt'
+    path.write_bytes(text.encode('utf-8'))
+
+    with pytest.warns(UserWarning, match='Skipping MD 501'):
+        assert cache_mds(path) == []
+
+
+def test_cache_mds(md_feed, outlook_archive):
+    """Test that decoded MDs are read by MDFeature without downloading."""
+    paths = cache_mds(md_feed)
+
+    assert len(paths) == 2
+    assert cache_mds(md_feed) == []
+    geometry, = MDFeature(2020, 502).geometries()
+    assert geometry.bounds == (-90.2, 32.0, -89.2, 33.5)
@@ -0,0 +1,79 @@
+# Copyright (c) 2025 Nathan Wendt.
+# Distributed under the terms of the BSD 3-Clause License.
+# SPDX-License-Identifier: BSD-3-Clause
+"""Test the point time-series index."""
+
+import copy
+import multiprocessing
+
+import numpy as np
+import pytest
+
+from spcartopy.feature import Day1ConvectiveOutlookFeature, Day2ConvectiveOutlookFeature
+from spcartopy.pointindex import PointIndex
+
+
+def _valid(collection, valid):
+    """Copy an outlook, changing the valid time of its records."""
+    collection = copy.deepcopy(collection)
+    for feature in collection['features']:
+        feature['properties']['VALID'] = valid
+    return collection
+
+
+@pytest.mark.skipif(multiprocessing.get_start_method() != 'fork',
+                    reason='Worker processes do not inherit the test archive')
+def test_point_index(tmp_path, outlook_archive, categorical_geojson):
+    """Test building, updating, querying and saving a point index."""
+    later = _valid(categorical_geojson, '202004131630')
+    later['features'] = [f for f in later['features'] if f['properties']['LABEL'] != 'MRGL']
+    outlook_archive(categorical_geojson, 1, 1300, 2020, 4, 12, 'cat')
+    outlook_archive(_valid(later, '202004121630'), 1, 1630, 2020, 4, 12, 'cat')
+    outlook_archive(later, 1, 1630, 2020, 4, 13, 'cat')
+
+    index = PointIndex.build(Day1ConvectiveOutlookFeature,
+                             [(1300, 2020, 4, 12, 'cat'), (1630, 2020, 4, 12, 'cat')],
+                             resolution=0.5, max_workers=2)
+    assert index.update(Day1ConvectiveOutlookFeature,
+                        [(1630, 2020, 4, 12, 'cat'), (1630, 2020, 4, 13, 'cat')],
+                        max_workers=2) == 1
+    assert len(index) == 3
+
+    # The highest category of the day is kept.
+    dates, labels = index.query(-101.2, 33.2)
+    assert dates.tolist() == np.array(['2020-04-12', '2020-04-13'],
+                                      dtype='datetime64[D]').tolist()
+    assert labels.tolist() == ['MRGL', 'TSTM']
+
+    dates, labels = index.query(-98.2, 36.2, min_label='SLGT', start='2020-04-13')
+    assert labels.tolist() == ['ENH']
+
+    path = tmp_path / 'index.npz'
+    index.save(path)
+    loaded = PointIndex.load(path)
+    assert len(loaded) == 3
+    assert loaded.query(-101.2, 33.2)[1].tolist() == ['MRGL', 'TSTM']
+
+    with pytest.raises(ValueError, match='outside'):
+        index.query(0, 0)
+
+
+@pytest.mark.skipif(multiprocessing.get_start_method() != 'fork',
+                    reason='Worker processes do not inherit the test archive')
+def test_point_index_convective_day(outlook_archive, categorical_geojson):
+    """Test that outlooks are indexed under their convective day and failures skipped."""
+    outlook_archive(_valid(categorical_geojson, '202004140100'), 1, 100, 2020, 4, 14, 'cat')
+    outlook_archive(_valid(categorical_geojson, '202004151200'), 2, 1730, 2020, 4, 14, 'cat')
+    outlook_archive(categorical_geojson, 1, 1630, 2020, 4, 16, 'cat').write_text('{')
+
+    index = PointIndex(resolution=0.5)
+    with pytest.warns(UserWarning, match='Skipped 1 outlooks'):
+        added = index.update(Day1ConvectiveOutlookFeature,
+                             [(100, 2020, 4, 14, 'cat'), (1630, 2020, 4, 16, 'cat')],
+                             max_workers=2)
+    index.update(Day2ConvectiveOutlookFeature, [(1730, 2020, 4, 14, 'cat')], max_workers=2)
+
+    assert added == 1
+    assert len(index) == 2
+    assert index.query(-98.2, 36.2)[0].tolist() == np.array(
+        ['2020-04-13', '2020-04-15'], dtype='datetime64[D]').tolist()
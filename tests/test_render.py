@@ -0,0 +1,63 @@
+# Copyright (c) 2025 Nathan Wendt.
+# Distributed under the terms of the BSD 3-Clause License.
+# SPDX-License-Identifier: BSD-3-Clause
+"""Test rendering maps with the image cache."""
+
+import copy
+import os
+
+import cartopy.crs as ccrs
+
+from spcartopy.feature import Day1ConvectiveOutlookFeature
+import spcartopy.render as render
+from spcartopy.render import ImageCache, render_key, render_map
+
+PROJ = ccrs.LambertConformal(
+    central_longitude=-95, central_latitude=0, standard_parallels=(33, 45)
+)
+
+
+def test_render_cache(tmp_path, monkeypatch, outlook_archive, categorical_geojson):
+    """Test that unchanged maps are served from the cache without rendering."""
+    path = outlook_archive(categorical_geojson, 1, 1630, 2020, 4, 12, 'cat')
+    cache = ImageCache(tmp_path / 'images')
+    options = {'extent': (-110, -85, 25, 45), 'legend': 'convective_categorical',
+               'figsize': (2, 2), 'dpi': 50}
+
+    data = render_map([Day1ConvectiveOutlookFeature(1630, 2020, 4, 12, 'cat')], PROJ,
+                      cache=cache, **options)
+    assert data.startswith(b'\x89PNG')
+    assert len(cache) == 1
+
+    def no_figure(*args, **kwargs):
+        raise AssertionError('Cached map was rendered again.')
+
+    monkeypatch.setattr(render, 'Figure', no_figure)
+    feature = Day1ConvectiveOutlookFeature(1630, 2020, 4, 12, 'cat')
+    assert render_map([feature], PROJ, cache=cache, **options) == data
+
+    # Other options or reissued products change the key.
+    key = render_key([feature], PROJ, **options)
+    assert render_key([feature], PROJ, **{**options, 'dpi': 100}) != key
+    reissued = copy.deepcopy(categorical_geojson)
+    reissued['features'] = reissued['features'][:-1]
+    stat = path.stat()
+    outlook_archive(reissued, 1, 1630, 2020, 4, 12, 'cat')
+    # The reissue is written within the same modification time tick.
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert render_key([feature], PROJ, **options) != key
+
+
+def test_image_cache_eviction(tmp_path):
+    """Test that the least recently used images are evicted."""
+    cache = ImageCache(tmp_path, max_bytes=25)
+    cache.put('aa01', b'0' * 10)
+    cache.put('bb02', b'1' * 10)
+    assert cache.get('aa01') == b'0' * 10
+
+    cache.put('cc03', b'2' * 10)
+
+    assert 'aa01' in cache
+    assert 'bb02' not in cache
+    assert 'cc03' in cache
+    assert ImageCache(tmp_path, max_bytes=25)._size == 20
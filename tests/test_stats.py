@@ -0,0 +1,93 @@
+# Copyright (c) 2025 Nathan Wendt.
+# Distributed under the terms of the BSD 3-Clause License.
+# SPDX-License-Identifier: BSD-3-Clause
+"""Test outlook statistics."""
+
+import copy
+import multiprocessing
+
+import numpy as np
+import pytest
+
+from spcartopy.feature import Day1ConvectiveOutlookFeature
+from spcartopy.stats import (category_geometries, compare_outlooks, compare_sequence,
+                             outlook_stats)
+
+
+@pytest.fixture
+def day1_sequence(outlook_archive, categorical_geojson):
+    """Write a day of Day 1 outlooks where ENH grows and MRGL is dropped."""
+    later = copy.deepcopy(categorical_geojson)
+    later['features'] = [f for f in later['features'] if f['properties']['LABEL'] != 'MRGL']
+    later['features'][-1]['geometry']['coordinates'] = [[[
+        [-99, 35], [-97, 35], [-97, 38], [-99, 38], [-99, 35]
+    ]]]
+    outlook_archive(categorical_geojson, 1, 1300, 2020, 4, 12, 'cat')
+    outlook_archive(later, 1, 1630, 2020, 4, 12, 'cat')
+    outlook_archive(later, 1, 2000, 2020, 4, 12, 'cat')
+
+    return [Day1ConvectiveOutlookFeature(ftime, 2020, 4, 12, 'cat')
+            for ftime in (1300, 1630, 2000)]
+
+
+def test_compare_outlooks(day1_sequence):
+    """Test comparing two issuances of an outlook."""
+    first, second, _ = day1_sequence
+    enh_area = category_geometries(first)['ENH'].area / 1e6
+
+    rows = {row['category']: row for row in compare_outlooks(first, second)}
+
+    assert list(rows) == ['TSTM', 'MRGL', 'SLGT', 'ENH']
+    assert rows['TSTM']['area_change'] == pytest.approx(0)
+    assert rows['MRGL']['area_after'] == 0
+    assert rows['MRGL']['area_removed'] == pytest.approx(rows['MRGL']['area_before'])
+    assert rows['ENH']['area_removed'] == pytest.approx(0, abs=1e-6)
+    assert rows['ENH']['area_after'] == pytest.approx(1.5 * enh_area, rel=0.02)
+    assert rows['ENH']['symmetric_difference'].area / 1e6 == pytest.approx(
+        rows['ENH']['area_added'])
+
+
+def test_compare_sequence(day1_sequence):
+    """Test comparing a full day of issuances."""
+    rows = compare_sequence(day1_sequence)
+
+    assert len(rows) == 4 + 3
+    assert {(row['from_ftime'], row['to_ftime']) for row in rows} == {(1300, 1630),
+                                                                      (1630, 2000)}
+    assert all(row['area_change'] == 0 for row in rows if row['from_ftime'] == 1630)
+
+
+def test_category_areas(day1_sequence):
+    """Test computing equal-area category areas."""
+    areas = day1_sequence[0].category_areas()
+
+    assert list(areas) == ['TSTM', 'MRGL', 'SLGT', 'ENH']
+    # A 2x2 degree box near 36N is roughly 222 km x 180 km
+    assert areas['ENH'] == pytest.approx(222 * 180, rel=0.05)
+
+
+def test_category_exposure(day1_sequence):
+    """Test summing a weight raster over outlook categories."""
+    lons = np.arange(-109.5, -80, 1.)
+    lats = np.arange(25.5, 45, 1.)
+    weights = np.ones((lats.size, lons.size))
+
+    exposure = day1_sequence[0].category_exposure(weights, lons, lats)
+
+    assert exposure == {'TSTM': 144, 'MRGL': 64, 'SLGT': 16, 'ENH': 4}
+
+
+@pytest.mark.skipif(multiprocessing.get_start_method() != 'fork',
+                    reason='Worker processes do not inherit the test archive')
+def test_outlook_stats(day1_sequence):
+    """Test computing statistics for many outlooks in a process pool."""
+    weights = (np.ones((20, 30)), np.arange(-109.5, -80, 1.), np.arange(25.5, 45, 1.))
+    rows = outlook_stats(Day1ConvectiveOutlookFeature,
+                         [(ftime, 2020, 4, 12, 'cat') for ftime in (1300, 1630)],
+                         weights=weights, max_workers=2)
+
+    assert [(row['ftime'], row['category']) for row in rows] == [
+        (1300, 'TSTM'), (1300, 'MRGL'), (1300, 'SLGT'), (1300, 'ENH'),
+        (1630, 'TSTM'), (1630, 'SLGT'), (1630, 'ENH'),
+    ]
+    assert rows[-1]['exposure'] == 6
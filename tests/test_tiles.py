@@ -0,0 +1,80 @@
+# Copyright (c) 2025 Nathan Wendt.
+# Distributed under the terms of the BSD 3-Clause License.
+# SPDX-License-Identifier: BSD-3-Clause
+"""Test web map tiles of SPC products."""
+
+import io
+import multiprocessing
+
+import matplotlib.pyplot as plt
+import pytest
+
+from spcartopy.feature import Day1ConvectiveOutlookFeature
+from spcartopy.tiles import (mvt_pyramid, mvt_tile, raster_pyramid, tile_bounds, tile_layers,
+                             TileRenderer, tiles_for_bounds)
+
+
+@pytest.fixture
+def day1_cat(outlook_archive, categorical_geojson):
+    """Day 1 categorical outlook from the test archive."""
+    outlook_archive(categorical_geojson, 1, 1630, 2020, 4, 12, 'cat')
+    return Day1ConvectiveOutlookFeature(1630, 2020, 4, 12, 'cat')
+
+
+def test_tile_bounds():
+    """Test the Web Mercator bounds of XYZ tiles."""
+    assert tile_bounds(0, 0, 0) == pytest.approx((-20037508.34, -20037508.34,
+                                                  20037508.34, 20037508.34))
+    assert tile_bounds(1, 1, 0) == pytest.approx((0, 0, 20037508.34, 20037508.34))
+    assert tiles_for_bounds(tile_bounds(3, 2, 5), 3) == [(3, 2, 5)]
+
+
+def test_mvt_tile(day1_cat):
+    """Test encoding a vector tile of an outlook."""
+    mapbox_vector_tile = pytest.importorskip('mapbox_vector_tile')
+    layers = tile_layers([day1_cat])
+
+    tile = mapbox_vector_tile.decode(mvt_tile(layers, 4, 3, 6))
+
+    features = tile['convective_outlook_day1_cat']['features']
+    assert [f['properties']['LABEL'] for f in features] == ['TSTM', 'MRGL', 'SLGT', 'ENH']
+    assert features[0]['properties']['fill'] == '#C1E9C1'
+    assert mvt_tile(layers, 4, 0, 0) is None
+
+
+@pytest.mark.skipif(multiprocessing.get_start_method() != 'fork',
+                    reason='Worker processes do not inherit the test archive')
+def test_mvt_pyramid(tmp_path, day1_cat):
+    """Test writing a vector tile pyramid."""
+    pytest.importorskip('mapbox_vector_tile')
+
+    paths = mvt_pyramid([day1_cat], range(4), tmp_path, max_workers=2)
+
+    tiles = {path.relative_to(tmp_path).as_posix() for path in paths}
+    assert {'0/0/0.mvt', '1/0/0.mvt', '3/1/3.mvt'} <= tiles
+    assert not any(tile.startswith('1/1/') for tile in tiles)
+    assert all(path.exists() for path in paths)
+
+
+def test_tile_renderer(day1_cat):
+    """Test rendering raster tiles with a reused figure."""
+    renderer = TileRenderer([day1_cat], tile_size=64)
+
+    png = renderer.render(4, 3, 6)
+    image = plt.imread(io.BytesIO(png))
+
+    assert image.shape == (64, 64, 4)
+    assert image[..., 3].max() == 1
+    assert renderer.render(4, 0, 0) is None
+    assert renderer.render(4, 3, 6) == png
+
+
+@pytest.mark.skipif(multiprocessing.get_start_method() != 'fork',
+                    reason='Worker processes do not inherit the test archive')
+def test_raster_pyramid(tmp_path, day1_cat):
+    """Test writing a raster tile pyramid."""
+    paths = raster_pyramid([day1_cat], range(3), tmp_path, tile_size=32, max_workers=2)
+
+    assert {path.relative_to(tmp_path).as_posix() for path in paths} == {
+        '0/0/0.png', '1/0/0.png', '2/0/1.png'
+    }
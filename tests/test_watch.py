@@ -0,0 +1,107 @@
+# Copyright (c) 2025 Nathan Wendt.
+# Distributed under the terms of the BSD 3-Clause License.
+# SPDX-License-Identifier: BSD-3-Clause
+"""Test watching SPC for new products."""
+
+import asyncio
+import copy
+from datetime import datetime, timezone
+import json
+
+from cartopy.io import Downloader
+import pytest
+
+from spcartopy.feature import Day1ConvectiveOutlookFeature
+from spcartopy.io.session import HTTPSession
+from spcartopy.watch import MDTarget, OutlookTarget, Watcher
+
+
+def test_watcher(monkeypatch, outlook_archive, http_server, categorical_geojson):
+    """Test that new and reissued outlooks are published and invalidate caches."""
+    downloader = Downloader.from_config(('geoJSON', 'Day1Outlook'))
+    monkeypatch.setattr(downloader, 'url_template',
+                        http_server.url + '/day1otlk_{year:4d}{month:02d}{day:02d}'
+                        '_{ftime:04d}_{hazard:s}.lyr.geojson')
+    updated = copy.deepcopy(categorical_geojson)
+    updated['features'] = updated['features'][:-1]
+    http_server.responses['/day1otlk_20200412_1630_cat.lyr.geojson'] = [
+        (404, b''),
+        (200, json.dumps(categorical_geojson).encode('utf-8')),
+        (200, json.dumps(categorical_geojson).encode('utf-8')),
+        (200, json.dumps(updated).encode('utf-8')),
+    ]
+
+    now = datetime(2020, 4, 12, 16, 10, tzinfo=timezone.utc)
+    session = HTTPSession(retries=0)
+    watcher = Watcher([OutlookTarget(1, 'cat')], interval=0, recheck=0, session=session,
+                      clock=lambda: now)
+    received = []
+    watcher.subscribe(received.append)
+
+    async def watch():
+        queue = watcher.queue()
+        events = [await watcher.poll() for _ in range(4)]
+        return events, queue.qsize()
+
+    events, queued = asyncio.run(watch())
+    session.close()
+
+    assert [[event['kind'] for event in poll] for poll in events] == [
+        [], ['new'], [], ['changed']
+    ]
+    assert events[1][0]['diff']['added'] == ['TSTM', 'MRGL', 'SLGT', 'ENH']
+    assert events[3][0]['diff'] == {'added': [], 'removed': ['ENH'], 'changed': []}
+    assert received == [events[1][0], events[3][0]]
+    assert queued == 2
+
+    labels = [record.attributes['LABEL']
+              for record in Day1ConvectiveOutlookFeature(1630, 2020, 4, 12, 'cat').records()]
+    assert labels == ['TSTM', 'MRGL', 'SLGT']
+
+
+def test_watcher_bad_products(monkeypatch, outlook_archive, http_server,
+                              categorical_geojson):
+    """Test that bad products are reported and polled again without ending the watch."""
+    outlook = Downloader.from_config(('geoJSON', 'Day1Outlook'))
+    monkeypatch.setattr(outlook, 'url_template',
+                        http_server.url + '/day1otlk_{year:4d}{month:02d}{day:02d}'
+                        '_{ftime:04d}_{hazard:s}.lyr.geojson')
+    md = Downloader.from_config(('geoJSON', 'MD'))
+    monkeypatch.setattr(md, 'url_template', http_server.url + '/md{number:04d}.txt')
+    http_server.responses['/day1otlk_20200412_1630_cat.lyr.geojson'] = [
+        (200, b'{"type": "FeatureCollection", "feat'),
+        (200, json.dumps(categorical_geojson).encode('utf-8')),
+    ]
+    http_server.responses['/md0501.txt'] = [(200, b'Mesoscale Discussion')]
+
+    now = datetime(2020, 4, 12, 16, 10, tzinfo=timezone.utc)
+    session = HTTPSession(retries=0)
+    target = MDTarget(501, 2020)
+    watcher = Watcher([OutlookTarget(1, 'cat'), target], interval=0, recheck=0,
+                      session=session, clock=lambda: now)
+
+    async def watch():
+        with pytest.warns(UserWarning, match='failed') as record:
+            first = await watcher.poll()
+        second = await watcher.poll()
+        return first, second, len(record)
+
+    first, second, warned = asyncio.run(watch())
+    session.close()
+
+    assert first == []
+    assert warned == 2
+    assert [event['kind'] for event in second] == ['new']
+    assert target.number == 502
+
+
+def test_outlook_target_schedule():
+    """Test that the latest issuance due includes the lead before its nominal time."""
+    target = OutlookTarget(1, 'cat')
+
+    latest, upcoming = target.due(datetime(2020, 4, 12, 0, 40, tzinfo=timezone.utc))
+    assert latest == datetime(2020, 4, 12, 1, tzinfo=timezone.utc)
+    assert upcoming == datetime(2020, 4, 12, 5, 30, tzinfo=timezone.utc)
+
+    latest, _ = target.due(datetime(2020, 4, 12, 0, 20, tzinfo=timezone.utc))
+    assert latest == datetime(2020, 4, 11, 20, tzinfo=timezone.utc)